@@ -0,0 +1,459 @@
+"""
+站点刷流（低频版）检查服务性能基准
+
+使用模拟下载器及宿主替身，在不依赖 MoviePilot 运行环境的情况下，
+分别在 1k/10k/50k 个刷流任务规模下计时 check()，并断言耗时随任务数近似线性增长
+
+用法：
+    python benchmarks/brushflowlowfreq_check.py [任务规模 ...]
+    python -m pytest -q benchmarks/brushflowlowfreq_check.py
+"""
+import gc
+import importlib.util
+import logging
+import sys
+import time
+import types
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# 插件源码路径
+PLUGIN_PATH = Path(__file__).resolve().parent.parent / "plugins.v2" / "brushflowlowfreq" / "__init__.py"
+# 默认计时的任务规模
+DEFAULT_SIZES = (1000, 10000, 50000)
+# 每个规模重复计时的次数，取最短耗时
+REPEAT = 3
+# 单任务耗时相对最小规模允许的最大倍数，超过时认为不再线性增长
+LINEAR_TOLERANCE = 3.0
+# 下载器名称
+DOWNLOADER_NAME = "qb"
+# 刷流标签
+BRUSH_TAG = "刷流"
+
+
+# region 宿主替身
+
+class _Namespace:
+    """
+    枚举替身，任意属性均返回属性名
+    """
+
+    def __getattr__(self, name: str) -> str:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return name
+
+
+class _Placeholder:
+    """
+    仅用于类型注解及实例化的占位类
+    """
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+
+class _EventManager:
+    """
+    事件管理器替身，注册装饰器原样返回函数，发送事件时仅计数
+    """
+
+    def __init__(self):
+        self.sent = 0
+
+    @staticmethod
+    def register(*args, **kwargs):
+        return lambda func: func
+
+    def send_event(self, *args, **kwargs):
+        self.sent += 1
+
+
+class _SystemMessage:
+    """
+    系统消息替身
+    """
+
+    def put(self, *args, **kwargs):
+        pass
+
+
+class _Settings:
+    """
+    系统配置替身
+    """
+    TZ = "Asia/Shanghai"
+
+    def __getattr__(self, name: str) -> Any:
+        return None
+
+
+class _StringUtils:
+    """
+    字符串工具替身，仅实现插件检查服务用到的方法
+    """
+
+    @staticmethod
+    def str_filesize(size: Any, pre: int = 2) -> str:
+        size = float(size or 0)
+        for unit in ("B", "K", "M", "G", "T"):
+            if size < 1024:
+                return f"{size:.{pre}f}{unit}"
+            size /= 1024
+        return f"{size:.{pre}f}P"
+
+    @staticmethod
+    def get_url_domain(url: str) -> str:
+        return (url or "").split("//")[-1].split("/")[0]
+
+    @staticmethod
+    def generate_random_str(length: int = 16) -> str:
+        return "x" * length
+
+
+class _PluginBase:
+    """
+    插件基类替身，插件数据保存在内存中
+    """
+    eventmanager = _EventManager()
+    systemmessage = _SystemMessage()
+    chain = None
+
+    def __init__(self):
+        self._plugin_data: Dict[str, Any] = {}
+
+    def get_data(self, key: str) -> Any:
+        return self._plugin_data.get(key)
+
+    def save_data(self, key: str, value: Any):
+        self._plugin_data[key] = value
+
+    @staticmethod
+    def get_config(plugin_id: str = None) -> Optional[dict]:
+        return None
+
+    def update_config(self, config: dict, plugin_id: str = None):
+        pass
+
+    @staticmethod
+    def get_data_path() -> Path:
+        return Path(".")
+
+    def post_message(self, *args, **kwargs):
+        pass
+
+
+def _install_module(name: str, **attrs) -> types.ModuleType:
+    """
+    注册替身模块，父模块不存在时一并注册
+    """
+    module = sys.modules.get(name)
+    if module is None:
+        module = types.ModuleType(name)
+        sys.modules[name] = module
+        if "." in name:
+            parent_name, _, child_name = name.rpartition(".")
+            setattr(_install_module(parent_name), child_name, module)
+    for key, value in attrs.items():
+        setattr(module, key, value)
+    return module
+
+
+def _is_importable(name: str) -> bool:
+    try:
+        return importlib.util.find_spec(name) is not None
+    except ImportError:
+        return False
+
+
+def _install_host_stubs():
+    """
+    注册 MoviePilot 宿主模块替身，第三方依赖仅在未安装时注册替身
+    """
+    logger = logging.getLogger("brushflowlowfreq.benchmark")
+    logger.setLevel(logging.WARNING)
+
+    _install_module("app.helper.sites", SitesHelper=_Placeholder)
+    _install_module("app.chain.torrents", TorrentsChain=_Placeholder)
+    _install_module("app.core.config", settings=_Settings())
+    _install_module("app.core.context", MediaInfo=_Placeholder)
+    _install_module("app.core.event", eventmanager=_PluginBase.eventmanager, Event=_Placeholder)
+    _install_module("app.core.metainfo", MetaInfo=_Placeholder)
+    _install_module("app.db.site_oper", SiteOper=_Placeholder)
+    _install_module("app.db.subscribe_oper", SubscribeOper=_Placeholder)
+    _install_module("app.helper.downloader", DownloaderHelper=_Placeholder)
+    _install_module("app.log", logger=logger)
+    _install_module("app.modules.qbittorrent", Qbittorrent=_Placeholder)
+    _install_module("app.modules.transmission", Transmission=_Placeholder)
+    _install_module("app.plugins", _PluginBase=_PluginBase)
+    _install_module("app.schemas", NotificationType=_Namespace(), TorrentInfo=_Placeholder,
+                    MediaType=_Namespace(), ServiceInfo=_Placeholder)
+    _install_module("app.schemas.types", EventType=_Namespace())
+    _install_module("app.utils.http", RequestUtils=_Placeholder)
+    _install_module("app.utils.string", StringUtils=_StringUtils)
+
+    if not _is_importable("pytz"):
+        _install_module("pytz", timezone=lambda name: None)
+    if not _is_importable("requests"):
+        _install_module("requests", Session=_Placeholder, Response=_Placeholder)
+        _install_module("requests.adapters", HTTPAdapter=_Placeholder)
+    if not _is_importable("apscheduler"):
+        _install_module("apscheduler.schedulers.background", BackgroundScheduler=_Placeholder)
+        _install_module("apscheduler.triggers.cron", CronTrigger=_Placeholder)
+
+
+def load_plugin_module() -> types.ModuleType:
+    """
+    注册宿主替身后按文件路径加载插件模块
+    """
+    module = sys.modules.get("brushflowlowfreq")
+    if module is not None:
+        return module
+    _install_host_stubs()
+    spec = importlib.util.spec_from_file_location("brushflowlowfreq", PLUGIN_PATH)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+# endregion
+
+
+# region 模拟下载器
+
+class FakeQbittorrentClient:
+    """
+    qbittorrentapi 客户端替身，首次同步返回全量种子，后续同步仅返回变化的种子
+    """
+
+    def __init__(self, torrents: Dict[str, dict]):
+        self.torrents = torrents
+        self.rid = 0
+        self.reannounced = 0
+        # 自上次同步后删除的种子
+        self.removed: List[str] = []
+
+    def sync_maindata(self, rid: int = 0) -> dict:
+        if not rid:
+            self.rid = 1
+            return {"rid": self.rid, "full_update": True,
+                    "torrents": {torrent_hash: dict(torrent) for torrent_hash, torrent in self.torrents.items()}}
+        self.rid = rid + 1
+        removed, self.removed = self.removed, []
+        return {"rid": self.rid, "torrents": {}, "torrents_removed": removed}
+
+    def torrents_reannounce(self, torrent_hashes: List[str] = None):
+        self.reannounced += len(torrent_hashes or [])
+
+
+class FakeQbittorrent:
+    """
+    qBittorrent 下载器替身
+    """
+
+    def __init__(self, torrents: Dict[str, dict]):
+        self.torrents = torrents
+        self.qbc = FakeQbittorrentClient(torrents=torrents)
+        self.deleted = 0
+
+    @staticmethod
+    def is_inactive() -> bool:
+        return False
+
+    def get_torrents(self, ids: Any = None, **kwargs) -> Tuple[List[dict], bool]:
+        if ids is None:
+            return [dict(torrent, hash=torrent_hash) for torrent_hash, torrent in self.torrents.items()], False
+        return [dict(self.torrents[torrent_hash], hash=torrent_hash)
+                for torrent_hash in ids if torrent_hash in self.torrents], False
+
+    def get_completed_torrents(self, ids: Any = None, **kwargs) -> List[dict]:
+        torrents, _ = self.get_torrents(ids=ids)
+        return [torrent for torrent in torrents if torrent.get("completion_on", 0) > 0]
+
+    def delete_torrents(self, ids: List[str], delete_file: bool = True) -> bool:
+        for torrent_hash in ids:
+            if self.torrents.pop(torrent_hash, None) is not None:
+                self.qbc.removed.append(torrent_hash)
+                self.deleted += 1
+        return True
+
+
+class FakeDownloaderHelper:
+    """
+    下载器帮助类替身，始终返回同一个 qBittorrent 服务
+    """
+
+    def __init__(self, downloader: FakeQbittorrent):
+        self.service = types.SimpleNamespace(name=DOWNLOADER_NAME, type="qbittorrent", instance=downloader)
+
+    def get_service(self, name: str = None, **kwargs) -> Optional[types.SimpleNamespace]:
+        return self.service if name == DOWNLOADER_NAME else None
+
+    @staticmethod
+    def is_downloader(service_type: str, service: Any = None, **kwargs) -> bool:
+        return service is not None and service.type == service_type
+
+# endregion
+
+
+def build_fixture(count: int, now: float) -> Tuple[Dict[str, dict], Dict[str, dict]]:
+    """
+    生成刷流任务及下载器种子
+
+    - 每 50 个任务中有 1 个已不在下载器中，用于覆盖丢失种子检测
+    - 每 97 个任务中有 1 个早已删除，用于覆盖自动归档
+    - 做种时间在 0~71 小时之间均匀分布，按 48 小时删种条件约 1/3 的种子会被删除
+    - 另有 1/10 数量的非刷流种子，用于覆盖标签过滤
+
+    :return: (刷流任务, 下载器种子)
+    """
+    torrent_tasks: Dict[str, dict] = {}
+    torrents: Dict[str, dict] = {}
+    size = 2 * 1024 ** 3
+    for i in range(count):
+        torrent_hash = f"{i:040x}"
+        site_name = f"site{i % 20}"
+        title = f"Benchmark.Torrent.{i}.1080p"
+        archived = i % 97 == 0
+        torrent_tasks[torrent_hash] = {
+            "site": i % 20,
+            "site_name": site_name,
+            "title": title,
+            "size": size,
+            "pubdate": None,
+            "description": None,
+            "page_url": f"https://{site_name}.example/details.php?id={i}",
+            "hit_and_run": i % 10 == 0,
+            "ratio": 0,
+            "downloaded": 0,
+            "uploaded": 0,
+            "deleted": archived,
+            "deleted_time": now - 30 * 86400 if archived else None,
+            "time": now - 72 * 3600,
+        }
+        if archived or i % 50 == 0:
+            continue
+        completion_on = int(now - (i % 72) * 3600)
+        torrents[torrent_hash] = {
+            "name": title,
+            "added_on": completion_on - 600,
+            "completion_on": completion_on,
+            "last_activity": int(now - 60),
+            "ratio": (i % 30) / 10,
+            "uploaded": size * (i % 30) // 10,
+            "downloaded": size,
+            "total_size": size,
+            "tags": BRUSH_TAG,
+            "tracker": f"https://tracker.{site_name}.example/announce",
+            "state": "stalledUP",
+        }
+    for i in range(count // 10):
+        torrents[f"{count + i:040x}"] = {
+            "name": f"Other.Torrent.{i}",
+            "added_on": int(now - 3600),
+            "completion_on": int(now - 1800),
+            "last_activity": int(now - 60),
+            "ratio": 0,
+            "uploaded": 0,
+            "downloaded": size,
+            "total_size": size,
+            "tags": "",
+            "tracker": "",
+            "state": "stalledUP",
+        }
+    return torrent_tasks, torrents
+
+
+def create_plugin(module: types.ModuleType, count: int, proxy_delete: bool) -> Any:
+    """
+    创建已注入模拟下载器及刷流任务的插件实例
+    """
+    now = time.time()
+    torrent_tasks, torrents = build_fixture(count=count, now=now)
+    config = {
+        "enabled": True,
+        "notify": False,
+        "downloader": DOWNLOADER_NAME,
+        "seed_time": 48,
+        "hr_seed_time": 60,
+        "auto_archive_days": 7,
+        "delete_except_tags": "MOVIEPILOT,H&R",
+        "proxy_delete": proxy_delete,
+        # 动态删种时做种体积设定为任务总体积的一半，确保进入按做种时间删除的环节
+        "delete_size_range": str(count) if proxy_delete else None,
+    }
+    plugin = module.BrushFlowLowFreq()
+    plugin._brush_config = module.BrushConfig(config=config)
+    plugin.downloader_helper = FakeDownloaderHelper(downloader=FakeQbittorrent(torrents=torrents))
+    plugin._rate_limiters = {}
+    plugin._qb_mirror = None
+    plugin._downloader_adapter = None
+    plugin._torrent_task_index = None
+    plugin._check_full_reconcile_time = 0
+    plugin.save_data("torrents", torrent_tasks)
+    return plugin
+
+
+def time_check(module: types.ModuleType, count: int, proxy_delete: bool, repeat: int = REPEAT) \
+        -> Tuple[float, float]:
+    """
+    计时 check()，每次重新生成数据，分别取首次检查（全量同步、删种、归档）及后续检查（增量同步）的最短耗时
+
+    :return: (首次检查耗时, 后续检查耗时)，单位秒
+    :raises AssertionError: 首次检查没有删除任何种子，说明删种环节未被覆盖
+    """
+    first_best, steady_best = float("inf"), float("inf")
+    for _ in range(repeat):
+        plugin = create_plugin(module=module, count=count, proxy_delete=proxy_delete)
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            plugin.check()
+            first = time.perf_counter() - start
+            start = time.perf_counter()
+            plugin.check()
+            steady = time.perf_counter() - start
+        finally:
+            if gc_enabled:
+                gc.enable()
+        assert plugin.downloader_helper.service.instance.deleted, f"任务数 {count} 的首次检查没有删除任何种子"
+        first_best, steady_best = min(first_best, first), min(steady_best, steady)
+    return first_best, steady_best
+
+
+def run(sizes: Tuple[int, ...] = DEFAULT_SIZES, repeat: int = REPEAT) -> List[str]:
+    """
+    在各任务规模下计时 check()，打印结果并返回不满足线性增长的说明
+    """
+    module = load_plugin_module()
+    failures = []
+    for proxy_delete in (False, True):
+        scenario = "动态删种" if proxy_delete else "条件删种"
+        timings = {count: time_check(module=module, count=count, proxy_delete=proxy_delete, repeat=repeat)
+                   for count in sizes}
+        base_count = min(sizes)
+        for phase, index in (("首次检查", 0), ("后续检查", 1)):
+            base_per_task = timings[base_count][index] / base_count
+            for count in sizes:
+                elapsed = timings[count][index]
+                per_task = elapsed / count
+                growth = per_task / base_per_task if base_per_task else 0
+                print(f"{scenario} {phase} 任务数 {count:>6}：耗时 {elapsed * 1000:9.1f} ms，"
+                      f"单任务 {per_task * 1e6:7.2f} us，相对 {base_count} 任务 {growth:4.2f} 倍")
+                if growth > LINEAR_TOLERANCE:
+                    failures.append(f"{scenario} {phase} 任务数 {count} 的单任务耗时为 {base_count} 任务的 "
+                                    f"{growth:.2f} 倍，超过 {LINEAR_TOLERANCE} 倍")
+    return failures
+
+
+def test_check_scales_linearly():
+    failures = run()
+    assert not failures, "\n".join(failures)
+
+
+if __name__ == "__main__":
+    result = run(sizes=tuple(int(arg) for arg in sys.argv[1:]) or DEFAULT_SIZES)
+    for failure in result:
+        print(failure, file=sys.stderr)
+    sys.exit(1 if result else 0)
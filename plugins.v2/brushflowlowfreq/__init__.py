@@ -1,22 +1,34 @@
 import base64
+import hashlib
 import json
+import math
+import os
 import random
 import re
 import threading
 import time
+from abc import ABC, abstractmethod
+from collections import deque, OrderedDict, defaultdict
+from contextlib import contextmanager, nullcontext
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from datetime import datetime, timedelta
-from typing import Any, List, Dict, Tuple, Optional, Union, Set
+from functools import lru_cache
+from pathlib import Path
+from http.cookiejar import DefaultCookiePolicy
+from typing import Any, List, Dict, Tuple, Optional, Union, Set, NamedTuple, Callable, Iterator
 from urllib.parse import urlparse, parse_qs, unquote, parse_qsl, urlencode, urlunparse
 
 import pytz
+import requests
+from requests.adapters import HTTPAdapter
 from app.helper.sites import SitesHelper
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 
-from app import schemas
 from app.chain.torrents import TorrentsChain
 from app.core.config import settings
 from app.core.context import MediaInfo
+from app.core.event import eventmanager, Event
 from app.core.metainfo import MetaInfo
 from app.db.site_oper import SiteOper
 from app.db.subscribe_oper import SubscribeOper
@@ -33,11 +45,67 @@ from app.utils.string import StringUtils
 lock = threading.Lock()
 
 
+class NumberRange(NamedTuple):
+    """
+    数值范围，上下限均为闭区间，None表示不限制
+    """
+    lower: Optional[float]
+    upper: Optional[float]
+    # 是否配置为区间（如5-10），否则为单个值
+    is_range: bool
+
+    def contains(self, value: float) -> bool:
+        """
+        判断数值是否在范围内
+        """
+        if self.lower is not None and value < self.lower:
+            return False
+        if self.upper is not None and value > self.upper:
+            return False
+        return True
+
+    @staticmethod
+    def parse(value: Any, unit: float = 1, single: str = "upper") -> Optional["NumberRange"]:
+        """
+        解析单个数字或数字范围（如'5', '5.5', '5-10' 或 '5.5-10.2'），格式无效时抛出ValueError
+
+        :param value: 配置值
+        :param unit: 单位换算倍数，如GB换算为字节
+        :param single: 单个值时作为下限（lower）、上限（upper）或同时作为上下限（both）
+        """
+        if value is None or value == "":
+            return None
+        value = str(value).strip()
+        if not re.match(r"^\d+(\.\d+)?(-\d+(\.\d+)?)?$", value):
+            raise ValueError(f"invalid number or range: {value}")
+        numbers = [float(n) * unit for n in value.split("-")]
+        if len(numbers) > 1:
+            return NumberRange(lower=numbers[0], upper=numbers[1], is_range=True)
+        number = numbers[0]
+        if single == "lower":
+            return NumberRange(lower=number, upper=None, is_range=False)
+        if single == "both":
+            return NumberRange(lower=number, upper=number, is_range=False)
+        return NumberRange(lower=None, upper=number, is_range=False)
+
+
 class BrushConfig:
     """
     刷流配置
     """
 
+    # 范围配置项：(单位换算倍数, 单个值的含义)
+    range_fields = {
+        # 种子大小（GB），单个值时为下限
+        "size": (1024 ** 3, "lower"),
+        # 做种人数，单个值时为上限
+        "seeder": (1, "upper"),
+        # 发布时间（分钟），单个值时为上限
+        "pubtime": (1, "upper"),
+        # 动态删种阈值（GB），单个值时同时作为上下限
+        "delete_size_range": (1024 ** 3, "both")
+    }
+
     def __init__(self, config: dict, process_site_config=True):
         self.enabled = config.get("enabled", False)
         self.notify = config.get("notify", True)
@@ -49,12 +117,18 @@ class BrushConfig:
         self.hr = config.get("hr", "no")
         self.maxupspeed = self.__parse_number(config.get("maxupspeed"))
         self.maxdlspeed = self.__parse_number(config.get("maxdlspeed"))
+        self.bandwidth_window = self.__parse_number(config.get("bandwidth_window"))
         self.maxdlcount = self.__parse_number(config.get("maxdlcount"))
         self.include = config.get("include")
         self.exclude = config.get("exclude")
+        self.include_pattern = self.compile_pattern(self.include)
+        self.exclude_pattern = self.compile_pattern(self.exclude)
         self.size = config.get("size")
         self.seeder = config.get("seeder")
         self.pubtime = config.get("pubtime")
+        self.size_range = self.parse_range("size", self.size)
+        self.seeder_range = self.parse_range("seeder", self.seeder)
+        self.pubtime_range = self.parse_range("pubtime", self.pubtime)
         self.seed_time = self.__parse_number(config.get("seed_time"))
         self.hr_seed_time = self.__parse_number(config.get("hr_seed_time"))
         self.seed_ratio = self.__parse_number(config.get("seed_ratio"))
@@ -63,6 +137,7 @@ class BrushConfig:
         self.seed_avgspeed = self.__parse_number(config.get("seed_avgspeed"))
         self.seed_inactivetime = self.__parse_number(config.get("seed_inactivetime"))
         self.delete_size_range = config.get("delete_size_range")
+        self.delete_size_limits = self.parse_range("delete_size_range", self.delete_size_range)
         self.up_speed = self.__parse_number(config.get("up_speed"))
         self.dl_speed = self.__parse_number(config.get("dl_speed"))
         self.auto_archive_days = self.__parse_number(config.get("auto_archive_days"))
@@ -71,12 +146,20 @@ class BrushConfig:
         self.delete_except_tags = config.get("delete_except_tags")
         self.except_subscribe = config.get("except_subscribe", True)
         self.brush_sequential = config.get("brush_sequential", False)
+        self.brush_strategy = config.get("brush_strategy") or "site"
+        self.adaptive_interval = config.get("adaptive_interval", False)
+        self.min_interval = self.__parse_number(config.get("min_interval"))
+        self.request_budget = self.__parse_number(config.get("request_budget"))
+        self.cycle_budget = self.__parse_number(config.get("cycle_budget"))
+        self.cycle_budget_ratios = config.get("cycle_budget_ratios")
         self.proxy_delete = config.get("proxy_delete", False)
         self.active_time_range = config.get("active_time_range")
         self.cron = config.get("cron")
         self.qb_category = config.get("qb_category")
         self.site_hr_active = config.get("site_hr_active", False)
         self.site_skip_tips = config.get("site_skip_tips", False)
+        self.rate_limit = self.__parse_number(config.get("rate_limit"))
+        self.rate_burst = self.__parse_number(config.get("rate_burst"))
 
         self.brush_tag = "刷流"
         # 站点独立配置
@@ -119,7 +202,10 @@ class BrushConfig:
             "proxy_delete",
             "qb_category",
             "site_hr_active",
-            "site_skip_tips"
+            "site_skip_tips",
+            "min_interval",
+            "rate_limit",
+            "rate_burst"
             # 当新增支持字段时，仅在此处添加字段名
         }
         try:
@@ -136,7 +222,9 @@ class BrushConfig:
                 site_specific_config = {key: config[key] for key in allowed_fields & set(config.keys())}
 
                 full_config = {key: getattr(self, key) for key in vars(self) if
-                               key not in ["group_site_configs", "site_config"]}
+                               key not in ["group_site_configs", "site_config", "include_pattern",
+                                           "exclude_pattern", "size_range", "seeder_range", "pubtime_range",
+                                           "delete_size_limits"]}
                 full_config.update(site_specific_config)
 
                 self.group_site_configs[sitename] = BrushConfig(config=full_config, process_site_config=False)
@@ -197,6 +285,23 @@ class BrushConfig:
             return self
         return self if not sitename else self.group_site_configs.get(sitename, self)
 
+    @classmethod
+    def parse_range(cls, attr: str, value: Any) -> Optional[NumberRange]:
+        """
+        按配置项解析数值范围，格式无效时抛出ValueError
+        """
+        unit, single = cls.range_fields[attr]
+        return NumberRange.parse(value, unit=unit, single=single)
+
+    @staticmethod
+    def compile_pattern(pattern: Optional[str]) -> Optional[re.Pattern]:
+        """
+        预编译包含/排除规则，忽略大小写，规则无效时抛出re.error
+        """
+        if not pattern:
+            return None
+        return re.compile(pattern, re.I)
+
     @staticmethod
     def __parse_number(value):
         if value is None or value == "":  # 更精确地检查None或空字符串
@@ -241,6 +346,1223 @@ class BrushConfig:
         return self.__str__()
 
 
+class IndexerIndex:
+    """
+    站点索引器索引，按站点ID、域名、名称建立映射，并预先计算是否为NexusPHP站点
+    """
+
+    def __init__(self, indexers: List[dict]):
+        self.indexers = indexers or []
+        self.__by_id: Dict[int, dict] = {}
+        self.__by_name: Dict[str, dict] = {}
+        self.__by_domain: Dict[str, Optional[dict]] = {}
+        self.__nexus_ids: Set[int] = set()
+        for indexer in self.indexers:
+            site_id = indexer.get("id")
+            self.__by_id[site_id] = indexer
+            if indexer.get("name"):
+                self.__by_name[indexer.get("name")] = indexer
+            if indexer.get("domain"):
+                self.__by_domain[StringUtils.get_url_domain(indexer.get("domain"))] = indexer
+            if (indexer.get("schema") or "").startswith("Nexus"):
+                self.__nexus_ids.add(site_id)
+
+    def get(self, site_id: int) -> Optional[dict]:
+        return self.__by_id.get(site_id)
+
+    def get_by_name(self, name: str) -> Optional[dict]:
+        return self.__by_name.get(name)
+
+    def get_by_domain(self, domain: str) -> Tuple[bool, Optional[dict]]:
+        """
+        按域名查找站点，返回 (是否命中索引, 站点信息)，未命中索引时需要调用方自行查找并通过 set_domain 回填
+        """
+        if domain in self.__by_domain:
+            return True, self.__by_domain[domain]
+        return False, None
+
+    def set_domain(self, domain: str, indexer: Optional[dict]):
+        """
+        回填域名查找结果，未找到站点时同样记录，避免周期内重复查找，索引每个周期重新构建，不会跨周期沿用
+        """
+        self.__by_domain[domain] = indexer
+
+    def is_nexus(self, site_id: int) -> bool:
+        return site_id in self.__nexus_ids
+
+
+class TorrentTaskIndex:
+    """
+    刷流任务去重索引，与刷流任务字典保持同步，用于O(1)判断重复种子
+    """
+
+    def __init__(self, torrent_tasks: Dict[str, dict] = None):
+        # 已纳入索引的任务Hash
+        self.hashes: Set[str] = set()
+        # (站点名称, 标题) -> 任务数
+        self.__title_keys: Dict[Tuple[str, str], int] = {}
+        # (站点名称, 详情地址) -> 任务数
+        self.__page_url_keys: Dict[Tuple[str, str], int] = {}
+        # 标题 -> {站点名称: 任务数}，仅统计尚未做种的任务
+        self.__unseeded_title_sites: Dict[str, Dict[str, int]] = {}
+        for torrent_hash, torrent_task in (torrent_tasks or {}).items():
+            self.add(torrent_hash=torrent_hash, torrent_task=torrent_task)
+
+    def is_synced(self, torrent_tasks: Dict[str, dict]) -> bool:
+        """
+        判断索引是否与刷流任务字典一致
+        """
+        return self.hashes == torrent_tasks.keys()
+
+    def add(self, torrent_hash: str, torrent_task: dict):
+        """
+        将任务加入索引
+        """
+        if not torrent_task or torrent_hash in self.hashes:
+            return
+        self.hashes.add(torrent_hash)
+        self.__adjust(torrent_task=torrent_task, delta=1)
+
+    def remove(self, torrent_hash: str, torrent_task: dict):
+        """
+        将任务从索引中移除
+        """
+        if not torrent_task or torrent_hash not in self.hashes:
+            return
+        self.hashes.discard(torrent_hash)
+        self.__adjust(torrent_task=torrent_task, delta=-1)
+
+    def contains_title(self, site_name: str, title: str) -> bool:
+        """
+        判断站点中是否存在相同标题的任务
+        """
+        return (site_name, title) in self.__title_keys
+
+    def contains_page_url(self, site_name: str, page_url: str) -> bool:
+        """
+        判断站点中是否存在相同详情地址的任务
+        """
+        return (site_name, page_url) in self.__page_url_keys
+
+    def has_unseeded_in_other_sites(self, site_name: str, title: str) -> bool:
+        """
+        判断其他站点中是否存在尚未做种的相同标题任务
+        """
+        sites = self.__unseeded_title_sites.get(title)
+        if not sites:
+            return False
+        return len(sites) > 1 or site_name not in sites
+
+    def __adjust(self, torrent_task: dict, delta: int):
+        site_name = torrent_task.get("site_name")
+        title = torrent_task.get("title")
+        self.__adjust_count(self.__title_keys, (site_name, title), delta)
+        self.__adjust_count(self.__page_url_keys, (site_name, torrent_task.get("page_url")), delta)
+        if not torrent_task.get("seed_time"):
+            sites = self.__unseeded_title_sites.setdefault(title, {})
+            self.__adjust_count(sites, site_name, delta)
+            if not sites:
+                del self.__unseeded_title_sites[title]
+
+    @staticmethod
+    def __adjust_count(counter: dict, key: Any, delta: int):
+        count = counter.get(key, 0) + delta
+        if count > 0:
+            counter[key] = count
+        else:
+            counter.pop(key, None)
+
+
+class KeywordMatcher:
+    """
+    基于Aho-Corasick自动机的多关键字匹配，构建一次后单次线性扫描即可判断文本是否包含任一关键字
+    """
+
+    def __init__(self, keywords: Set[str]):
+        self.keywords = self.normalize(keywords)
+        # 状态转移表，每个状态为 字符 -> 下一状态
+        self.__goto: List[Dict[str, int]] = [{}]
+        # 失败指针
+        self.__fail: List[int] = [0]
+        # 状态命中的关键字（取最长的一个即可）
+        self.__output: List[Optional[str]] = [None]
+        for keyword in self.keywords:
+            self.__add(keyword)
+        self.__build()
+
+    @staticmethod
+    def normalize(keywords: Set[str]) -> frozenset:
+        """
+        过滤空关键字，用于构建自动机及判断关键字集合是否变化
+        """
+        return frozenset(keyword for keyword in keywords or [] if keyword)
+
+    def __add(self, keyword: str):
+        state = 0
+        for char in keyword:
+            next_state = self.__goto[state].get(char)
+            if next_state is None:
+                next_state = len(self.__goto)
+                self.__goto[state][char] = next_state
+                self.__goto.append({})
+                self.__fail.append(0)
+                self.__output.append(None)
+            state = next_state
+        self.__output[state] = keyword
+
+    def __build(self):
+        queue = deque(self.__goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self.__goto[state].items():
+                queue.append(next_state)
+                fail_state = self.__fail[state]
+                while fail_state and char not in self.__goto[fail_state]:
+                    fail_state = self.__fail[fail_state]
+                self.__fail[next_state] = self.__goto[fail_state].get(char, 0)
+                # 继承失败指针上的命中结果，保证后缀关键字同样可以被匹配
+                if self.__output[next_state] is None:
+                    self.__output[next_state] = self.__output[self.__fail[next_state]]
+
+    def search(self, text: str) -> Optional[str]:
+        """
+        返回文本中命中的第一个关键字，没有命中时返回None
+        """
+        if not text or not self.keywords:
+            return None
+        goto, fail, output = self.__goto, self.__fail, self.__output
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state] is not None:
+                return output[state]
+        return None
+
+
+class SiteBrowseState:
+    """
+    站点增量浏览状态，记录站点已处理完毕的种子发布时间（高水位）、因稳定原因被排除的种子集合（带过期时间）
+    以及用于自适应刷流间隔的新种子到达速率
+    """
+
+    def __init__(self, data: dict = None, ttl: float = 86400, capacity: int = 2000):
+        """
+        :param data: 持久化的站点浏览状态
+        :param ttl: 已排除种子的过期时间（秒）
+        :param capacity: 已排除种子的最大记录数
+        """
+        data = data or {}
+        self.ttl = ttl
+        self.capacity = capacity
+        # 高水位，发布时间不晚于该时间的种子均已处理完毕（已排除或已添加），后续周期仅重新评估信息发生变化的已排除种子
+        self.watermark: Optional[str] = data.get("watermark")
+        # 影响稳定条件的站点配置指纹，配置变更后已排除种子需要重新评估
+        self.config_fingerprint: Optional[str] = data.get("config_fingerprint")
+        # 种子Key -> [种子指纹, 排除时间]
+        self.rejected: Dict[str, list] = data.get("rejected") or {}
+        # 计算到达速率使用的最新发布时间，与高水位分开记录，避免站点中途停止刷流时重复计数
+        self.arrival_pubdate: Optional[str] = data.get("arrival_pubdate")
+        # 新种子到达速率（个/分钟），None表示尚未采样
+        self.arrival_rate: Optional[float] = data.get("arrival_rate")
+        # 上次成功采样到达速率的时间
+        self.arrival_time: Optional[float] = data.get("arrival_time")
+        # 上次请求站点的时间
+        self.request_time: Optional[float] = data.get("request_time")
+        # 当前刷流间隔（分钟）
+        self.interval: Optional[float] = data.get("interval")
+        # 本周期完整评估过的种子，用于推进高水位，不持久化
+        self.__pass_torrents: Optional[List[TorrentInfo]] = None
+
+    def reset_if_config_changed(self, config_fingerprint: str):
+        """
+        站点配置变更时清空已排除种子及高水位
+        """
+        if self.config_fingerprint != config_fingerprint:
+            self.rejected = {}
+            self.watermark = None
+            self.config_fingerprint = config_fingerprint
+
+    def is_below_watermark(self, torrent: TorrentInfo) -> bool:
+        """
+        判断种子是否不晚于高水位，即之前的周期已处理完毕
+        """
+        return bool(self.watermark and torrent.pubdate and torrent.pubdate <= self.watermark)
+
+    def is_settled_below_watermark(self, torrent: TorrentInfo) -> bool:
+        """
+        判断种子是否不晚于高水位且无需重新评估，已因稳定原因排除的种子信息发生变化（如促销、H&R变更）时需要重新评估
+        """
+        if not self.is_below_watermark(torrent):
+            return False
+        record = self.rejected.get(self.__get_key(torrent))
+        if not record:
+            return True
+        if record[0] != self.__get_fingerprint(torrent):
+            return False
+        # 刷新排除时间，避免仍在站点列表中的已排除种子过期被清理后，信息变化时无法识别
+        record[1] = time.time()
+        return True
+
+    def is_rejected(self, torrent: TorrentInfo) -> bool:
+        """
+        判断种子是否已因稳定原因被排除，且种子信息没有发生变化
+        """
+        record = self.rejected.get(self.__get_key(torrent))
+        if not record:
+            return False
+        fingerprint, rejected_time = record
+        if time.time() - rejected_time > self.ttl:
+            return False
+        return fingerprint == self.__get_fingerprint(torrent)
+
+    def reject(self, torrent: TorrentInfo):
+        """
+        记录因稳定原因被排除的种子
+        """
+        self.rejected[self.__get_key(torrent)] = [self.__get_fingerprint(torrent), time.time()]
+
+    def count_above_watermark(self, torrents: List[TorrentInfo]) -> int:
+        """
+        获取晚于高水位的种子数
+        """
+        return sum(1 for torrent in torrents if torrent.pubdate and not self.is_below_watermark(torrent))
+
+    def complete_pass(self, torrents: List[TorrentInfo]):
+        """
+        记录本周期已完整评估的种子，站点评估中途结束时不调用，高水位不会推进
+        """
+        self.__pass_torrents = torrents
+
+    def advance_watermark(self, is_settled: Callable[[TorrentInfo], bool]) -> bool:
+        """
+        从最早发布的种子开始，将高水位推进到连续处理完毕的最晚发布时间，遇到尚未处理完毕的种子时停止，
+        同一发布时间的种子需要全部处理完毕
+
+        :param is_settled: 判断种子是否已处理完毕（已排除或已添加）
+        :return: 高水位是否推进
+        """
+        torrents, self.__pass_torrents = self.__pass_torrents, None
+        if not torrents:
+            return False
+        dated_torrents = sorted((torrent for torrent in torrents if torrent.pubdate), key=lambda x: x.pubdate)
+        watermark = None
+        index = 0
+        while index < len(dated_torrents):
+            pubdate = dated_torrents[index].pubdate
+            end = index
+            while end < len(dated_torrents) and dated_torrents[end].pubdate == pubdate:
+                end += 1
+            if not all(self.is_below_watermark(torrent) or is_settled(torrent)
+                       for torrent in dated_torrents[index:end]):
+                break
+            watermark = pubdate
+            index = end
+        if watermark and (not self.watermark or watermark > self.watermark):
+            self.watermark = watermark
+            return True
+        return False
+
+    def record_arrivals(self, torrents: Optional[List[TorrentInfo]], alpha: float = 0.5) -> int:
+        """
+        根据本次获取的种子更新新种子到达速率（指数加权平均），返回新种子数
+        """
+        now = time.time()
+        self.request_time = now
+        pubdates = [torrent.pubdate for torrent in torrents or [] if torrent.pubdate]
+        # 获取失败或没有发布时间时不更新采样，避免低估到达速率
+        if not pubdates:
+            return 0
+        new_count = len(pubdates) if not self.arrival_pubdate else \
+            sum(1 for pubdate in pubdates if pubdate > self.arrival_pubdate)
+        # 首次采样没有基准，仅记录发布时间
+        if self.arrival_pubdate and self.arrival_time:
+            elapsed = max((now - self.arrival_time) / 60, 1)
+            rate = new_count / elapsed
+            self.arrival_rate = rate if self.arrival_rate is None else \
+                alpha * rate + (1 - alpha) * self.arrival_rate
+        self.arrival_pubdate = max(pubdates + [self.arrival_pubdate or ""])
+        self.arrival_time = now
+        return new_count
+
+    def is_due(self, tolerance: float = 0) -> bool:
+        """
+        判断是否已到达站点的刷流间隔
+
+        :param tolerance: 允许提前的时间（秒），避免因定时检查与刷流间隔不对齐而多等待一个检查周期
+        """
+        if not self.request_time or not self.interval:
+            return True
+        return time.time() + tolerance >= self.request_time + self.interval * 60
+
+    def to_dict(self) -> dict:
+        """
+        清理过期及超出容量的记录后转换为可持久化的数据
+        """
+        # 以上次成功获取站点种子的时间为基准清理，站点暂停浏览（如熔断、未到刷流间隔）期间不清理，
+        # 避免仍在站点列表中、不晚于高水位的已排除种子记录被清理后，信息变化时无法识别
+        expire_time = (self.arrival_time or time.time()) - self.ttl
+        rejected = sorted(((key, record) for key, record in self.rejected.items() if record[1] >= expire_time),
+                          key=lambda item: item[1][1], reverse=True)[:self.capacity]
+        self.rejected = dict(rejected)
+        return {
+            "watermark": self.watermark,
+            "config_fingerprint": self.config_fingerprint,
+            "rejected": self.rejected,
+            "arrival_pubdate": self.arrival_pubdate,
+            "arrival_rate": self.arrival_rate,
+            "arrival_time": self.arrival_time,
+            "request_time": self.request_time,
+            "interval": self.interval
+        }
+
+    @staticmethod
+    def __get_key(torrent: TorrentInfo) -> str:
+        return torrent.page_url or f"{torrent.title}|{torrent.description}"
+
+    @staticmethod
+    def __get_fingerprint(torrent: TorrentInfo) -> str:
+        """
+        种子稳定条件相关字段的指纹，促销、H&R、大小、标题等发生变化时需要重新评估
+        """
+        return hashlib.md5(f"{torrent.title}|{torrent.description}|{torrent.size}|{torrent.downloadvolumefactor}|"
+                           f"{torrent.uploadvolumefactor}|{torrent.hit_and_run}".encode("utf-8")).hexdigest()
+
+
+class SiteCircuitBreaker:
+    """
+    站点熔断器，连续失败达到阈值后熔断，熔断期间跳过站点请求，冷却结束后进入半开状态，仅允许一个试探请求，
+    试探成功恢复，试探失败按指数退避延长冷却时间
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, data: dict = None, threshold: int = 3, base_cooldown: float = 600,
+                 max_cooldown: float = 6 * 3600, probe_timeout: float = 600):
+        """
+        :param data: 持久化的熔断器状态
+        :param threshold: 触发熔断的连续失败次数
+        :param base_cooldown: 初始冷却时间（秒）
+        :param max_cooldown: 最大冷却时间（秒）
+        :param probe_timeout: 试探请求的超时时间（秒），试探未记录结果（如被限流或推迟）时超时后允许再次试探
+        """
+        data = data or {}
+        self.threshold = threshold
+        self.base_cooldown = base_cooldown
+        self.max_cooldown = max_cooldown
+        self.probe_timeout = probe_timeout
+        self.site_name: Optional[str] = data.get("site_name")
+        self.state: str = data.get("state") or self.CLOSED
+        self.failures: int = data.get("failures") or 0
+        self.cooldown: float = data.get("cooldown") or 0
+        self.open_until: float = data.get("open_until") or 0
+        self.last_error: Optional[str] = data.get("last_error")
+        self.last_failure_time: Optional[float] = data.get("last_failure_time")
+        # 半开状态下试探请求的开始时间，试探成功或失败后清除，不持久化
+        self.__probe_time: Optional[float] = None
+        self.__lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """
+        判断是否允许请求站点，熔断冷却结束后进入半开状态，试探结果返回前仅允许一个试探请求
+        """
+        with self.__lock:
+            now = time.time()
+            if self.state == self.OPEN:
+                if now < self.open_until:
+                    return False
+                self.state = self.HALF_OPEN
+                self.__probe_time = None
+            if self.state == self.HALF_OPEN:
+                if self.__probe_time and now - self.__probe_time < self.probe_timeout:
+                    return False
+                self.__probe_time = now
+            return True
+
+    def record_success(self):
+        """
+        记录请求成功，恢复为关闭状态
+        """
+        with self.__lock:
+            self.__probe_time = None
+            self.state = self.CLOSED
+            self.failures = 0
+            self.cooldown = 0
+            self.open_until = 0
+
+    def record_failure(self, error: str) -> bool:
+        """
+        记录请求失败，返回本次失败是否触发熔断
+        """
+        with self.__lock:
+            self.__probe_time = None
+            self.failures += 1
+            self.last_error = error
+            self.last_failure_time = time.time()
+            if self.state == self.HALF_OPEN:
+                # 试探失败，按指数退避延长冷却时间
+                self.cooldown = min(max(self.cooldown, self.base_cooldown) * 2, self.max_cooldown)
+            elif self.state == self.CLOSED and self.failures >= self.threshold:
+                self.cooldown = self.base_cooldown
+            else:
+                return False
+            self.state = self.OPEN
+            self.open_until = time.time() + self.cooldown
+            return True
+
+    def to_dict(self) -> dict:
+        return {
+            "site_name": self.site_name,
+            "state": self.state,
+            "failures": self.failures,
+            "cooldown": self.cooldown,
+            "open_until": self.open_until,
+            "last_error": self.last_error,
+            "last_failure_time": self.last_failure_time
+        }
+
+
+class BandwidthSampler:
+    """
+    后台带宽采样器，按固定间隔采样上传/下载带宽并写入环形缓冲区
+    """
+
+    def __init__(self, sample_func: Callable[[], Optional[Tuple[float, float]]], interval: float = 3.0,
+                 capacity: int = 20, active_func: Callable[[], bool] = None):
+        """
+        :param sample_func: 采样函数，返回 (上传带宽, 下载带宽)，单位 B/s，采样失败返回None
+        :param interval: 采样间隔（秒）
+        :param capacity: 环形缓冲区容量
+        :param active_func: 判断当前是否需要采样，返回False时后台线程跳过本次采样
+        """
+        self.__sample_func = sample_func
+        self.__active_func = active_func
+        self.__interval = interval
+        # (采样时间, 上传带宽, 下载带宽)
+        self.__samples = deque(maxlen=capacity)
+        self.__samples_lock = threading.Lock()
+        self.__stop_event = threading.Event()
+        self.__thread = None
+
+    @property
+    def running(self) -> bool:
+        return bool(self.__thread and self.__thread.is_alive())
+
+    def start(self):
+        """
+        启动采样线程
+        """
+        if self.running:
+            return
+        self.__stop_event.clear()
+        self.__thread = threading.Thread(target=self.__run, name="BrushFlowLowFreqBandwidthSampler", daemon=True)
+        self.__thread.start()
+
+    def stop(self):
+        """
+        停止采样线程
+        """
+        self.__stop_event.set()
+        if self.__thread and self.__thread is not threading.current_thread():
+            self.__thread.join(timeout=self.__interval + 1)
+        self.__thread = None
+
+    def sample(self):
+        """
+        立即采样一次
+        """
+        try:
+            speeds = self.__sample_func()
+        except Exception as e:
+            logger.debug(f"带宽采样失败，错误详情: {e}")
+            return
+        if speeds is None:
+            return
+        with self.__samples_lock:
+            self.__samples.append((time.time(), speeds[0] or 0, speeds[1] or 0))
+
+    def __recent_samples(self, window: int) -> List[Tuple[float, float, float]]:
+        """
+        获取最近window个有效采样，超过window个采样周期的数据视为过期
+        """
+        expire_time = time.time() - max(window, 1) * self.__interval * 2
+        with self.__samples_lock:
+            samples = [sample for sample in self.__samples if sample[0] >= expire_time]
+        return samples[-window:] if window > 0 else samples
+
+    def mean(self, window: int) -> Tuple[Optional[float], Optional[float]]:
+        """
+        计算最近window个采样的平均上传/下载带宽，没有有效采样时返回 (None, None)
+        """
+        samples = self.__recent_samples(window=window)
+        if not samples:
+            return None, None
+        return (sum(sample[1] for sample in samples) / len(samples),
+                sum(sample[2] for sample in samples) / len(samples))
+
+    def __run(self):
+        while not self.__stop_event.is_set():
+            if not self.__active_func or self.__active_func():
+                self.sample()
+            self.__stop_event.wait(self.__interval)
+
+
+class TokenBucket:
+    """
+    令牌桶限流器，令牌不足时等待补充而不是直接丢弃请求，预计等待超过上限时推迟请求
+    """
+
+    def __init__(self, rate: float, capacity: float, max_wait: float = 60):
+        """
+        :param rate: 每秒补充的令牌数
+        :param capacity: 令牌桶容量，即允许的突发请求数
+        :param max_wait: 单次请求的最大等待时间（秒），超过时推迟请求
+        """
+        self.rate = rate
+        self.capacity = max(capacity, 1)
+        self.max_wait = max_wait
+        self.__tokens = self.capacity
+        self.__last_time = time.monotonic()
+        self.__lock = threading.Lock()
+        self.__acquired_count = 0
+        self.__waited_count = 0
+        self.__waited_time = 0.0
+        self.__deferred_count = 0
+
+    def update(self, rate: float, capacity: float):
+        """
+        更新限流参数，保留当前令牌数
+        """
+        with self.__lock:
+            self.__refill()
+            self.rate = rate
+            self.capacity = max(capacity, 1)
+            self.__tokens = min(self.__tokens, self.capacity)
+
+    def acquire(self, stop_event: threading.Event = None) -> bool:
+        """
+        获取一个令牌，令牌不足时预留令牌并等待，预计等待时间超过上限或退出事件已设置时返回False
+
+        :param stop_event: 退出事件，设置后立即结束等待并返回False
+        """
+        if stop_event and stop_event.is_set():
+            return False
+        with self.__lock:
+            self.__refill()
+            wait_time = (1 - self.__tokens) / self.rate if self.__tokens < 1 else 0
+            if wait_time > self.max_wait:
+                self.__deferred_count += 1
+                return False
+            # 预留令牌，令牌数可以为负数，后续请求依次排队等待
+            self.__tokens -= 1
+            self.__acquired_count += 1
+            if wait_time:
+                self.__waited_count += 1
+                self.__waited_time += wait_time
+        if wait_time:
+            if stop_event:
+                if stop_event.wait(wait_time):
+                    return False
+            else:
+                time.sleep(wait_time)
+        return True
+
+    def snapshot(self) -> dict:
+        """
+        获取限流器状态
+        """
+        with self.__lock:
+            self.__refill()
+            return {
+                "rate": round(self.rate * 60, 2),
+                "capacity": self.capacity,
+                "tokens": round(self.__tokens, 2),
+                "acquired": self.__acquired_count,
+                "waited": self.__waited_count,
+                "waited_time": round(self.__waited_time, 1),
+                "deferred": self.__deferred_count
+            }
+
+    def __refill(self):
+        now = time.monotonic()
+        self.__tokens = min(self.capacity, self.__tokens + (now - self.__last_time) * self.rate)
+        self.__last_time = now
+
+
+class CycleBudget:
+    """
+    刷流周期时间预算，限制整个周期的截止时间以及各阶段的累计耗时，并统计各站点消耗的预算
+    """
+
+    PHASE_NAMES = {
+        "browse": "获取种子",
+        "evaluate": "评估种子",
+        "fetch": "下载种子文件",
+        "add": "添加下载任务"
+    }
+
+    def __init__(self, total: float, phase_ratios: Dict[str, float], min_phase_limits: Dict[str, float] = None):
+        """
+        :param total: 周期总预算（秒）
+        :param phase_ratios: 各阶段预算占总预算的比例
+        :param min_phase_limits: 各阶段预算下限（秒），总预算不足下限时同时补足总预算
+        """
+        self.phase_limits = {phase: total * ratio for phase, ratio in phase_ratios.items()}
+        for phase, min_limit in (min_phase_limits or {}).items():
+            self.phase_limits[phase] = max(self.phase_limits.get(phase, 0), min_limit)
+            total = max(total, min_limit)
+        self.total = total
+        self.start_time = time.monotonic()
+        self.deadline = self.start_time + total
+        self.phase_spent: Dict[str, float] = defaultdict(float)
+        # 站点名称 -> 阶段 -> 耗时
+        self.site_spent: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
+        self.__lock = threading.Lock()
+        # 嵌套统计时，子阶段耗时不重复计入父阶段
+        self.__stack: List[list] = []
+
+    def elapsed(self) -> float:
+        return time.monotonic() - self.start_time
+
+    def remaining(self, phase: str = None) -> float:
+        """
+        剩余预算（秒），指定阶段时同时受阶段预算限制
+        """
+        remaining = self.deadline - time.monotonic()
+        if phase in self.phase_limits:
+            remaining = min(remaining, self.phase_limits[phase] - self.phase_spent[phase])
+        return remaining
+
+    def exhausted(self, phase: str = None) -> bool:
+        return self.remaining(phase) <= 0
+
+    def add(self, seconds: float, phase: str = None, site_name: str = None):
+        """
+        记录耗时，phase为空时仅计入站点，用于并发阶段按实际经过时间单独计入阶段耗时
+        """
+        with self.__lock:
+            if phase:
+                self.phase_spent[phase] += seconds
+            if site_name:
+                self.site_spent[site_name][phase or "other"] += seconds
+
+    @contextmanager
+    def track(self, phase: str, site_name: str = None):
+        """
+        统计代码块耗时并计入阶段及站点，仅用于刷流主线程
+        """
+        frame = [time.monotonic(), 0.0]
+        self.__stack.append(frame)
+        try:
+            yield
+        finally:
+            self.__stack.pop()
+            elapsed = time.monotonic() - frame[0]
+            if self.__stack:
+                self.__stack[-1][1] += elapsed
+            self.add(seconds=elapsed - frame[1], phase=phase, site_name=site_name)
+
+    def summary(self) -> str:
+        """
+        预算消耗汇总
+        """
+        phases = "，".join(f"{self.PHASE_NAMES.get(phase, phase)} {self.phase_spent[phase]:.1f}/{limit:.0f} 秒"
+                          for phase, limit in self.phase_limits.items())
+        sites = "，".join(f"{site_name} {sum(spent.values()):.1f} 秒（{sum(spent.values()) / self.total:.1%}）"
+                         for site_name, spent in sorted(self.site_spent.items(),
+                                                        key=lambda item: sum(item[1].values()), reverse=True))
+        return (f"已用 {self.elapsed():.1f}/{self.total:.0f} 秒，各阶段：{phases}"
+                + (f"，各站点：{sites}" if sites else ""))
+
+
+class TorrentCache:
+    """
+    种子文件磁盘缓存，按站点及下载链接缓存已下载的种子内容，超过有效期的缓存失效，超过容量时按最近最少使用淘汰
+    """
+
+    def __init__(self, path: Path, max_size: int, ttl: float):
+        """
+        :param path: 缓存目录
+        :param max_size: 缓存最大容量（字节）
+        :param ttl: 缓存有效期（秒）
+        """
+        self.path = path
+        self.max_size = max_size
+        self.ttl = ttl
+        self.__lock = threading.Lock()
+        # 缓存文件名 -> 文件大小，按最近使用顺序排列
+        self.__entries: OrderedDict[str, int] = OrderedDict()
+        self.__size = 0
+        self.__load()
+
+    def get(self, site: str, url: str) -> Optional[bytes]:
+        """
+        获取缓存的种子内容，不存在或已过期时返回None
+        """
+        name = self.__get_name(site, url)
+        with self.__lock:
+            if name not in self.__entries:
+                return None
+            file_path = self.path / name
+            try:
+                if time.time() - file_path.stat().st_mtime > self.ttl:
+                    self.__remove(name)
+                    return None
+                content = file_path.read_bytes()
+            except OSError:
+                self.__remove(name)
+                return None
+            self.__entries.move_to_end(name)
+            return content
+
+    def put(self, site: str, url: str, content: bytes):
+        """
+        缓存种子内容，超过容量时淘汰最近最少使用的缓存
+        """
+        if not content or len(content) > self.max_size:
+            return
+        name = self.__get_name(site, url)
+        with self.__lock:
+            try:
+                self.path.mkdir(parents=True, exist_ok=True)
+                temp_path = self.path / f"{name}.tmp"
+                temp_path.write_bytes(content)
+                os.replace(temp_path, self.path / name)
+            except OSError as e:
+                logger.warning(f"种子文件缓存写入失败：{e}")
+                return
+            self.__size += len(content) - self.__entries.pop(name, 0)
+            self.__entries[name] = len(content)
+            while self.__size > self.max_size and self.__entries:
+                self.__remove(next(iter(self.__entries)))
+
+    def remove(self, site: str, url: str):
+        """
+        移除缓存的种子内容
+        """
+        with self.__lock:
+            self.__remove(self.__get_name(site, url))
+
+    def __remove(self, name: str):
+        if name in self.__entries:
+            self.__size -= self.__entries.pop(name)
+        try:
+            (self.path / name).unlink(missing_ok=True)
+        except OSError as e:
+            logger.debug(f"种子文件缓存删除失败：{e}")
+
+    def __load(self):
+        """
+        加载磁盘中已有的缓存，清理已过期的缓存，并按修改时间恢复使用顺序
+        """
+        if not self.path.exists():
+            return
+        entries = []
+        expire_time = time.time() - self.ttl
+        for file_path in self.path.glob("*.torrent"):
+            try:
+                stat = file_path.stat()
+                if stat.st_mtime < expire_time:
+                    file_path.unlink(missing_ok=True)
+                    continue
+                entries.append((stat.st_mtime, file_path.name, stat.st_size))
+            except OSError:
+                continue
+        for _, name, size in sorted(entries):
+            self.__entries[name] = size
+            self.__size += size
+        while self.__size > self.max_size and self.__entries:
+            self.__remove(next(iter(self.__entries)))
+
+    @staticmethod
+    def __get_name(site: str, url: str) -> str:
+        return f"{hashlib.sha1(f'{site}|{url}'.encode('utf-8')).hexdigest()}.torrent"
+
+
+class QbMaindataMirror:
+    """
+    基于qBittorrent /sync/maindata 增量同步的种子状态镜像，每次同步仅传输自上次同步后变化的种子字段
+    """
+
+    def __init__(self, full_update_interval: float = 3600):
+        """
+        :param full_update_interval: 强制全量同步的间隔（秒），用于修正可能累积的增量误差
+        """
+        self.full_update_interval = full_update_interval
+        self.rid = 0
+        self.torrents: Dict[str, dict] = {}
+        self.__full_update_time = 0
+
+    def reset(self):
+        """
+        重置镜像，下次同步时全量获取
+        """
+        self.rid = 0
+        self.torrents = {}
+
+    def sync(self, qbc: Any) -> Tuple[List[dict], int]:
+        """
+        从qBittorrent增量同步种子状态
+
+        :param qbc: qbittorrentapi客户端
+        :return: (镜像中的全部种子, 本次变化的种子数)
+        """
+        if time.time() - self.__full_update_time > self.full_update_interval:
+            self.rid = 0
+        data = qbc.sync_maindata(rid=self.rid)
+        if data.get("full_update"):
+            self.torrents = {}
+            self.__full_update_time = time.time()
+        changed_torrents: Dict[str, dict] = data.get("torrents") or {}
+        for torrent_hash, fields in changed_torrents.items():
+            torrent = self.torrents.get(torrent_hash)
+            if torrent is None:
+                # maindata中的种子以Hash为键，不包含hash字段，这里补充以便与种子列表接口保持一致
+                torrent = self.torrents[torrent_hash] = {"hash": torrent_hash}
+            torrent.update(fields)
+        for torrent_hash in data.get("torrents_removed") or []:
+            self.torrents.pop(torrent_hash, None)
+        self.rid = data.get("rid") or 0
+        return list(self.torrents.values()), len(changed_torrents)
+
+
+class TorrentSnapshot:
+    """
+    种子快照，检查周期内每个种子仅从下载器数据转换一次，后续状态更新、删种评估等环节均复用该快照
+    添加时间字符串仅在访问时格式化，兼容字典形式的 get 访问
+    """
+
+    __slots__ = ("hash", "title", "seeding_time", "ratio", "uploaded", "downloaded", "avg_upspeed", "iatime",
+                 "dltime", "total_size", "add_on", "tags", "labels", "tracker")
+
+    def __init__(self, torrent_id: str, torrent_title: str, seeding_time: int, ratio: float, uploaded: int,
+                 downloaded: int, avg_upspeed: int, iatime: int, dltime: int, total_size: int, add_on: float,
+                 tags: Any, labels: List[str], tracker: Any):
+        self.hash = torrent_id
+        self.title = torrent_title
+        self.seeding_time = seeding_time
+        self.ratio = ratio
+        self.uploaded = uploaded
+        self.downloaded = downloaded
+        self.avg_upspeed = avg_upspeed
+        self.iatime = iatime
+        self.dltime = dltime
+        self.total_size = total_size
+        self.add_on = add_on
+        self.tags = tags
+        self.labels = labels
+        self.tracker = tracker
+
+    @property
+    def add_time(self) -> str:
+        return time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(self.add_on))
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key, default)
+
+
+class DownloaderAdapter(ABC):
+    """
+    下载器适配器，按下载器类型解析一次后复用，提供种子Hash、标签及种子信息的访问方法，避免逐个种子判断下载器类型
+    """
+
+    type: str = None
+
+    @abstractmethod
+    def get_hash(self, torrent: Any) -> str:
+        """
+        获取种子Hash
+        """
+        pass
+
+    @abstractmethod
+    def get_labels(self, torrent: Any) -> List[str]:
+        """
+        获取种子标签列表
+        """
+        pass
+
+    @abstractmethod
+    def get_torrent_info(self, torrent: Any) -> TorrentSnapshot:
+        """
+        获取种子信息快照
+        """
+        pass
+
+    def _build_snapshot(self, torrent: Any, torrent_id: str, torrent_title: str, seeding_time: int, ratio: float,
+                        uploaded: int, downloaded: int, avg_upspeed: int, iatime: int, dltime: int, total_size: int,
+                        add_on: float, tags: Any, tracker: Any) -> TorrentSnapshot:
+        return TorrentSnapshot(torrent_id=torrent_id, torrent_title=torrent_title, seeding_time=seeding_time,
+                               ratio=ratio, uploaded=uploaded, downloaded=downloaded, avg_upspeed=avg_upspeed,
+                               iatime=iatime, dltime=dltime, total_size=total_size, add_on=add_on, tags=tags,
+                               labels=self.get_labels(torrent), tracker=tracker)
+
+
+class QbittorrentAdapter(DownloaderAdapter):
+    """
+    qBittorrent下载器适配器
+    """
+
+    type = "qbittorrent"
+
+    def get_hash(self, torrent: Any) -> str:
+        return torrent.get("hash")
+
+    def get_labels(self, torrent: Any) -> List[str]:
+        return [str(tag).strip() for tag in (torrent.get("tags") or "").split(',')]
+
+    def get_torrent_info(self, torrent: Any) -> TorrentSnapshot:
+        """
+        {
+          "added_on": 1693359031,
+          "amount_left": 0,
+          "auto_tmm": false,
+          "availability": -1,
+          "category": "tJU",
+          "completed": 67759229411,
+          "completion_on": 1693609350,
+          "content_path": "/mnt/sdb/qb/downloads/Steel.Division.2.Men.of.Steel-RUNE",
+          "dl_limit": -1,
+          "dlspeed": 0,
+          "download_path": "",
+          "downloaded": 67767365851,
+          "downloaded_session": 0,
+          "eta": 8640000,
+          "f_l_piece_prio": false,
+          "force_start": false,
+          "hash": "116bc6f3efa6f3b21a06ce8f1cc71875",
+          "infohash_v1": "116bc6f306c40e072bde8f1cc71875",
+          "infohash_v2": "",
+          "last_activity": 1693609350,
+          "magnet_uri": "magnet:?xt=",
+          "max_ratio": -1,
+          "max_seeding_time": -1,
+          "name": "Steel.Division.2.Men.of.Steel-RUNE",
+          "num_complete": 1,
+          "num_incomplete": 0,
+          "num_leechs": 0,
+          "num_seeds": 0,
+          "priority": 0,
+          "progress": 1,
+          "ratio": 0,
+          "ratio_limit": -2,
+          "save_path": "/mnt/sdb/qb/downloads",
+          "seeding_time": 615035,
+          "seeding_time_limit": -2,
+          "seen_complete": 1693609350,
+          "seq_dl": false,
+          "size": 67759229411,
+          "state": "stalledUP",
+          "super_seeding": false,
+          "tags": "",
+          "time_active": 865354,
+          "total_size": 67759229411,
+          "tracker": "https://tracker",
+          "trackers_count": 2,
+          "up_limit": -1,
+          "uploaded": 0,
+          "uploaded_session": 0,
+          "upspeed": 0
+        }
+        """
+        date_now = int(time.time())
+        # ID
+        torrent_id = torrent.get("hash")
+        # 标题
+        torrent_title = torrent.get("name")
+        # 下载时间
+        if (not torrent.get("added_on")
+                or torrent.get("added_on") < 0):
+            dltime = 0
+        else:
+            dltime = date_now - torrent.get("added_on")
+        # 做种时间
+        if (not torrent.get("completion_on")
+                or torrent.get("completion_on") < 0):
+            seeding_time = 0
+        else:
+            seeding_time = date_now - torrent.get("completion_on")
+        # 分享率
+        ratio = torrent.get("ratio") or 0
+        # 上传量
+        uploaded = torrent.get("uploaded") or 0
+        # 平均上传速度 Byte/s
+        if dltime:
+            avg_upspeed = int(uploaded / dltime)
+        else:
+            avg_upspeed = uploaded
+        # 已未活动 秒
+        if (not torrent.get("last_activity")
+                or torrent.get("last_activity") < 0):
+            iatime = 0
+        else:
+            iatime = date_now - torrent.get("last_activity")
+        # 下载量
+        downloaded = torrent.get("downloaded")
+        # 种子大小
+        total_size = torrent.get("total_size")
+        # 添加时间
+        add_on = (torrent.get("added_on") or 0)
+        # 种子标签
+        tags = torrent.get("tags")
+        # tracker
+        tracker = torrent.get("tracker")
+        return self._build_snapshot(torrent=torrent, torrent_id=torrent_id, torrent_title=torrent_title,
+                                    seeding_time=seeding_time, ratio=ratio, uploaded=uploaded, downloaded=downloaded,
+                                    avg_upspeed=avg_upspeed, iatime=iatime, dltime=dltime, total_size=total_size,
+                                    add_on=add_on, tags=tags, tracker=tracker)
+
+
+class TransmissionAdapter(DownloaderAdapter):
+    """
+    Transmission下载器适配器
+    """
+
+    type = "transmission"
+
+    def get_hash(self, torrent: Any) -> str:
+        return torrent.hashString
+
+    def get_labels(self, torrent: Any) -> List[str]:
+        return torrent.labels or []
+
+    def get_torrent_info(self, torrent: Any) -> TorrentSnapshot:
+        date_now = int(time.time())
+        # ID
+        torrent_id = torrent.hashString
+        # 标题
+        torrent_title = torrent.name
+        # 做种时间
+        if (not torrent.date_done
+                or torrent.date_done.timestamp() < 1):
+            seeding_time = 0
+        else:
+            seeding_time = date_now - int(torrent.date_done.timestamp())
+        # 下载耗时
+        if (not torrent.date_added
+                or torrent.date_added.timestamp() < 1):
+            dltime = 0
+        else:
+            dltime = date_now - int(torrent.date_added.timestamp())
+        # 下载量
+        downloaded = int(torrent.total_size * torrent.progress / 100)
+        # 分享率
+        ratio = torrent.ratio or 0
+        # 上传量
+        uploaded = int(downloaded * torrent.ratio)
+        # 平均上传速度
+        if dltime:
+            avg_upspeed = int(uploaded / dltime)
+        else:
+            avg_upspeed = uploaded
+        # 未活动时间
+        if (not torrent.date_active
+                or torrent.date_active.timestamp() < 1):
+            iatime = 0
+        else:
+            iatime = date_now - int(torrent.date_active.timestamp())
+        # 种子大小
+        total_size = torrent.total_size
+        # 添加时间
+        add_on = (torrent.date_added.timestamp() if torrent.date_added else 0)
+        # 种子标签
+        tags = torrent.get("tags")
+        # tracker
+        tracker = torrent.get("tracker")
+
+        return self._build_snapshot(torrent=torrent, torrent_id=torrent_id, torrent_title=torrent_title,
+                                    seeding_time=seeding_time, ratio=ratio, uploaded=uploaded, downloaded=downloaded,
+                                    avg_upspeed=avg_upspeed, iatime=iatime, dltime=dltime, total_size=total_size,
+                                    add_on=add_on, tags=tags, tracker=tracker)
+
+
+class TorrentFileHelper:
+    """
+    种子文件解析，基于bencode解码计算种子的infohash
+    """
+
+    @staticmethod
+    def get_info_hash(content: bytes) -> Optional[str]:
+        """
+        计算下载器中使用的种子Hash，v1及混合种子使用v1 infohash，纯v2种子使用截断为40位的v2 infohash
+
+        :param content: 种子文件内容
+        :return: 种子Hash，无法解析时返回None
+        """
+        info_hash_v1, info_hash_v2 = TorrentFileHelper.get_info_hashes(content)
+        if info_hash_v1:
+            return info_hash_v1
+        if info_hash_v2:
+            return info_hash_v2[:40]
+        return None
+
+    @staticmethod
+    def get_info_hashes(content: bytes) -> Tuple[Optional[str], Optional[str]]:
+        """
+        计算种子的v1及v2 infohash
+
+        :param content: 种子文件内容
+        :return: (v1 infohash, v2 infohash)，不适用或无法解析时对应值为None
+        """
+        if not content or not isinstance(content, bytes) or not content.startswith(b"d"):
+            return None, None
+        info, info_bytes = TorrentFileHelper.__decode_info(content)
+        if not isinstance(info, dict) or not info_bytes:
+            return None, None
+        info_hash_v1 = hashlib.sha1(info_bytes).hexdigest() if b"pieces" in info else None
+        info_hash_v2 = hashlib.sha256(info_bytes).hexdigest() if info.get(b"meta version") == 2 else None
+        return info_hash_v1, info_hash_v2
+
+    @staticmethod
+    def __decode_info(content: bytes) -> Tuple[Any, Optional[bytes]]:
+        """
+        解码种子文件的info字典，并返回info字典的原始bencode内容
+        """
+        index = 1
+        while content[index:index + 1] != b"e":
+            key, index = TorrentFileHelper.__decode(content, index)
+            start = index
+            value, index = TorrentFileHelper.__decode(content, index)
+            if key == b"info":
+                return value, content[start:index]
+        return None, None
+
+    @staticmethod
+    def __decode(data: bytes, index: int) -> Tuple[Any, int]:
+        """
+        从指定位置解码一个bencode值，返回解码后的值及下一个值的位置
+        """
+        token = data[index:index + 1]
+        if token == b"i":
+            end = data.index(b"e", index)
+            return int(data[index + 1:end]), end + 1
+        if token == b"l":
+            index += 1
+            items = []
+            while data[index:index + 1] != b"e":
+                item, index = TorrentFileHelper.__decode(data, index)
+                items.append(item)
+            return items, index + 1
+        if token == b"d":
+            index += 1
+            items = {}
+            while data[index:index + 1] != b"e":
+                key, index = TorrentFileHelper.__decode(data, index)
+                items[key], index = TorrentFileHelper.__decode(data, index)
+            return items, index + 1
+        if token.isdigit():
+            colon = data.index(b":", index)
+            start = colon + 1
+            end = start + int(data[index:colon])
+            if end > len(data):
+                raise ValueError("bencode string out of range")
+            return data[start:end], end
+        raise ValueError(f"invalid bencode token at {index}")
+
+
 class BrushFlowLowFreq(_PluginBase):
     # region 全局定义
 
@@ -275,12 +1597,115 @@ class BrushFlowLowFreq(_PluginBase):
     _task_brush_enable = False
     # 订阅缓存信息
     _subscribe_infos = None
+    # 订阅识别结果缓存有效期（秒）
+    _subscribe_cache_ttl = 7 * 24 * 3600
+    # 订阅识别失败后的初始重试间隔（秒），后续按指数退避
+    _subscribe_retry_interval = 30 * 60
+    # 订阅并发识别的最大线程数
+    _subscribe_recognize_workers = 4
+    # 订阅识别超时时间（秒）
+    _subscribe_recognize_timeout = 60
+    # 识别超时后仍在执行的订阅识别，订阅Key -> Future，完成前不重复提交
+    _subscribe_recognizing = None
+    # 订阅标题匹配器，订阅标题集合变化时重新构建
+    _subscribe_matcher = None
+    # 刷流任务去重索引
+    _torrent_task_index = None
+    # 站点索引器索引，每个刷流、检查周期开始时重新构建，站点删除时立即失效
+    _indexer_index = None
     # Brush定时
     _brush_interval = 10
+    # 开启自适应刷流间隔时Brush的检查间隔（分钟）
+    _adaptive_tick_interval = 1
+    # 站点默认最小刷流间隔（分钟）
+    _adaptive_min_interval = 3
+    # 站点最大刷流间隔（分钟）
+    _adaptive_max_interval = 60
+    # 期望每次请求站点获取的新种子数，刷流间隔 = 期望新种子数 / 到达速率
+    _adaptive_target_arrivals = 5
+    # 到达速率指数加权平均的平滑系数
+    _adaptive_rate_alpha = 0.5
     # Check定时
     _check_interval = 5
+    # 未配置刷流周期时间预算时，按刷流间隔的比例计算，超过时剩余站点推迟到下个周期优先处理
+    _brush_cycle_budget_ratio = 0.8
+    # 未配置时刷流周期各阶段的默认预算占比：获取种子、评估种子、下载种子文件、添加下载任务
+    _brush_phase_budget_ratios = {"browse": 0.4, "evaluate": 0.2, "fetch": 0.2, "add": 0.2}
+    # 当前刷流周期的时间预算
+    _cycle_budget = None
+    # 站点并发获取种子的最大线程数
+    _browse_max_workers = 5
+    # 站点获取种子超时时间（秒）
+    _browse_timeout = 120
+    # 本地记录的下载中任务数，每个刷流周期从下载器同步，新增任务后本地累加
+    _downloading_count = None
+    # 自上次同步后新增的下载任务数
+    _downloading_added_count = 0
+    # 新增多少个下载任务后与下载器重新同步下载中任务数
+    _downloading_sync_threshold = 5
+    # 带宽采样器
+    _bandwidth_sampler = None
+    # 带宽采样间隔（秒）
+    _bandwidth_sample_interval = 3.0
+    # 默认计算平均带宽的统计窗口（秒）
+    _bandwidth_window_default = 15
+    # 没有有效采样时立即补充采样的次数
+    _bandwidth_sample_burst = 3
+    # 站点已排除种子记录的过期时间（秒）
+    _seen_ttl = 24 * 3600
+    # 每个站点已排除种子的最大记录数
+    _seen_capacity = 2000
+    # 种子价值评分中发布时间的半衰期（分钟）
+    _score_age_half_life = 120
+    # 保种体积最优组合参与计算的最大候选种子数
+    _knapsack_max_candidates = 200
+    # 保种体积最优组合计算时剩余保种体积的划分份数
+    _knapsack_buckets = 500
+    # 站点请求限流器，站点名称 -> 令牌桶
+    _rate_limiters = None
+    _rate_limiters_lock = threading.Lock()
+    # 站点默认每分钟请求数，0为不限制
+    _rate_limit_default = 0
+    # 站点默认突发请求数
+    _rate_burst_default = 10
+    # 站点请求的最大等待时间（秒），超过时推迟到下次刷流
+    _rate_limit_max_wait = 60
+    # 站点熔断器，站点ID -> 熔断器
+    _site_breakers = None
+    _site_breakers_lock = threading.Lock()
+    # 触发站点熔断的连续失败次数
+    _breaker_failure_threshold = 3
+    # 站点熔断的初始冷却时间（秒）
+    _breaker_base_cooldown = 10 * 60
+    # 站点熔断的最大冷却时间（秒）
+    _breaker_max_cooldown = 6 * 3600
+    # qBittorrent种子状态增量同步镜像
+    _qb_mirror = None
+    # qBittorrent增量同步强制全量同步的间隔（秒）
+    _qb_mirror_full_update_interval = 3600
+    # 检查服务全量核对下载器种子的间隔（秒），其余周期仅获取刷流标签及刷流任务中的种子
+    _check_full_reconcile_interval = 3600
+    # 上次全量核对下载器种子的时间
+    _check_full_reconcile_time = 0
+    # 按Hash获取种子时每次请求的最大Hash数
+    _check_hashes_batch_size = 500
+    # 下载器适配器
+    _downloader_adapter = None
+    # 种子文件缓存
+    _torrent_cache = None
+    # 种子文件缓存最大容量（字节）
+    _torrent_cache_size = 50 * 1024 ** 2
+    # 种子文件缓存有效期（秒）
+    _torrent_cache_ttl = 24 * 3600
+    # 站点HTTP会话，站点名称 -> (会话参数, 会话)
+    _site_sessions = None
+    _site_sessions_lock = threading.Lock()
+    # 每个站点会话的最大连接数
+    _site_session_pool_size = 4
     # 退出事件
     _event = threading.Event()
+    # 插件停止事件，停止服务时设置，用于中断等待站点令牌的请求，重新初始化插件时清除
+    _stop_event = threading.Event()
     _scheduler = None
     # tabs
     _tabs = None
@@ -294,12 +1719,16 @@ class BrushFlowLowFreq(_PluginBase):
         self.subscribe_oper = SubscribeOper()
         self.downloader_helper = DownloaderHelper()
         self._task_brush_enable = False
+        self._rate_limiters = {}
 
         if not config:
             logger.info("站点刷流任务出错，无法获取插件配置")
             return False
 
         self._tabs = config.get("_tabs", None)
+        self._indexer_index = None
+        self._qb_mirror = None
+        self._downloader_adapter = None
 
         # 如果配置校验没有通过，那么这里修改配置文件后退出
         if not self.__validate_and_fix_config(config=config):
@@ -320,10 +1749,10 @@ class BrushFlowLowFreq(_PluginBase):
 
         # 这里先过滤掉已删除的站点并保存，特别注意的是，这里保留了界面选择站点时的顺序，以便后续站点随机刷流或顺序刷流
         if brush_config.brushsites:
-            site_id_to_public_status = {site.get("id"): site.get("public") for site in self.sites_helper.get_indexers()}
+            indexer_index = self.__get_indexer_index()
             brush_config.brushsites = [
                 site_id for site_id in brush_config.brushsites
-                if site_id in site_id_to_public_status and not site_id_to_public_status[site_id]
+                if indexer_index.get(site_id) and not indexer_index.get(site_id).get("public")
             ]
 
         self.__update_config()
@@ -343,6 +1772,7 @@ class BrushFlowLowFreq(_PluginBase):
 
         # 停止现有任务
         self.stop_service()
+        self._stop_event.clear()
 
         # 如果站点都没有配置，则不开启定时刷流服务
         if not brush_config.brushsites:
@@ -361,6 +1791,14 @@ class BrushFlowLowFreq(_PluginBase):
         if not self.service_info:
             return
 
+        # 配置了带宽限制时，启动后台带宽采样
+        if self._task_brush_enable and (brush_config.maxupspeed or brush_config.maxdlspeed):
+            self._bandwidth_sampler = BandwidthSampler(sample_func=self.__sample_bandwidth,
+                                                       interval=self._bandwidth_sample_interval,
+                                                       capacity=self.__get_bandwidth_sample_window() * 4,
+                                                       active_func=self.__is_bandwidth_sampling_active)
+            self._bandwidth_sampler.start()
+
         # 检查是否启用了一次性任务
         if brush_config.onlyonce:
             self._scheduler = BackgroundScheduler(timezone=settings.TZ)
@@ -422,7 +1860,21 @@ class BrushFlowLowFreq(_PluginBase):
         pass
 
     def get_api(self) -> List[Dict[str, Any]]:
-        pass
+        return [{
+            "path": "/rate_limiters",
+            "endpoint": self.get_rate_limiters,
+            "methods": ["GET"],
+            "summary": "站点请求限流状态",
+            "description": "获取各站点请求令牌桶的限流状态"
+        }]
+
+    def get_rate_limiters(self) -> Dict[str, dict]:
+        """
+        获取各站点请求限流器的状态
+        """
+        with self._rate_limiters_lock:
+            limiters = dict(self._rate_limiters or {})
+        return {site_name: limiter.snapshot() for site_name, limiter in limiters.items()}
 
     def get_service(self) -> List[Dict[str, Any]]:
         """
@@ -446,9 +1898,10 @@ class BrushFlowLowFreq(_PluginBase):
             return services
 
         if self._task_brush_enable:
+            brush_interval = self._adaptive_tick_interval if brush_config.adaptive_interval else self._brush_interval
             if brush_config.cron:
                 values = brush_config.cron.split()
-                values[0] = f"{datetime.now().minute % 10}/10"
+                values[0] = "*" if brush_config.adaptive_interval else f"{datetime.now().minute % 10}/10"
                 cron = " ".join(values)
                 logger.info(f"站点刷流定时服务启动，执行周期 {cron}")
                 cron_trigger = CronTrigger.from_crontab(cron)
@@ -459,13 +1912,13 @@ class BrushFlowLowFreq(_PluginBase):
                     "func": self.brush
                 })
             else:
-                logger.info(f"站点刷流定时服务启动，时间间隔 {self._brush_interval} 分钟")
+                logger.info(f"站点刷流定时服务启动，时间间隔 {brush_interval} 分钟")
                 services.append({
                     "id": "BrushFlowLowFreq",
                     "name": "站点刷流（低频版）服务",
                     "trigger": "interval",
                     "func": self.brush,
-                    "kwargs": {"minutes": self._brush_interval}
+                    "kwargs": {"minutes": brush_interval}
                 })
 
         if brush_config.enabled:
@@ -824,7 +2277,7 @@ class BrushFlowLowFreq(_PluginBase):
 
         # 站点选项
         site_options = [{"title": site.get("name"), "value": site.get("id")}
-                        for site in self.sites_helper.get_indexers()]
+                        for site in self.__get_indexer_index(refresh=True).indexers]
         # 下载器选项
         downloader_options = [{"title": config.name, "value": config.name}
                               for config in self.downloader_helper.get_configs().values()]
@@ -1483,16 +2936,173 @@ class BrushFlowLowFreq(_PluginBase):
                                             {
                                                 'component': 'VCol',
                                                 'props': {
-                                                    "cols": 12,
-                                                    "md": 4
+                                                    "cols": 12,
+                                                    "md": 4
+                                                },
+                                                'content': [
+                                                    {
+                                                        'component': 'VTextField',
+                                                        'props': {
+                                                            'model': 'seed_inactivetime',
+                                                            'label': '未活动时间（分钟）',
+                                                            'placeholder': '超过时删除任务'
+                                                        }
+                                                    }
+                                                ]
+                                            },
+                                            {
+                                                'component': 'VCol',
+                                                'props': {
+                                                    "cols": 12,
+                                                    "md": 4
+                                                },
+                                                'content': [
+                                                    {
+                                                        'component': 'VTextField',
+                                                        'props': {
+                                                            'model': 'delete_except_tags',
+                                                            'label': '删除排除标签',
+                                                            'placeholder': '如：MOVIEPILOT,H&R'
+                                                        }
+                                                    }
+                                                ]
+                                            }
+                                        ]
+                                    }
+                                ]
+                            },
+                            {
+                                'component': 'VWindowItem',
+                                'props': {
+                                    'value': 'other_tab'
+                                },
+                                'content': [
+                                    {
+                                        'component': 'VRow',
+                                        'props': {
+                                            'style': {
+                                                'margin-top': '-16px'
+                                            }
+                                        },
+                                        'content': [
+                                            {
+                                                'component': 'VCol',
+                                                'props': {
+                                                    'cols': 12,
+                                                    'md': 4
+                                                },
+                                                'content': [
+                                                    {
+                                                        'component': 'VSwitch',
+                                                        'props': {
+                                                            'model': 'brush_sequential',
+                                                            'label': '站点顺序刷流',
+                                                        }
+                                                    }
+                                                ]
+                                            },
+                                            {
+                                                'component': 'VCol',
+                                                'props': {
+                                                    'cols': 12,
+                                                    'md': 4
+                                                },
+                                                'content': [
+                                                    {
+                                                        'component': 'VSwitch',
+                                                        'props': {
+                                                            'model': 'except_subscribe',
+                                                            'label': '排除订阅（实验性功能）',
+                                                        }
+                                                    }
+                                                ]
+                                            },
+                                            {
+                                                'component': 'VCol',
+                                                'props': {
+                                                    'cols': 12,
+                                                    'md': 4
+                                                },
+                                                'content': [
+                                                    {
+                                                        'component': 'VSwitch',
+                                                        'props': {
+                                                            'model': 'proxy_delete',
+                                                            'label': '动态删除种子（实验性功能）',
+                                                        }
+                                                    }
+                                                ]
+                                            }
+                                        ]
+                                    },
+                                    {
+                                        'component': 'VRow',
+                                        'content': [
+                                            {
+                                                'component': 'VCol',
+                                                'props': {
+                                                    'cols': 12,
+                                                    'md': 4
+                                                },
+                                                'content': [
+                                                    {
+                                                        'component': 'VSwitch',
+                                                        'props': {
+                                                            'model': 'clear_task',
+                                                            'label': '清除统计数据',
+                                                        }
+                                                    }
+                                                ]
+                                            },
+                                            {
+                                                'component': 'VCol',
+                                                'props': {
+                                                    'cols': 12,
+                                                    'md': 4
+                                                },
+                                                'content': [
+                                                    {
+                                                        'component': 'VSwitch',
+                                                        'props': {
+                                                            'model': 'enable_site_config',
+                                                            'label': '站点独立配置',
+                                                        }
+                                                    }
+                                                ]
+                                            },
+                                            {
+                                                "component": "VCol",
+                                                "props": {
+                                                    "cols": 12,
+                                                    "md": 4
+                                                },
+                                                "content": [
+                                                    {
+                                                        "component": "VSwitch",
+                                                        "props": {
+                                                            "model": "dialog_closed",
+                                                            "label": "打开站点配置窗口"
+                                                        }
+                                                    }
+                                                ]
+                                            }
+                                        ]
+                                    },
+                                    {
+                                        'component': 'VRow',
+                                        "content": [
+                                            {
+                                                'component': 'VCol',
+                                                'props': {
+                                                    'cols': 12,
+                                                    'md': 4
                                                 },
                                                 'content': [
                                                     {
-                                                        'component': 'VTextField',
+                                                        'component': 'VSwitch',
                                                         'props': {
-                                                            'model': 'seed_inactivetime',
-                                                            'label': '未活动时间（分钟）',
-                                                            'placeholder': '超过时删除任务'
+                                                            'model': 'sync_official',
+                                                            'label': '双向同步官方数据',
                                                         }
                                                     }
                                                 ]
@@ -1500,38 +3110,29 @@ class BrushFlowLowFreq(_PluginBase):
                                             {
                                                 'component': 'VCol',
                                                 'props': {
-                                                    "cols": 12,
-                                                    "md": 4
+                                                    'cols': 12,
+                                                    'md': 4
                                                 },
                                                 'content': [
                                                     {
-                                                        'component': 'VTextField',
+                                                        'component': 'VSelect',
                                                         'props': {
-                                                            'model': 'delete_except_tags',
-                                                            'label': '删除排除标签',
-                                                            'placeholder': '如：MOVIEPILOT,H&R'
+                                                            'model': 'brush_strategy',
+                                                            'label': '刷流策略',
+                                                            'items': [
+                                                                {'title': '按站点依次刷流', 'value': 'site'},
+                                                                {'title': '按种子价值评分刷流', 'value': 'score'},
+                                                                {'title': '按保种体积最优组合刷流', 'value': 'knapsack'},
+                                                            ]
                                                         }
                                                     }
                                                 ]
                                             }
                                         ]
-                                    }
-                                ]
-                            },
-                            {
-                                'component': 'VWindowItem',
-                                'props': {
-                                    'value': 'other_tab'
-                                },
-                                'content': [
+                                    },
                                     {
                                         'component': 'VRow',
-                                        'props': {
-                                            'style': {
-                                                'margin-top': '-16px'
-                                            }
-                                        },
-                                        'content': [
+                                        "content": [
                                             {
                                                 'component': 'VCol',
                                                 'props': {
@@ -1542,8 +3143,8 @@ class BrushFlowLowFreq(_PluginBase):
                                                     {
                                                         'component': 'VSwitch',
                                                         'props': {
-                                                            'model': 'brush_sequential',
-                                                            'label': '站点顺序刷流',
+                                                            'model': 'adaptive_interval',
+                                                            'label': '自适应刷流间隔',
                                                         }
                                                     }
                                                 ]
@@ -1556,10 +3157,11 @@ class BrushFlowLowFreq(_PluginBase):
                                                 },
                                                 'content': [
                                                     {
-                                                        'component': 'VSwitch',
+                                                        'component': 'VTextField',
                                                         'props': {
-                                                            'model': 'except_subscribe',
-                                                            'label': '排除订阅（实验性功能）',
+                                                            'model': 'min_interval',
+                                                            'label': '站点最小刷流间隔（分钟）',
+                                                            'placeholder': '默认3分钟'
                                                         }
                                                     }
                                                 ]
@@ -1572,10 +3174,11 @@ class BrushFlowLowFreq(_PluginBase):
                                                 },
                                                 'content': [
                                                     {
-                                                        'component': 'VSwitch',
+                                                        'component': 'VTextField',
                                                         'props': {
-                                                            'model': 'proxy_delete',
-                                                            'label': '动态删除种子（实验性功能）',
+                                                            'model': 'request_budget',
+                                                            'label': '站点请求预算（次/小时）',
+                                                            'placeholder': '所有站点每小时请求总次数上限'
                                                         }
                                                     }
                                                 ]
@@ -1584,7 +3187,7 @@ class BrushFlowLowFreq(_PluginBase):
                                     },
                                     {
                                         'component': 'VRow',
-                                        'content': [
+                                        "content": [
                                             {
                                                 'component': 'VCol',
                                                 'props': {
@@ -1593,10 +3196,11 @@ class BrushFlowLowFreq(_PluginBase):
                                                 },
                                                 'content': [
                                                     {
-                                                        'component': 'VSwitch',
+                                                        'component': 'VTextField',
                                                         'props': {
-                                                            'model': 'clear_task',
-                                                            'label': '清除统计数据',
+                                                            'model': 'bandwidth_window',
+                                                            'label': '带宽统计窗口（秒）',
+                                                            'placeholder': '默认15秒'
                                                         }
                                                     }
                                                 ]
@@ -1609,35 +3213,15 @@ class BrushFlowLowFreq(_PluginBase):
                                                 },
                                                 'content': [
                                                     {
-                                                        'component': 'VSwitch',
+                                                        'component': 'VTextField',
                                                         'props': {
-                                                            'model': 'enable_site_config',
-                                                            'label': '站点独立配置',
+                                                            'model': 'cycle_budget',
+                                                            'label': '刷流周期时间预算（分钟）',
+                                                            'placeholder': '默认为刷流间隔的80%'
                                                         }
                                                     }
                                                 ]
                                             },
-                                            {
-                                                "component": "VCol",
-                                                "props": {
-                                                    "cols": 12,
-                                                    "md": 4
-                                                },
-                                                "content": [
-                                                    {
-                                                        "component": "VSwitch",
-                                                        "props": {
-                                                            "model": "dialog_closed",
-                                                            "label": "打开站点配置窗口"
-                                                        }
-                                                    }
-                                                ]
-                                            }
-                                        ]
-                                    },
-                                    {
-                                        'component': 'VRow',
-                                        "content": [
                                             {
                                                 'component': 'VCol',
                                                 'props': {
@@ -1646,10 +3230,11 @@ class BrushFlowLowFreq(_PluginBase):
                                                 },
                                                 'content': [
                                                     {
-                                                        'component': 'VSwitch',
+                                                        'component': 'VTextField',
                                                         'props': {
-                                                            'model': 'sync_official',
-                                                            'label': '双向同步官方数据',
+                                                            'model': 'cycle_budget_ratios',
+                                                            'label': '刷流周期阶段预算占比',
+                                                            'placeholder': '获取,评估,下载,添加，默认40,20,20,20'
                                                         }
                                                     }
                                                 ]
@@ -1848,6 +3433,8 @@ class BrushFlowLowFreq(_PluginBase):
             "delete_except_tags": f"{settings.TORRENT_TAG},H&R" if settings.TORRENT_TAG else "H&R",
             "except_subscribe": True,
             "brush_sequential": False,
+            "brush_strategy": "site",
+            "adaptive_interval": False,
             "proxy_delete": False,
             "freeleech": "free",
             "hr": "yes",
@@ -1858,9 +3445,11 @@ class BrushFlowLowFreq(_PluginBase):
     def get_page(self) -> List[dict]:
         # 种子明细
         torrents = self.get_data("torrents") or {}
+        # 站点熔断状态
+        breaker_elements = self.__get_site_breaker_elements()
 
         if not torrents:
-            return [
+            return ([{'component': 'VRow', 'content': breaker_elements}] if breaker_elements else []) + [
                 {
                     'component': 'div',
                     'text': '暂无数据',
@@ -1935,7 +3524,7 @@ class BrushFlowLowFreq(_PluginBase):
         return [
             {
                 'component': 'VRow',
-                'content': self.__get_total_elements() + [
+                'content': self.__get_total_elements() + breaker_elements + [
                     # 种子明细
                     {
                         'component': 'VCol',
@@ -2032,11 +3621,106 @@ class BrushFlowLowFreq(_PluginBase):
             }
         ]
 
+    def __get_site_breaker_elements(self) -> List[dict]:
+        """
+        组装站点熔断状态元素，没有失败记录时不显示
+        """
+        breakers_data: Dict[str, dict] = self.get_data("breakers") or {}
+        if not breakers_data:
+            return []
+
+        state_texts = {
+            SiteCircuitBreaker.CLOSED: "正常",
+            SiteCircuitBreaker.OPEN: "熔断",
+            SiteCircuitBreaker.HALF_OPEN: "试探中"
+        }
+        breaker_trs = [
+            {
+                'component': 'tr',
+                'props': {
+                    'class': 'text-sm'
+                },
+                'content': [
+                    {
+                        'component': 'td',
+                        'props': {
+                            'class': 'whitespace-nowrap break-keep text-high-emphasis'
+                        },
+                        'text': data.get("site_name")
+                    },
+                    {
+                        'component': 'td',
+                        'props': {
+                            'class': 'text-no-wrap'
+                        },
+                        'text': state_texts.get(data.get("state"), data.get("state"))
+                    },
+                    {
+                        'component': 'td',
+                        'text': data.get("failures") or 0
+                    },
+                    {
+                        'component': 'td',
+                        'text': datetime.fromtimestamp(data.get("open_until")).strftime("%Y-%m-%d %H:%M:%S")
+                        if data.get("state") == SiteCircuitBreaker.OPEN and data.get("open_until") else "N/A"
+                    },
+                    {
+                        'component': 'td',
+                        'text': data.get("last_error") or ""
+                    }
+                ]
+            } for data in sorted(breakers_data.values(), key=lambda x: x.get("last_failure_time") or 0, reverse=True)
+        ]
+
+        return [
+            {
+                'component': 'VCol',
+                'props': {
+                    'cols': 12,
+                },
+                'content': [
+                    {
+                        'component': 'VTable',
+                        'props': {
+                            'hover': True
+                        },
+                        'content': [
+                            {
+                                'component': 'thead',
+                                'props': {
+                                    'class': 'text-no-wrap'
+                                },
+                                'content': [
+                                    {
+                                        'component': 'th',
+                                        'props': {
+                                            'class': 'text-start ps-4'
+                                        },
+                                        'text': text
+                                    } for text in ['站点', '熔断状态', '连续失败次数', '恢复时间', '最近错误']
+                                ]
+                            },
+                            {
+                                'component': 'tbody',
+                                'content': breaker_trs
+                            }
+                        ]
+                    }
+                ]
+            }
+        ]
+
     def stop_service(self):
         """
         退出插件
         """
+        # 无论定时任务由插件自身还是系统调度，均中断等待站点令牌的请求
+        self._stop_event.set()
         try:
+            if self._bandwidth_sampler:
+                self._bandwidth_sampler.stop()
+                self._bandwidth_sampler = None
+            self.__close_site_sessions()
             if self._scheduler:
                 self._scheduler.remove_all_jobs()
                 if self._scheduler.running:
@@ -2066,75 +3750,567 @@ class BrushFlowLowFreq(_PluginBase):
             return
 
         with lock:
-            logger.info(f"开始执行刷流任务 ...")
+            try:
+                # 每个周期重新构建站点索引器索引，新增或修改的站点及时生效
+                self._indexer_index = None
+                # 获取所有站点的信息，并过滤掉不存在的站点
+                all_site_infos = []
+                for siteid in brush_config.brushsites:
+                    siteinfo = self.site_oper.get(siteid)
+                    if siteinfo:
+                        all_site_infos.append(siteinfo)
+
+                # 获取站点增量浏览状态
+                seen_data: Dict[str, dict] = self.get_data("seen") or {}
+                site_states = {site.id: SiteBrowseState(data=seen_data.get(str(site.id)), ttl=self._seen_ttl,
+                                                        capacity=self._seen_capacity) for site in all_site_infos}
+
+                # 开启自适应刷流间隔时，仅处理已到达刷流间隔的站点
+                site_infos = all_site_infos
+                if brush_config.adaptive_interval:
+                    tolerance = self._adaptive_tick_interval * 30
+                    site_infos = [site for site in all_site_infos if site_states[site.id].is_due(tolerance=tolerance)]
+                    if not site_infos:
+                        logger.debug(f"没有到达刷流间隔的站点，跳过本次刷流")
+                        return
+
+                # 跳过处于熔断状态的站点
+                open_site_infos = [site for site in site_infos
+                                   if not self.__get_site_breaker(site_id=site.id, site_name=site.name).allow()]
+                if open_site_infos:
+                    site_infos = [site for site in site_infos if site not in open_site_infos]
+                    logger.info(f"站点 {', '.join(site.name for site in open_site_infos)} 处于熔断状态，本次跳过")
+                    if not site_infos:
+                        return
+
+                logger.info(f"开始执行刷流任务 ...")
+
+                torrent_tasks: Dict[str, dict] = self.get_data("torrents") or {}
+                torrents_size = self.__calculate_seeding_torrents_size(torrent_tasks=torrent_tasks)
+
+                # 判断能否通过保种体积前置条件
+                size_condition_passed, reason = self.__evaluate_size_condition_for_brush(torrents_size=torrents_size)
+                self.__log_brush_conditions(passed=size_condition_passed, reason=reason)
+                if not size_condition_passed:
+                    self.__postpone_site_browses(site_infos=site_infos, site_states=site_states, seen_data=seen_data)
+                    logger.info(f"刷流任务执行完成")
+                    return
+
+                # 同步下载中任务数
+                self.__sync_downloading_count()
+
+                # 判断能否通过刷流前置条件
+                pre_condition_passed, reason = self.__evaluate_pre_conditions_for_brush()
+                self.__log_brush_conditions(passed=pre_condition_passed, reason=reason)
+                if not pre_condition_passed:
+                    self.__postpone_site_browses(site_infos=site_infos, site_states=site_states, seen_data=seen_data)
+                    logger.info(f"刷流任务执行完成")
+                    return
+
+                statistic_info = self.__get_statistic_info()
+
+                # 根据是否开启顺序刷流来决定是否需要打乱顺序
+                if not brush_config.brush_sequential:
+                    random.shuffle(site_infos)
+
+                # 上个周期因超出时间预算推迟的站点优先处理
+                deferred_site_ids: List[int] = self.get_data("deferred_sites") or []
+                site_infos.sort(key=lambda x: deferred_site_ids.index(x.id) if x.id in deferred_site_ids
+                                else len(deferred_site_ids))
+
+                logger.info(f"即将针对站点 {', '.join(site.name for site in site_infos)} 开始刷流")
+
+                phase_ratios = self.__parse_cycle_budget_ratios(brush_config.cycle_budget_ratios) \
+                    or self._brush_phase_budget_ratios
+                # 获取种子阶段预算不低于站点获取种子超时时间，避免响应较慢但正常的站点每个周期都被推迟
+                self._cycle_budget = CycleBudget(total=self.__get_cycle_budget_total(), phase_ratios=phase_ratios,
+                                                 min_phase_limits={"browse": self._browse_timeout})
+
+                # 并发获取所有站点的种子
+                site_torrents, deferred_site_infos = self.__browse_sites(site_infos=site_infos)
+
+                # 根据本次获取的种子更新站点新种子到达速率，并重新计算站点刷流间隔
+                for site in site_infos:
+                    if site in deferred_site_infos:
+                        continue
+                    site_states[site.id].record_arrivals(torrents=site_torrents.get(site.id),
+                                                         alpha=self._adaptive_rate_alpha)
+                if brush_config.adaptive_interval:
+                    self.__schedule_site_browses(site_infos=all_site_infos, site_states=site_states)
+
+                # 获取订阅标题匹配器
+                subscribe_matcher = self.__get_subscribe_matcher(subscribe_titles=self.__get_subscribe_titles())
+
+                # 获取刷流任务去重索引
+                task_index = self.__get_torrent_task_index(torrent_tasks=torrent_tasks)
+
+                browsed_site_infos = [site for site in site_infos if site not in deferred_site_infos]
+                if brush_config.brush_strategy in ["score", "knapsack"]:
+                    # 汇总所有站点的种子，按种子价值评分排序刷流，或在保种体积内选择总评分最高的组合
+                    deferred_site_infos += self.__brush_ranked_torrents(site_infos=browsed_site_infos,
+                                                                        site_torrents=site_torrents,
+                                                                        torrent_tasks=torrent_tasks,
+                                                                        task_index=task_index, site_states=site_states,
+                                                                        statistic_info=statistic_info,
+                                                                        subscribe_matcher=subscribe_matcher)
+                else:
+                    # 按站点顺序处理所有站点
+                    for index, site in enumerate(browsed_site_infos):
+                        # 超出时间预算时，剩余站点推迟到下个周期
+                        if self.__is_cycle_budget_exhausted(phase="evaluate"):
+                            deferred_site_infos += browsed_site_infos[index:]
+                            break
+                        # 如果站点刷流没有正确响应，说明没有通过前置条件，其他站点也不需要继续刷流了
+                        if not self.__brush_site_torrents(siteinfo=site, torrents=site_torrents.get(site.id),
+                                                          torrent_tasks=torrent_tasks, task_index=task_index,
+                                                          site_state=site_states[site.id],
+                                                          statistic_info=statistic_info,
+                                                          subscribe_matcher=subscribe_matcher):
+                            logger.info(f"站点 {site.name} 刷流中途结束，停止后续刷流")
+                            if any(self.__is_cycle_budget_exhausted(phase=phase)
+                                   for phase in ["evaluate", "fetch", "add"]):
+                                deferred_site_infos += browsed_site_infos[index:]
+                            break
+                        else:
+                            logger.info(f"站点 {site.name} 刷流完成")
+
+                if deferred_site_infos:
+                    logger.info(f"刷流周期超出时间预算，站点 {', '.join(site.name for site in deferred_site_infos)} "
+                                f"推迟到下个周期优先处理")
+                logger.info(f"刷流周期时间预算：{self._cycle_budget.summary()}")
+                self.save_data("deferred_sites", [site.id for site in deferred_site_infos])
+
+                # 根据本周期的评估及添加结果推进站点高水位
+                self.__advance_site_watermarks(site_infos=browsed_site_infos, site_states=site_states,
+                                               task_index=task_index)
+
+                # 保存数据
+                self.save_data("torrents", torrent_tasks)
+                # 保存站点增量浏览状态
+                seen_data.update({str(site_id): state.to_dict() for site_id, state in site_states.items()})
+                self.save_data("seen", seen_data)
+                # 保存统计数据
+                self.save_data("statistic", statistic_info)
+                logger.info(f"刷流任务执行完成")
+            finally:
+                # 周期结束或中途异常退出时均清除时间预算，避免后续调用沿用过期的预算
+                self._cycle_budget = None
+                # 保存站点熔断状态，周期中途异常退出时同样保存
+                self.__save_site_breakers()
 
-            torrent_tasks: Dict[str, dict] = self.get_data("torrents") or {}
-            torrents_size = self.__calculate_seeding_torrents_size(torrent_tasks=torrent_tasks)
+    def __schedule_site_browses(self, site_infos: List[Any], site_states: Dict[int, SiteBrowseState]):
+        """
+        根据站点新种子到达速率计算刷流间隔，发布密集时缩短、空闲时延长，
+        所有站点按刷流间隔估算的请求次数超过请求预算时，按比例延长所有站点的刷流间隔
+        """
+        brush_config = self.__get_brush_config()
+        intervals = {}
+        for site in site_infos:
+            state = site_states[site.id]
+            site_config = self.__get_brush_config(sitename=site.name)
+            min_interval = max(float(site_config.min_interval or self._adaptive_min_interval),
+                               self._adaptive_tick_interval)
+            if state.arrival_rate is None:
+                interval = self._brush_interval
+            elif state.arrival_rate <= 0:
+                interval = self._adaptive_max_interval
+            else:
+                interval = self._adaptive_target_arrivals / state.arrival_rate
+            intervals[site.id] = min(max(interval, min_interval), max(self._adaptive_max_interval, min_interval))
+
+        hourly_requests = sum(60 / interval for interval in intervals.values())
+        scale = 1.0
+        if brush_config.request_budget and hourly_requests > float(brush_config.request_budget):
+            scale = hourly_requests / float(brush_config.request_budget)
+            logger.info(f"站点预计请求 {hourly_requests:.1f} 次/小时，超过请求预算 {brush_config.request_budget} 次/小时，"
+                        f"刷流间隔按 {scale:.2f} 倍延长")
+
+        for site in site_infos:
+            state = site_states[site.id]
+            state.interval = round(intervals[site.id] * scale, 1)
+            rate = f"{state.arrival_rate:.2f}" if state.arrival_rate is not None else "未知"
+            logger.debug(f"站点 {site.name} 新种子到达速率 {rate} 个/分钟，刷流间隔 {state.interval} 分钟")
+
+    def __postpone_site_browses(self, site_infos: List[Any], site_states: Dict[int, SiteBrowseState],
+                                seen_data: Dict[str, dict]):
+        """
+        开启自适应刷流间隔时，未通过前置条件的站点按当前刷流间隔推迟，避免每次检查都重复评估前置条件
+        """
+        if not self.__get_brush_config().adaptive_interval:
+            return
+        now = time.time()
+        for site in site_infos:
+            state = site_states[site.id]
+            state.request_time = now
+            state.interval = state.interval or self._brush_interval
+        seen_data.update({str(site.id): site_states[site.id].to_dict() for site in site_infos})
+        self.save_data("seen", seen_data)
+
+    def __browse_sites(self, site_infos: List[Any]) -> Tuple[Dict[int, List[TorrentInfo]], List[Any]]:
+        """
+        并发获取站点种子，每个站点从实际开始获取时单独计算超时，超时的站点本轮不再等待，其结果在返回后丢弃
 
-            # 判断能否通过保种体积前置条件
-            size_condition_passed, reason = self.__evaluate_size_condition_for_brush(torrents_size=torrents_size)
-            self.__log_brush_conditions(passed=size_condition_passed, reason=reason)
-            if not size_condition_passed:
-                logger.info(f"刷流任务执行完成")
-                return
+        :return: (站点ID -> 种子列表, 因超出时间预算而推迟的站点)
+        """
+        site_torrents, deferred_site_infos = {}, []
+        if not site_infos:
+            return site_torrents, deferred_site_infos
 
-            # 判断能否通过刷流前置条件
-            pre_condition_passed, reason = self.__evaluate_pre_conditions_for_brush()
-            self.__log_brush_conditions(passed=pre_condition_passed, reason=reason)
-            if not pre_condition_passed:
-                logger.info(f"刷流任务执行完成")
-                return
+        # 获取种子阶段除站点超时时间外，还受周期时间预算限制
+        budget_deadline = None
+        if self._cycle_budget:
+            budget_deadline = time.time() + max(self._cycle_budget.remaining(phase="browse"), 0)
+
+        start_time = time.time()
+        # 站点开始获取种子的时间，由工作线程记录
+        site_start_times: Dict[int, float] = {}
+        # 站点放弃等待的标记，工作线程在获取完成后据此丢弃结果
+        abandoned_events = {siteinfo.id: threading.Event() for siteinfo in site_infos}
+        executor = ThreadPoolExecutor(max_workers=min(self._browse_max_workers, len(site_infos)),
+                                      thread_name_prefix="BrushFlowLowFreqBrowse")
+        try:
+            futures = {executor.submit(self.__browse_site, siteinfo, self._cycle_budget, site_start_times,
+                                       abandoned_events[siteinfo.id]): siteinfo for siteinfo in site_infos}
+            pending = set(futures)
+            while pending:
+                now = time.time()
+                deadlines = [site_start_times[futures[future].id] + self._browse_timeout for future in pending
+                             if futures[future].id in site_start_times]
+                if budget_deadline is not None:
+                    deadlines.append(budget_deadline)
+                # 尚无站点开始获取时短暂等待后重新计算
+                timeout = max(min(deadlines, default=now + 1) - now, 0)
+                done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                for future in done:
+                    site_torrents[futures[future].id] = future.result()
+
+                now = time.time()
+                if budget_deadline is not None and now >= budget_deadline:
+                    # 周期时间预算不足，排队或未完成的站点均推迟到下个周期
+                    for future in pending:
+                        siteinfo = futures[future]
+                        future.cancel()
+                        abandoned_events[siteinfo.id].set()
+                        deferred_site_infos.append(siteinfo)
+                    break
 
-            statistic_info = self.__get_statistic_info()
+                for future in list(pending):
+                    siteinfo = futures[future]
+                    site_start_time = site_start_times.get(siteinfo.id)
+                    if site_start_time is None or now - site_start_time < self._browse_timeout:
+                        continue
+                    pending.discard(future)
+                    abandoned_events[siteinfo.id].set()
+                    logger.warning(f"站点 {siteinfo.name} 获取种子超时（{self._browse_timeout} 秒），本次跳过")
+                    self.__record_site_failure(site_id=siteinfo.id, site_name=siteinfo.name,
+                                               error=f"获取种子超时（{self._browse_timeout} 秒）")
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        elapsed = time.time() - start_time
+        if self._cycle_budget:
+            self._cycle_budget.add(seconds=elapsed, phase="browse")
+        logger.info(f"站点种子获取完成，站点数 {len(site_infos)}，耗时 {elapsed:.1f} 秒")
+        return site_torrents, deferred_site_infos
+
+    def __browse_site(self, siteinfo: Any, cycle_budget: Optional[CycleBudget] = None,
+                      site_start_times: Dict[int, float] = None,
+                      abandoned: threading.Event = None) -> List[TorrentInfo]:
+        """
+        获取站点的新种子，已被放弃等待的站点不再记录熔断及耗时，结果直接丢弃
+        """
+        if site_start_times is not None:
+            site_start_times[siteinfo.id] = time.time()
+        if not self.__acquire_site_request(site_name=siteinfo.name):
+            logger.warning(f"站点 {siteinfo.name} 请求过于频繁或插件正在停止，获取种子推迟到下次刷流")
+            return []
+        logger.info(f"开始获取站点 {siteinfo.name} 的新种子 ...")
+        start_time = time.time()
+        try:
+            torrents = self.torrents_chain.browse(domain=siteinfo.domain) or []
+        except Exception as e:
+            if abandoned and abandoned.is_set():
+                return []
+            logger.error(f"站点 {siteinfo.name} 获取种子失败，错误详情: {e}")
+            self.__record_site_failure(site_id=siteinfo.id, site_name=siteinfo.name, error=f"获取种子失败：{e}")
+            return []
+        finally:
+            # 并发获取种子时仅计入站点耗时，阶段耗时按实际经过时间统计
+            if cycle_budget and not (abandoned and abandoned.is_set()):
+                cycle_budget.add(seconds=time.time() - start_time, site_name=siteinfo.name)
+        if abandoned and abandoned.is_set():
+            logger.info(f"站点 {siteinfo.name} 在超时后返回种子，本次结果丢弃")
+            return []
+        # 站点异常、Cookie失效时获取种子不会抛出异常而是返回空列表，站点种子列表正常不会为空，因此同样计为失败
+        if not torrents:
+            logger.warning(f"站点 {siteinfo.name} 没有获取到种子，可能是站点Cookie失效或站点异常")
+            self.__record_site_failure(site_id=siteinfo.id, site_name=siteinfo.name, error="没有获取到种子")
+            return []
+        self.__record_site_success(site_id=siteinfo.id, site_name=siteinfo.name)
+        return torrents
 
-            # 获取所有站点的信息，并过滤掉不存在的站点
-            site_infos = []
-            for siteid in brush_config.brushsites:
-                siteinfo = self.site_oper.get(siteid)
-                if siteinfo:
-                    site_infos.append(siteinfo)
+    def __get_cycle_budget_total(self) -> float:
+        """
+        获取刷流周期时间预算（秒），未配置时按刷流间隔的比例计算，开启自适应刷流间隔时按站点最小刷流间隔计算
+        """
+        brush_config = self.__get_brush_config()
+        if brush_config.cycle_budget:
+            return float(brush_config.cycle_budget) * 60
+        if brush_config.adaptive_interval:
+            interval = max(float(brush_config.min_interval or self._adaptive_min_interval),
+                           self._adaptive_tick_interval)
+        else:
+            interval = self._brush_interval
+        return interval * 60 * self._brush_cycle_budget_ratio
 
-            # 根据是否开启顺序刷流来决定是否需要打乱顺序
-            if not brush_config.brush_sequential:
-                random.shuffle(site_infos)
+    @staticmethod
+    def __parse_cycle_budget_ratios(value: Optional[str]) -> Optional[Dict[str, float]]:
+        """
+        解析刷流周期各阶段预算占比，格式为逗号分隔的四个数字，依次为获取种子、评估种子、下载种子文件、添加下载任务，
+        按总和归一化，格式错误时返回None
+        """
+        if not value:
+            return None
+        try:
+            ratios = [float(ratio) for ratio in str(value).replace("，", ",").split(",")]
+        except ValueError:
+            return None
+        if len(ratios) != len(CycleBudget.PHASE_NAMES) or any(ratio < 0 for ratio in ratios) or sum(ratios) <= 0:
+            return None
+        return {phase: ratio / sum(ratios) for phase, ratio in zip(CycleBudget.PHASE_NAMES, ratios)}
 
-            logger.info(f"即将针对站点 {', '.join(site.name for site in site_infos)} 开始刷流")
+    def __track_cycle_budget(self, phase: str, site_name: str = None):
+        """
+        统计刷流周期各阶段及站点的耗时，不在刷流周期内时不统计
+        """
+        if not self._cycle_budget:
+            return nullcontext()
+        return self._cycle_budget.track(phase=phase, site_name=site_name)
 
-            # 获取订阅标题
-            subscribe_titles = self.__get_subscribe_titles()
+    def __is_cycle_budget_exhausted(self, phase: str = None) -> bool:
+        """
+        判断刷流周期时间预算是否耗尽
+        """
+        return bool(self._cycle_budget and self._cycle_budget.exhausted(phase=phase))
 
-            # 处理所有站点
-            for site in site_infos:
-                # 如果站点刷流没有正确响应，说明没有通过前置条件，其他站点也不需要继续刷流了
-                if not self.__brush_site_torrents(siteid=site.id, torrent_tasks=torrent_tasks,
-                                                  statistic_info=statistic_info,
-                                                  subscribe_titles=subscribe_titles):
-                    logger.info(f"站点 {site.name} 刷流中途结束，停止后续刷流")
-                    break
-                else:
-                    logger.info(f"站点 {site.name} 刷流完成")
+    def __get_site_breaker(self, site_id: int, site_name: str) -> SiteCircuitBreaker:
+        """
+        获取站点熔断器，首次获取时从插件数据中恢复
+        """
+        with self._site_breakers_lock:
+            if self._site_breakers is None:
+                breakers_data: Dict[str, dict] = self.get_data("breakers") or {}
+                self._site_breakers = {key: self.__create_site_breaker(data=value)
+                                       for key, value in breakers_data.items()}
+            breaker = self._site_breakers.get(str(site_id))
+            if not breaker:
+                breaker = self.__create_site_breaker()
+                self._site_breakers[str(site_id)] = breaker
+            breaker.site_name = site_name
+            return breaker
+
+    def __create_site_breaker(self, data: dict = None) -> SiteCircuitBreaker:
+        return SiteCircuitBreaker(data=data, threshold=self._breaker_failure_threshold,
+                                  base_cooldown=self._breaker_base_cooldown, max_cooldown=self._breaker_max_cooldown)
+
+    def __record_site_success(self, site_id: int, site_name: str):
+        """
+        记录站点请求成功
+        """
+        breaker = self.__get_site_breaker(site_id=site_id, site_name=site_name)
+        if breaker.state != SiteCircuitBreaker.CLOSED:
+            logger.info(f"站点 {site_name} 请求恢复正常，解除熔断")
+        breaker.record_success()
 
-            # 保存数据
-            self.save_data("torrents", torrent_tasks)
-            # 保存统计数据
-            self.save_data("statistic", statistic_info)
-            logger.info(f"刷流任务执行完成")
+    def __record_site_failure(self, site_id: int, site_name: str, error: str):
+        """
+        记录站点请求失败，连续失败达到阈值时熔断站点
+        """
+        breaker = self.__get_site_breaker(site_id=site_id, site_name=site_name)
+        if breaker.record_failure(error=error):
+            logger.warning(f"站点 {site_name} 连续失败 {breaker.failures} 次，"
+                           f"熔断 {breaker.cooldown / 60:.0f} 分钟，最近错误：{error}")
 
-    def __brush_site_torrents(self, siteid, torrent_tasks: Dict[str, dict], statistic_info: Dict[str, int],
-                              subscribe_titles: Set[str]) -> bool:
+    def __save_site_breakers(self):
+        """
+        保存站点熔断状态，仅保存存在失败记录的站点
+        """
+        with self._site_breakers_lock:
+            if self._site_breakers is None:
+                return
+            breakers_data = {key: breaker.to_dict() for key, breaker in self._site_breakers.items()
+                             if breaker.failures or breaker.state != SiteCircuitBreaker.CLOSED}
+        self.save_data("breakers", breakers_data)
+
+    def __brush_site_torrents(self, siteinfo: Any, torrents: Optional[List[TorrentInfo]],
+                              torrent_tasks: Dict[str, dict], task_index: TorrentTaskIndex,
+                              site_state: SiteBrowseState, statistic_info: Dict[str, int],
+                              subscribe_matcher: KeywordMatcher) -> bool:
         """
         针对站点进行刷流
         """
-        siteinfo = self.site_oper.get(siteid)
-        if not siteinfo:
-            logger.warning(f"站点不存在：{siteid}")
+        with self.__track_cycle_budget(phase="evaluate", site_name=siteinfo.name):
+            torrents = self.__prepare_site_torrents(siteinfo=siteinfo, torrents=torrents, site_state=site_state,
+                                                    subscribe_matcher=subscribe_matcher)
+        if not torrents:
             return True
 
-        logger.info(f"开始获取站点 {siteinfo.name} 的新种子 ...")
-        torrents = self.torrents_chain.browse(domain=siteinfo.domain)
+        # 每个站点开始前与下载器同步一次下载中任务数
+        self.__sync_downloading_count()
+
+        candidates = ((siteinfo, torrent) for torrent in
+                      self.__iterate_site_candidates(siteinfo=siteinfo, torrents=torrents, task_index=task_index,
+                                                     site_state=site_state))
+        if not self.__admit_candidates(candidates=candidates, torrent_tasks=torrent_tasks, task_index=task_index,
+                                       statistic_info=statistic_info):
+            return False
+        # 评估中途超出时间预算时，站点视为未完成，推迟到下个周期
+        return not self.__is_cycle_budget_exhausted(phase="evaluate")
+
+    def __brush_ranked_torrents(self, site_infos: List[Any], site_torrents: Dict[int, List[TorrentInfo]],
+                                torrent_tasks: Dict[str, dict], task_index: TorrentTaskIndex,
+                                site_states: Dict[int, SiteBrowseState], statistic_info: Dict[str, int],
+                                subscribe_matcher: KeywordMatcher) -> List[Any]:
+        """
+        汇总所有站点通过刷流条件的种子，按种子价值评分降序依次添加，直至没有空闲的下载任务数或达到保种体积
+
+        :return: 超出时间预算而推迟的站点
+        """
+        scored_candidates = []
+        deferred_site_infos = []
+        for index, site in enumerate(site_infos):
+            # 超出评估种子的时间预算时，当前及剩余站点推迟到下个周期，已汇总的种子仍然参与本次刷流
+            if self.__is_cycle_budget_exhausted(phase="evaluate"):
+                deferred_site_infos = site_infos[index:]
+                break
+            with self.__track_cycle_budget(phase="evaluate", site_name=site.name):
+                torrents = self.__prepare_site_torrents(siteinfo=site, torrents=site_torrents.get(site.id),
+                                                        site_state=site_states[site.id],
+                                                        subscribe_matcher=subscribe_matcher)
+                if not torrents:
+                    continue
+                for torrent in self.__iterate_site_candidates(siteinfo=site, torrents=torrents,
+                                                              task_index=task_index,
+                                                              site_state=site_states[site.id]):
+                    scored_candidates.append((self.__score_torrent(torrent), site, torrent))
+            if self.__is_cycle_budget_exhausted(phase="evaluate"):
+                deferred_site_infos = site_infos[index:]
+                break
+
+        if not scored_candidates:
+            logger.info("没有通过刷流条件的种子")
+            return deferred_site_infos
+
+        scored_candidates.sort(key=lambda x: x[0], reverse=True)
+        logger.info(f"通过刷流条件的种子共 {len(scored_candidates)} 个，按种子价值评分排序：" +
+                    "，".join(f"{torrent.site_name}|{torrent.title}({score:.2f})"
+                             for score, _, torrent in scored_candidates[:10]))
+
+        self.__sync_downloading_count()
+
+        if self.__get_brush_config().brush_strategy == "knapsack":
+            scored_candidates = self.__select_candidates_by_knapsack(scored_candidates=scored_candidates,
+                                                                     torrent_tasks=torrent_tasks)
+
+        candidates = ((site, torrent) for _, site, torrent in scored_candidates)
+        self.__admit_candidates(candidates=candidates, torrent_tasks=torrent_tasks, task_index=task_index,
+                                statistic_info=statistic_info, recheck=True)
+        return deferred_site_infos
+
+    def __select_candidates_by_knapsack(self, scored_candidates: List[Tuple[float, Any, TorrentInfo]],
+                                        torrent_tasks: Dict[str, dict]) -> List[Tuple[float, Any, TorrentInfo]]:
+        """
+        在剩余保种体积及空闲下载任务数内，按0/1背包选择总评分最高的种子组合，返回按评分降序排列的已选种子
+        """
+        brush_config = self.__get_brush_config()
+        if not brush_config.disksize:
+            logger.info("没有设置保种体积，按种子价值评分顺序刷流")
+            return scored_candidates
+
+        torrents_size = self.__calculate_seeding_torrents_size(torrent_tasks=torrent_tasks)
+        budget = float(brush_config.disksize) * 1024 ** 3 - torrents_size
+        if budget <= 0:
+            return []
+
+        max_count = None
+        if brush_config.maxdlcount:
+            max_count = max(int(brush_config.maxdlcount) - self.__get_local_downloading_count(), 0)
+            if not max_count:
+                return []
+
+        candidates = scored_candidates[:self._knapsack_max_candidates]
+        selected_indexes = self.__solve_knapsack(items=[(score, torrent.size or 0) for score, _, torrent in candidates],
+                                                 budget=budget, max_count=max_count, buckets=self._knapsack_buckets)
+        selected = [candidates[index] for index in sorted(selected_indexes)]
+
+        selected_size = sum(torrent.size or 0 for _, _, torrent in selected)
+        logger.info(f"保种体积最优组合已选择种子 {len(selected)} 个，"
+                    f"总评分 {sum(score for score, _, _ in selected):.2f}，"
+                    f"体积 {self.__bytes_to_gb(selected_size):.1f} GB，"
+                    f"剩余保种体积 {self.__bytes_to_gb(budget):.1f} GB，利用率 {selected_size / budget:.1%}，"
+                    f"空闲下载任务数 {max_count if max_count is not None else '不限'}：" +
+                    "，".join(f"{torrent.site_name}|{torrent.title}({score:.2f})" for score, _, torrent in selected))
+        return selected
+
+    @staticmethod
+    def __solve_knapsack(items: List[Tuple[float, float]], budget: float, max_count: Optional[int],
+                         buckets: int) -> List[int]:
+        """
+        0/1背包求解，体积按剩余保种体积划分为buckets份并向上取整，保证所选组合不超过预算
+
+        :param items: (评分, 体积) 列表
+        :param budget: 剩余保种体积
+        :param max_count: 最多选择的数量，None表示不限制
+        :param buckets: 体积划分份数
+        :return: 已选择的下标列表
+        """
+        if not items or budget <= 0:
+            return []
+        unit = budget / buckets
+        weights = [max(1, math.ceil(size / unit)) for _, size in items]
+        limited = max_count is not None
+        max_layer = min(max_count, len(items)) if limited else 0
+        width = buckets + 1
+        # dp[c][x]：选择c个（不限制数量时仅使用第0层）、占用x份体积时的最大评分，-1表示不可达
+        dp = [[-1.0] * width for _ in range(max_layer + 1)]
+        dp[0][0] = 0.0
+        keeps = []
+        for (score, _), weight in zip(items, weights):
+            keep = bytearray((max_layer + 1) * width)
+            for layer in (range(max_layer, 0, -1) if limited else [0]):
+                prev, cur = dp[layer - 1] if limited else dp[0], dp[layer]
+                for x in range(buckets, weight - 1, -1):
+                    value = prev[x - weight]
+                    if value >= 0 and value + score > cur[x]:
+                        cur[x] = value + score
+                        keep[layer * width + x] = 1
+            keeps.append(keep)
+
+        best_value, best_layer, best_x = 0.0, 0, 0
+        for layer in range(max_layer + 1):
+            for x in range(width):
+                if dp[layer][x] > best_value:
+                    best_value, best_layer, best_x = dp[layer][x], layer, x
+
+        selected = []
+        layer, x = best_layer, best_x
+        for index in range(len(items) - 1, -1, -1):
+            if keeps[index][layer * width + x]:
+                selected.append(index)
+                x -= weights[index]
+                if limited:
+                    layer -= 1
+        return selected
+
+    def __prepare_site_torrents(self, siteinfo: Any, torrents: Optional[List[TorrentInfo]],
+                                site_state: SiteBrowseState, subscribe_matcher: KeywordMatcher) \
+            -> List[TorrentInfo]:
+        """
+        预处理站点种子，排除包含订阅的种子，按发布日期降序排列，并更新站点增量浏览状态
+        """
         if not torrents:
             logger.info(f"站点 {siteinfo.name} 没有获取到种子")
-            return True
+            return []
 
         brush_config = self.__get_brush_config(sitename=siteinfo.name)
 
@@ -2143,25 +4319,126 @@ class BrushFlowLowFreq(_PluginBase):
 
         # 排除包含订阅的种子
         if brush_config.except_subscribe:
-            torrents = self.__filter_torrents_contains_subscribe(torrents=torrents, subscribe_titles=subscribe_titles)
+            torrents = self.__filter_torrents_contains_subscribe(torrents=torrents,
+                                                                 subscribe_matcher=subscribe_matcher)
 
         # 按发布日期降序排列
         torrents.sort(key=lambda x: x.pubdate or '', reverse=True)
 
+        # 站点配置变更时，之前排除的种子需要重新评估
+        site_state.reset_if_config_changed(config_fingerprint=self.__get_stable_conditions_fingerprint(brush_config))
+        new_count = site_state.count_above_watermark(torrents=torrents)
+
+        logger.info(f"站点 {siteinfo.name} 正在准备种子刷流，数量 {len(torrents)}，新发布种子数 {new_count}")
+        return torrents
+
+    def __iterate_site_candidates(self, siteinfo: Any, torrents: List[TorrentInfo], task_index: TorrentTaskIndex,
+                                  site_state: SiteBrowseState) -> Iterator[TorrentInfo]:
+        """
+        遍历站点种子，返回通过刷流条件的种子
+        """
+        brush_config = self.__get_brush_config(sitename=siteinfo.name)
+        rejected_count = 0
+        settled_count = 0
+        completed = True
+
+        for torrent in self.__iterate_torrents_within_pubtime(torrents=torrents, brush_config=brush_config):
+            # 超出评估种子的时间预算时停止评估，站点推迟到下个周期
+            if self.__is_cycle_budget_exhausted(phase="evaluate"):
+                logger.info(f"刷流周期超出评估种子的时间预算，站点 {siteinfo.name} 停止评估剩余种子")
+                completed = False
+                break
+
+            # 按种子统计评估耗时，统计范围不跨越yield，避免将添加下载任务的耗时计入评估阶段
+            with self.__track_cycle_budget(phase="evaluate", site_name=siteinfo.name):
+                passed = False
+                if site_state.is_settled_below_watermark(torrent):
+                    # 跳过不晚于高水位且信息没有变化的种子，之前的周期已处理完毕
+                    settled_count += 1
+                elif site_state.is_rejected(torrent):
+                    # 跳过之前已因稳定原因排除且信息没有变化的种子
+                    rejected_count += 1
+                else:
+                    passed = self.__evaluate_site_candidate(torrent=torrent, task_index=task_index,
+                                                            site_state=site_state)
+            if passed:
+                yield torrent
+
+        # 站点种子全部评估完成后才允许推进高水位
+        if completed:
+            site_state.complete_pass(torrents)
+
+        if settled_count:
+            logger.info(f"站点 {siteinfo.name} 跳过不晚于高水位 {site_state.watermark} 的种子 {settled_count} 个")
+        if rejected_count:
+            logger.info(f"站点 {siteinfo.name} 跳过之前已排除且信息没有变化的种子 {rejected_count} 个")
+
+    def __evaluate_site_candidate(self, torrent: TorrentInfo, task_index: TorrentTaskIndex,
+                                  site_state: SiteBrowseState) -> bool:
+        """
+        评估种子能否通过刷流条件，未通过稳定条件的种子记录到站点浏览状态，后续周期不再重复评估
+        """
+        logger.debug(f"种子详情：{torrent}")
+
+        # 判断能否通过稳定刷流条件
+        stable_condition_passed, reason = self.__evaluate_stable_conditions_for_brush(torrent=torrent)
+        self.__log_brush_conditions(passed=stable_condition_passed, reason=reason, torrent=torrent)
+        if not stable_condition_passed:
+            site_state.reject(torrent)
+            return False
+
+        # 判断能否通过刷流条件
+        condition_passed, reason = self.__evaluate_conditions_for_brush(torrent=torrent, task_index=task_index)
+        self.__log_brush_conditions(passed=condition_passed, reason=reason, torrent=torrent)
+        return condition_passed
+
+    def __advance_site_watermarks(self, site_infos: List[Any], site_states: Dict[int, SiteBrowseState],
+                                  task_index: TorrentTaskIndex):
+        """
+        推进站点高水位，已因稳定原因排除、已在刷流任务中以及超出发布时间上限的种子视为处理完毕，
+        通过条件但尚未添加、做种人数或发布时间暂不满足的种子后续周期仍需重新评估，
+        已排除的种子在高水位之下仍保留指纹，信息发生变化时重新评估
+        """
+        for site in site_infos:
+            site_state = site_states[site.id]
+            brush_config = self.__get_brush_config(sitename=site.name)
+            pubtime_upper = brush_config.pubtime_range.upper if brush_config.pubtime_range else None
+
+            def is_settled(torrent: TorrentInfo) -> bool:
+                if site_state.is_rejected(torrent):
+                    return True
+                if task_index.contains_title(site_name=torrent.site_name, title=torrent.title):
+                    return True
+                if torrent.page_url and task_index.contains_page_url(site_name=torrent.site_name,
+                                                                     page_url=torrent.page_url):
+                    return True
+                return pubtime_upper is not None and self.__get_pubminutes(torrent.pubdate) > pubtime_upper
+
+            if site_state.advance_watermark(is_settled=is_settled):
+                logger.debug(f"站点 {site.name} 高水位推进至 {site_state.watermark}")
+
+    def __admit_candidates(self, candidates: Iterator[Tuple[Any, TorrentInfo]], torrent_tasks: Dict[str, dict],
+                           task_index: TorrentTaskIndex, statistic_info: Dict[str, int],
+                           recheck: bool = False) -> bool:
+        """
+        依次添加候选种子，没有通过刷流前置条件或超出时间预算时返回False
+
+        :param recheck: 是否在添加前重新校验刷流条件，候选种子预先汇总时，其他种子添加后可能导致重复
+        """
         torrents_size = self.__calculate_seeding_torrents_size(torrent_tasks=torrent_tasks)
 
-        logger.info(f"正在准备种子刷流，数量 {len(torrents)}")
+        for siteinfo, torrent in candidates:
+            # 超出时间预算时停止添加，剩余种子在下个周期重新评估
+            if self.__is_cycle_budget_exhausted(phase="fetch") or self.__is_cycle_budget_exhausted(phase="add"):
+                logger.info(f"刷流周期超出时间预算，停止添加种子")
+                return False
 
-        # 过滤种子
-        for torrent in torrents:
             # 判断能否通过刷流前置条件
             pre_condition_passed, reason = self.__evaluate_pre_conditions_for_brush(include_network_conditions=False)
             self.__log_brush_conditions(passed=pre_condition_passed, reason=reason)
             if not pre_condition_passed:
                 return False
 
-            logger.debug(f"种子详情：{torrent}")
-
             # 判断能否通过保种体积刷流条件
             size_condition_passed, reason = self.__evaluate_size_condition_for_brush(torrents_size=torrents_size,
                                                                                      add_torrent_size=torrent.size)
@@ -2169,70 +4446,129 @@ class BrushFlowLowFreq(_PluginBase):
             if not size_condition_passed:
                 continue
 
-            # 判断能否通过刷流条件
-            condition_passed, reason = self.__evaluate_conditions_for_brush(torrent=torrent,
-                                                                            torrent_tasks=torrent_tasks)
-            self.__log_brush_conditions(passed=condition_passed, reason=reason, torrent=torrent)
-            if not condition_passed:
-                continue
+            if recheck:
+                condition_passed, reason = self.__evaluate_conditions_for_brush(torrent=torrent,
+                                                                                task_index=task_index)
+                self.__log_brush_conditions(passed=condition_passed, reason=reason, torrent=torrent)
+                if not condition_passed:
+                    continue
 
             # 添加下载任务
-            hash_string = self.__download(torrent=torrent)
-            if not hash_string:
-                logger.warning(f"{torrent.title} 添加刷流任务失败！")
+            if not self.__add_brush_torrent(siteinfo=siteinfo, torrent=torrent, torrent_tasks=torrent_tasks,
+                                            task_index=task_index, statistic_info=statistic_info):
                 continue
 
-            # 触发刷流下载时间并保存任务信息
-            torrent_task = {
-                "site": siteinfo.id,
-                "site_name": siteinfo.name,
-                "title": torrent.title,
-                "size": torrent.size,
-                "pubdate": torrent.pubdate,
-                # "site_cookie": torrent.site_cookie,
-                # "site_ua": torrent.site_ua,
-                # "site_proxy": torrent.site_proxy,
-                # "site_order": torrent.site_order,
-                "description": torrent.description,
-                "imdbid": torrent.imdbid,
-                # "enclosure": torrent.enclosure,
-                "page_url": torrent.page_url,
-                # "seeders": torrent.seeders,
-                # "peers": torrent.peers,
-                # "grabs": torrent.grabs,
-                "date_elapsed": torrent.date_elapsed,
-                "freedate": torrent.freedate,
-                "uploadvolumefactor": torrent.uploadvolumefactor,
-                "downloadvolumefactor": torrent.downloadvolumefactor,
-                "hit_and_run": torrent.hit_and_run or brush_config.site_hr_active,
-                "volume_factor": torrent.volume_factor,
-                "freedate_diff": torrent.freedate_diff,
-                # "labels": torrent.labels,
-                # "pri_order": torrent.pri_order,
-                # "category": torrent.category,
-                "ratio": 0,
-                "downloaded": 0,
-                "uploaded": 0,
-                "seeding_time": 0,
-                "deleted": False,
-                "time": time.time()
-            }
+            torrents_size += torrent.size
 
-            self.eventmanager.send_event(etype=EventType.PluginTriggered, data={
-                "plugin_id": self.__class__.__name__,
-                "event_name": "brushflow_download_added",
-                "hash": hash_string,
-                "data": torrent_task,
-                "downloader": self.service_info.name
-            })
-            torrent_tasks[hash_string] = torrent_task
+        return True
 
-            # 统计数据
-            torrents_size += torrent.size
-            statistic_info["count"] += 1
-            logger.info(f"站点 {siteinfo.name}，新增刷流种子下载：{torrent.title}|{torrent.description}")
-            self.__send_add_message(torrent)
+    def __score_torrent(self, torrent: TorrentInfo) -> float:
+        """
+        评估种子的预期上传价值，综合考虑：
+        - 供需关系：(下载人数 + 完成次数 * 0.1 + 1) / (做种人数 + 1)，需求越大、做种越少，上传机会越多
+        - 种子大小：按大小的平方根计算，大种子上传空间更大，但下载耗时和占用体积也更多
+        - 促销：上传系数加成，非免费种子减半，免费剩余时间不足1小时时按剩余时间比例衰减
+        - 发布时间：按半衰期指数衰减，越新的种子上传机会越多
+        """
+        seeders = max(torrent.seeders or 0, 0)
+        peers = max(torrent.peers or 0, 0)
+        grabs = max(torrent.grabs or 0, 0)
+        swarm_factor = (peers + grabs * 0.1 + 1) / (seeders + 1)
+
+        size_factor = math.sqrt(max(self.__bytes_to_gb(torrent.size), 0.1))
+
+        promotion_factor = torrent.uploadvolumefactor if torrent.uploadvolumefactor is not None else 1
+        if torrent.downloadvolumefactor != 0:
+            promotion_factor *= 0.5
+        else:
+            free_minutes_left = self.__get_free_minutes_left(torrent.freedate)
+            if free_minutes_left is not None:
+                promotion_factor *= min(max(free_minutes_left, 0) / 60, 1)
+
+        age_factor = 0.5 ** (max(self.__get_pubminutes(torrent.pubdate), 0) / self._score_age_half_life)
+
+        return swarm_factor * size_factor * promotion_factor * age_factor
+
+    @staticmethod
+    def __get_free_minutes_left(freedate: Optional[str]) -> Optional[float]:
+        """
+        获取免费剩余时间（分钟），没有免费截止时间或无法解析时返回None
+        """
+        if not freedate:
+            return None
+        try:
+            freedate_time = datetime.strptime(freedate.replace("T", " ").replace("Z", ""), "%Y-%m-%d %H:%M:%S")
+            return (freedate_time - datetime.now()).total_seconds() / 60
+        except (ValueError, TypeError):
+            return None
+
+    def __add_brush_torrent(self, siteinfo: Any, torrent: TorrentInfo, torrent_tasks: Dict[str, dict],
+                            task_index: TorrentTaskIndex, statistic_info: Dict[str, int]) -> bool:
+        """
+        添加刷流下载任务并保存任务信息
+        """
+        brush_config = self.__get_brush_config(sitename=siteinfo.name)
+
+        with self.__track_cycle_budget(phase="add", site_name=siteinfo.name):
+            hash_string = self.__download(torrent=torrent)
+        if not hash_string:
+            logger.warning(f"{torrent.title} 添加刷流任务失败！")
+            return False
+
+        # 添加成功后不会再次下载，移除缓存的种子文件
+        self.__get_torrent_cache().remove(site=torrent.site_name, url=torrent.enclosure)
+
+        # 触发刷流下载时间并保存任务信息
+        torrent_task = {
+            "site": siteinfo.id,
+            "site_name": siteinfo.name,
+            "title": torrent.title,
+            "size": torrent.size,
+            "pubdate": torrent.pubdate,
+            # "site_cookie": torrent.site_cookie,
+            # "site_ua": torrent.site_ua,
+            # "site_proxy": torrent.site_proxy,
+            # "site_order": torrent.site_order,
+            "description": torrent.description,
+            "imdbid": torrent.imdbid,
+            # "enclosure": torrent.enclosure,
+            "page_url": torrent.page_url,
+            # "seeders": torrent.seeders,
+            # "peers": torrent.peers,
+            # "grabs": torrent.grabs,
+            "date_elapsed": torrent.date_elapsed,
+            "freedate": torrent.freedate,
+            "uploadvolumefactor": torrent.uploadvolumefactor,
+            "downloadvolumefactor": torrent.downloadvolumefactor,
+            "hit_and_run": torrent.hit_and_run or brush_config.site_hr_active,
+            "volume_factor": torrent.volume_factor,
+            "freedate_diff": torrent.freedate_diff,
+            # "labels": torrent.labels,
+            # "pri_order": torrent.pri_order,
+            # "category": torrent.category,
+            "ratio": 0,
+            "downloaded": 0,
+            "uploaded": 0,
+            "seeding_time": 0,
+            "deleted": False,
+            "time": time.time()
+        }
 
+        self.eventmanager.send_event(etype=EventType.PluginTriggered, data={
+            "plugin_id": self.__class__.__name__,
+            "event_name": "brushflow_download_added",
+            "hash": hash_string,
+            "data": torrent_task,
+            "downloader": self.service_info.name
+        })
+        torrent_tasks[hash_string] = torrent_task
+        task_index.add(torrent_hash=hash_string, torrent_task=torrent_task)
+        self.__increase_downloading_count()
+
+        # 统计数据
+        statistic_info["count"] += 1
+        logger.info(f"站点 {siteinfo.name}，新增刷流种子下载：{torrent.title}|{torrent.description}")
+        self.__send_add_message(torrent)
         return True
 
     def __evaluate_size_condition_for_brush(self, torrents_size: float,
@@ -2244,9 +4580,8 @@ class BrushFlowLowFreq(_PluginBase):
 
         # 如果没有明确指定增加的种子大小，则检查配置中是否有种子大小下限，如果有，使用这个大小作为增加的种子大小
         preset_condition = False
-        if not add_torrent_size and brush_config.size:
-            size_limits = [float(size) * 1024 ** 3 for size in brush_config.size.split("-")]
-            add_torrent_size = size_limits[0]  # 使用配置的种子大小下限
+        if not add_torrent_size and brush_config.size_range and brush_config.size_range.lower:
+            add_torrent_size = brush_config.size_range.lower  # 使用配置的种子大小下限
             preset_condition = True
 
         total_size = self.__bytes_to_gb(torrents_size + add_torrent_size)  # 预计总做种体积
@@ -2286,7 +4621,7 @@ class BrushFlowLowFreq(_PluginBase):
         前置过滤不符合条件的种子
         """
         reasons = [
-            ("maxdlcount", lambda config: self.__get_downloading_count() >= int(config),
+            ("maxdlcount", lambda config: self.__get_local_downloading_count() >= int(config),
              lambda config: f"当前同时下载任务数已达到最大值 {config}，暂时停止新增任务")
         ]
 
@@ -2312,31 +4647,12 @@ class BrushFlowLowFreq(_PluginBase):
 
         return True, None
 
-    def __evaluate_conditions_for_brush(self, torrent, torrent_tasks) -> Tuple[bool, Optional[str]]:
+    def __evaluate_stable_conditions_for_brush(self, torrent) -> Tuple[bool, Optional[str]]:
         """
-        过滤不符合条件的种子
+        过滤不符合稳定条件的种子，稳定条件仅与种子自身信息及站点配置相关，不随时间变化
         """
         brush_config = self.__get_brush_config(torrent.site_name)
 
-        # 排除重复种子
-        # 默认根据标题和站点名称进行排除
-        task_key = f"{torrent.site_name}{torrent.title}"
-        if any(task_key == f"{task.get('site_name')}{task.get('title')}" for task in torrent_tasks.values()):
-            return False, "重复种子"
-
-        # 部分站点标题会上新时携带后缀，这里进一步根据种子详情地址进行排除
-        if torrent.page_url:
-            task_page_url = f"{torrent.site_name}{torrent.page_url}"
-            if any(task_page_url == f"{task.get('site_name')}{task.get('page_url')}" for task in
-                   torrent_tasks.values()):
-                return False, "重复种子"
-
-        # 不同站点如果遇到相同种子，判断前一个种子是否已经在做种，否则排除处理
-        if torrent.title:
-            if any(torrent.site_name != f"{task.get('site_name')}" and torrent.title == f"{task.get('title')}"
-                   and not task.get("seed_time") for task in torrent_tasks.values()):
-                return False, "其他站点存在尚未下载完成的相同种子"
-
         # 促销条件
         if brush_config.freeleech and torrent.downloadvolumefactor != 0:
             return False, "非免费种子"
@@ -2348,53 +4664,71 @@ class BrushFlowLowFreq(_PluginBase):
             return False, "存在H&R"
 
         # 包含规则
-        if brush_config.include and not (
-                re.search(brush_config.include, torrent.title, re.I) or re.search(brush_config.include,
-                                                                                  torrent.description, re.I)):
+        include_pattern = brush_config.include_pattern
+        if include_pattern and not (include_pattern.search(torrent.title or "")
+                                    or include_pattern.search(torrent.description or "")):
             return False, "不符合包含规则"
 
         # 排除规则
-        if brush_config.exclude and (
-                re.search(brush_config.exclude, torrent.title, re.I) or re.search(brush_config.exclude,
-                                                                                  torrent.description, re.I)):
+        exclude_pattern = brush_config.exclude_pattern
+        if exclude_pattern and (exclude_pattern.search(torrent.title or "")
+                                or exclude_pattern.search(torrent.description or "")):
             return False, "符合排除规则"
 
-        # 种子大小（GB）
-        if brush_config.size:
-            sizes = [float(size) * 1024 ** 3 for size in brush_config.size.split("-")]
-            if len(sizes) == 1 and torrent.size < sizes[0]:
-                return False, f"种子大小 {self.__bytes_to_gb(torrent.size):.1f} GB，不符合条件"
-            elif len(sizes) > 1 and not sizes[0] <= torrent.size <= sizes[1]:
+        # 种子大小（GB），单个值：种子大小大于等于该值；范围值：种子大小在范围内（包括边界）
+        size_range = brush_config.size_range
+        if size_range and not size_range.contains(torrent.size):
+            if size_range.is_range:
                 return False, f"种子大小 {self.__bytes_to_gb(torrent.size):.1f} GB，不在指定范围内"
+            return False, f"种子大小 {self.__bytes_to_gb(torrent.size):.1f} GB，不符合条件"
 
-        # 做种人数
-        if brush_config.seeder:
-            seeders_range = [float(n) for n in brush_config.seeder.split("-")]
-            # 检查是否仅指定了一个数字，即做种人数需要小于等于该数字
-            if len(seeders_range) == 1:
-                # 当做种人数大于该数字时，不符合条件
-                if torrent.seeders > seeders_range[0]:
-                    return False, f"做种人数 {torrent.seeders}，超过单个指定值"
-            # 如果指定了一个范围
-            elif len(seeders_range) > 1:
-                # 检查做种人数是否在指定的范围内（包括边界）
-                if not (seeders_range[0] <= torrent.seeders <= seeders_range[1]):
-                    return False, f"做种人数 {torrent.seeders}，不在指定范围内"
-
-        # 发布时间
-        pubdate_minutes = self.__get_pubminutes(torrent.pubdate)
-        # 已支持独立站点配置，取消单独适配站点时区逻辑，可通过配置项「pubtime」自行适配
-        # pubdate_minutes = self.__adjust_site_pubminutes(pubdate_minutes, torrent)
-        if brush_config.pubtime:
-            pubtimes = [float(n) for n in brush_config.pubtime.split("-")]
-            if len(pubtimes) == 1:
-                # 单个值：选择发布时间小于等于该值的种子
-                if pubdate_minutes > pubtimes[0]:
-                    return False, f"发布时间 {torrent.pubdate}，{pubdate_minutes:.0f} 分钟前，不符合条件"
-            else:
-                # 范围值：选择发布时间在范围内的种子
-                if not (pubtimes[0] <= pubdate_minutes <= pubtimes[1]):
+        return True, None
+
+    @staticmethod
+    def __get_stable_conditions_fingerprint(brush_config: BrushConfig) -> str:
+        """
+        获取稳定条件相关配置的指纹，发布时间影响高水位的推进，一并计入
+        """
+        return hashlib.md5(f"{brush_config.freeleech}|{brush_config.hr}|{brush_config.include}|"
+                           f"{brush_config.exclude}|{brush_config.size}|"
+                           f"{brush_config.pubtime}".encode("utf-8")).hexdigest()
+
+    def __evaluate_conditions_for_brush(self, torrent, task_index: TorrentTaskIndex) -> Tuple[bool, Optional[str]]:
+        """
+        过滤不符合条件的种子，稳定条件已在 __evaluate_stable_conditions_for_brush 中校验
+        """
+        brush_config = self.__get_brush_config(torrent.site_name)
+
+        # 排除重复种子
+        # 默认根据标题和站点名称进行排除
+        if task_index.contains_title(site_name=torrent.site_name, title=torrent.title):
+            return False, "重复种子"
+
+        # 部分站点标题会上新时携带后缀，这里进一步根据种子详情地址进行排除
+        if torrent.page_url and task_index.contains_page_url(site_name=torrent.site_name, page_url=torrent.page_url):
+            return False, "重复种子"
+
+        # 不同站点如果遇到相同种子，判断前一个种子是否已经在做种，否则排除处理
+        if torrent.title and task_index.has_unseeded_in_other_sites(site_name=torrent.site_name, title=torrent.title):
+            return False, "其他站点存在尚未下载完成的相同种子"
+
+        # 做种人数，单个值：做种人数小于等于该值；范围值：做种人数在范围内（包括边界）
+        seeder_range = brush_config.seeder_range
+        if seeder_range and not seeder_range.contains(torrent.seeders):
+            if seeder_range.is_range:
+                return False, f"做种人数 {torrent.seeders}，不在指定范围内"
+            return False, f"做种人数 {torrent.seeders}，超过单个指定值"
+
+        # 发布时间，单个值：选择发布时间小于等于该值的种子；范围值：选择发布时间在范围内的种子
+        pubtime_range = brush_config.pubtime_range
+        if pubtime_range:
+            pubdate_minutes = self.__get_pubminutes(torrent.pubdate)
+            # 已支持独立站点配置，取消单独适配站点时区逻辑，可通过配置项「pubtime」自行适配
+            # pubdate_minutes = self.__adjust_site_pubminutes(pubdate_minutes, torrent)
+            if not pubtime_range.contains(pubdate_minutes):
+                if pubtime_range.is_range:
                     return False, f"发布时间 {torrent.pubdate}，{pubdate_minutes:.0f} 分钟前，不在指定范围内"
+                return False, f"发布时间 {torrent.pubdate}，{pubdate_minutes:.0f} 分钟前，不符合条件"
 
         return True, None
 
@@ -2427,11 +4761,14 @@ class BrushFlowLowFreq(_PluginBase):
 
         with lock:
             logger.info("开始检查刷流下载任务 ...")
+            # 每个周期重新构建站点索引器索引，新增或修改的站点及时生效，未找到站点的域名查找结果不跨周期沿用
+            self._indexer_index = None
             torrent_tasks: Dict[str, dict] = self.get_data("torrents") or {}
             unmanaged_tasks: Dict[str, dict] = self.get_data("unmanaged") or {}
 
             downloader = self.downloader
-            seeding_torrents, error = downloader.get_torrents()
+            seeding_torrents, error = self.__get_check_torrents(downloader=downloader,
+                                                                torrent_hashes=set(torrent_tasks.keys()))
             if error:
                 logger.warning("连接下载器出错，将在下个时间周期重试")
                 return
@@ -2449,8 +4786,9 @@ class BrushFlowLowFreq(_PluginBase):
 
             logger.info(f"共有 {len(torrent_check_hashes)} 个任务正在刷流，开始检查任务状态")
 
-            # 获取到当前所有做种数据中需要被检查的种子数据
-            check_torrents = [seeding_torrents_dict[th] for th in torrent_check_hashes if th in seeding_torrents_dict]
+            # 获取到当前所有做种数据中需要被检查的种子数据，每个种子仅生成一次快照，后续检查环节均复用
+            check_torrents = [self.__get_torrent_info(seeding_torrents_dict[th])
+                              for th in torrent_check_hashes if th in seeding_torrents_dict]
 
             # 先更新刷流任务的最新状态，上下传，分享率
             self.__update_torrent_tasks_state(torrents=check_torrents, torrent_tasks=torrent_tasks)
@@ -2486,7 +4824,7 @@ class BrushFlowLowFreq(_PluginBase):
                 need_delete_hashes = []
 
                 # 如果配置了动态删除以及删种阈值，则根据动态删种进行分组处理
-                if brush_config.proxy_delete and brush_config.delete_size_range:
+                if brush_config.proxy_delete and brush_config.delete_size_limits:
                     logger.info("已开启动态删种，按系统默认动态删种条件开始检查任务")
                     proxy_delete_hashes = self.__delete_torrent_for_proxy(torrents=check_torrents,
                                                                           torrent_tasks=torrent_tasks) or []
@@ -2500,7 +4838,7 @@ class BrushFlowLowFreq(_PluginBase):
 
                 if need_delete_hashes:
                     # 如果是QB，则重新汇报Tracker
-                    if self.downloader_helper.is_downloader("qbittorrent", service=self.service_info):
+                    if self.__is_qbittorrent():
                         self.__qb_torrents_reannounce(torrent_hashes=need_delete_hashes)
                     # 删除种子
                     if downloader.delete_torrents(ids=need_delete_hashes, delete_file=True):
@@ -2517,35 +4855,94 @@ class BrushFlowLowFreq(_PluginBase):
 
             logger.info("刷流下载任务检查完成")
 
-    def __update_torrent_tasks_state(self, torrents: List[Any], torrent_tasks: Dict[str, dict]):
+    def __get_check_torrents(self, downloader: Union[Qbittorrent, Transmission],
+                             torrent_hashes: Set[str]) -> Tuple[List[Any], bool]:
+        """
+        获取检查服务需要的种子，仅获取包含刷流标签以及刷流任务中的种子，按全量核对间隔定期获取全部种子
+        """
+        full_reconcile = time.time() - self._check_full_reconcile_time > self._check_full_reconcile_interval
+        if self.__is_qbittorrent():
+            torrents, error = self.__get_qb_check_torrents(downloader=downloader, torrent_hashes=torrent_hashes,
+                                                           full_reconcile=full_reconcile)
+        elif full_reconcile:
+            torrents, error = downloader.get_torrents()
+        elif not torrent_hashes:
+            # Transmission不支持同步刷流标签，没有刷流任务时无需获取种子
+            return [], False
+        else:
+            torrents, error = downloader.get_torrents(ids=list(torrent_hashes))
+
+        if not error and full_reconcile:
+            self._check_full_reconcile_time = time.time()
+            logger.info(f"已全量核对下载器种子，种子数 {len(torrents or [])}")
+        return torrents or [], error
+
+    def __get_qb_check_torrents(self, downloader: Qbittorrent, torrent_hashes: Set[str],
+                                full_reconcile: bool) -> Tuple[List[Any], bool]:
+        """
+        获取qBittorrent中的种子，优先通过 /sync/maindata 增量同步本地镜像，
+        同步失败时通过标签及Hash在下载器端过滤，全量核对时获取全部种子
+        """
+        brush_tag = self.__get_brush_config().brush_tag
+        if not downloader.qbc:
+            return downloader.get_torrents()
+
+        if not self._qb_mirror:
+            self._qb_mirror = QbMaindataMirror(full_update_interval=self._qb_mirror_full_update_interval)
+        try:
+            torrents, changed_count = self._qb_mirror.sync(qbc=downloader.qbc)
+            logger.info(f"下载器增量同步完成，种子数 {len(torrents)}，变化种子数 {changed_count}")
+            if not full_reconcile:
+                torrents = [torrent for torrent in torrents if torrent.get("hash") in torrent_hashes
+                            or brush_tag in [tag.strip() for tag in (torrent.get("tags") or "").split(",")]]
+            return torrents, False
+        except Exception as e:
+            logger.warning(f"下载器增量同步失败，回退为按标签及Hash获取种子，错误详情: {e}")
+            self._qb_mirror.reset()
+
+        if full_reconcile:
+            return downloader.get_torrents()
+        try:
+            torrents = list(downloader.qbc.torrents_info(tag=brush_tag))
+            tagged_hashes = {torrent.get("hash") for torrent in torrents}
+            remaining_hashes = [torrent_hash for torrent_hash in torrent_hashes if torrent_hash not in tagged_hashes]
+            for i in range(0, len(remaining_hashes), self._check_hashes_batch_size):
+                torrents.extend(downloader.qbc.torrents_info(
+                    torrent_hashes=remaining_hashes[i:i + self._check_hashes_batch_size]))
+            return torrents, False
+        except Exception as e:
+            logger.warning(f"按标签及Hash获取种子失败，回退为全量获取种子，错误详情: {e}")
+            return downloader.get_torrents()
+
+    @staticmethod
+    def __update_torrent_tasks_state(torrents: List[TorrentSnapshot], torrent_tasks: Dict[str, dict]):
         """
         更新刷流任务的最新状态，上下传，分享率
         """
         for torrent in torrents:
-            torrent_hash = self.__get_hash(torrent)
-            torrent_task = torrent_tasks.get(torrent_hash, None)
+            torrent_task = torrent_tasks.get(torrent.hash, None)
             # 如果找不到种子任务，说明不在管理的种子范围内，直接跳过
             if not torrent_task:
                 continue
 
-            torrent_info = self.__get_torrent_info(torrent)
-
             # 更新上传量、下载量
             torrent_task.update({
-                "downloaded": torrent_info.get("downloaded"),
-                "uploaded": torrent_info.get("uploaded"),
-                "ratio": torrent_info.get("ratio"),
-                "seeding_time": torrent_info.get("seeding_time"),
+                "downloaded": torrent.downloaded,
+                "uploaded": torrent.uploaded,
+                "ratio": torrent.ratio,
+                "seeding_time": torrent.seeding_time,
             })
 
     def __update_seeding_tasks_based_on_tags(self, torrent_tasks: Dict[str, dict], unmanaged_tasks: Dict[str, dict],
                                              seeding_torrents_dict: Dict[str, Any]):
         brush_config = self.__get_brush_config()
 
-        if not self.downloader_helper.is_downloader("qbittorrent", service=self.service_info):
+        if not self.__is_qbittorrent():
             logger.info("同步种子刷流标签记录目前仅支持qbittorrent")
             return
 
+        task_index = self.__get_torrent_task_index(torrent_tasks=torrent_tasks)
+
         # 初始化汇总信息
         added_tasks = []
         reset_tasks = []
@@ -2562,6 +4959,7 @@ class BrushFlowLowFreq(_PluginBase):
                         # 如果在 unmanaged_tasks 中，移除并转移到 torrent_tasks
                         torrent_task = unmanaged_tasks.pop(torrent_hash)
                         torrent_tasks[torrent_hash] = torrent_task
+                        task_index.add(torrent_hash=torrent_hash, torrent_task=torrent_task)
                         added_tasks.append(torrent_task)
                         logger.info(f"站点 {torrent_task.get('site_name')}，"
                                     f"刷流任务种子再次加入：{torrent_task.get('title')}|{torrent_task.get('description')}")
@@ -2569,6 +4967,7 @@ class BrushFlowLowFreq(_PluginBase):
                         # 否则，创建一个新的任务
                         torrent_task = self.__convert_torrent_info_to_task(torrent)
                         torrent_tasks[torrent_hash] = torrent_task
+                        task_index.add(torrent_hash=torrent_hash, torrent_task=torrent_task)
                         added_tasks.append(torrent_task)
                         self.eventmanager.send_event(etype=EventType.PluginTriggered, data={
                             "plugin_id": self.__class__.__name__,
@@ -2593,6 +4992,7 @@ class BrushFlowLowFreq(_PluginBase):
                 if torrent_hash in torrent_tasks:
                     # 如果种子不符合刷流条件但在 torrent_tasks 中，移除并加入 unmanaged_tasks
                     torrent_task = torrent_tasks.pop(torrent_hash)
+                    task_index.remove(torrent_hash=torrent_hash, torrent_task=torrent_task)
                     unmanaged_tasks[torrent_hash] = torrent_task
                     removed_tasks.append(torrent_task)
                     logger.info(f"站点 {torrent_task.get('site_name')}，"
@@ -2613,7 +5013,7 @@ class BrushFlowLowFreq(_PluginBase):
                                                             reason="在下载器中找到已标记删除的刷流任务对应的种子信息",
                                                             torrent_tasks=reset_tasks)
 
-    def __group_torrents_by_proxy_delete(self, torrents: List[Any], torrent_tasks: Dict[str, dict]):
+    def __group_torrents_by_proxy_delete(self, torrents: List[TorrentSnapshot], torrent_tasks: Dict[str, dict]):
         """
         根据是否启用动态删种进行分组
         """
@@ -2621,8 +5021,7 @@ class BrushFlowLowFreq(_PluginBase):
         not_proxy_delete_torrents = []
 
         for torrent in torrents:
-            torrent_hash = self.__get_hash(torrent)
-            torrent_task = torrent_tasks.get(torrent_hash, None)
+            torrent_task = torrent_tasks.get(torrent.hash, None)
 
             # 如果找不到种子任务，说明不在管理的种子范围内，直接跳过
             if not torrent_task:
@@ -2638,7 +5037,7 @@ class BrushFlowLowFreq(_PluginBase):
 
         return proxy_delete_torrents, not_proxy_delete_torrents
 
-    def __evaluate_conditions_for_delete(self, site_name: str, torrent_info: dict, torrent_task: dict) \
+    def __evaluate_conditions_for_delete(self, site_name: str, torrent_info: TorrentSnapshot, torrent_task: dict) \
             -> Tuple[bool, str]:
         """
         评估删除条件并返回是否应删除种子及其原因
@@ -2682,7 +5081,8 @@ class BrushFlowLowFreq(_PluginBase):
 
         return True, reason if not hit_and_run else "H&R种子（未设置H&R条件），" + reason
 
-    def __evaluate_proxy_pre_conditions_for_delete(self, site_name: str, torrent_info: dict) -> Tuple[bool, str]:
+    def __evaluate_proxy_pre_conditions_for_delete(self, site_name: str, torrent_info: TorrentSnapshot) \
+            -> Tuple[bool, str]:
         """
         评估动态删除前置条件并返回是否应删除种子及其原因
         """
@@ -2698,7 +5098,7 @@ class BrushFlowLowFreq(_PluginBase):
 
         return True, reason
 
-    def __delete_torrent_for_evaluate_conditions(self, torrents: List[Any], torrent_tasks: Dict[str, dict],
+    def __delete_torrent_for_evaluate_conditions(self, torrents: List[TorrentSnapshot], torrent_tasks: Dict[str, dict],
                                                  proxy_delete: bool = False) -> List:
         """
         根据条件删除种子并获取已删除列表
@@ -2706,7 +5106,7 @@ class BrushFlowLowFreq(_PluginBase):
         delete_hashes = []
 
         for torrent in torrents:
-            torrent_hash = self.__get_hash(torrent)
+            torrent_hash = torrent.hash
             torrent_task = torrent_tasks.get(torrent_hash, None)
             # 如果找不到种子任务，说明不在管理的种子范围内，直接跳过
             if not torrent_task:
@@ -2715,11 +5115,9 @@ class BrushFlowLowFreq(_PluginBase):
             torrent_title = torrent_task.get("title", "")
             torrent_desc = torrent_task.get("description", "")
 
-            torrent_info = self.__get_torrent_info(torrent)
-
             # 删除种子的具体实现可能会根据实际情况略有不同
             should_delete, reason = self.__evaluate_conditions_for_delete(site_name=site_name,
-                                                                          torrent_info=torrent_info,
+                                                                          torrent_info=torrent,
                                                                           torrent_task=torrent_task)
             if should_delete:
                 delete_hashes.append(torrent_hash)
@@ -2732,7 +5130,7 @@ class BrushFlowLowFreq(_PluginBase):
 
         return delete_hashes
 
-    def __delete_torrent_for_evaluate_proxy_pre_conditions(self, torrents: List[Any],
+    def __delete_torrent_for_evaluate_proxy_pre_conditions(self, torrents: List[TorrentSnapshot],
                                                            torrent_tasks: Dict[str, dict]) -> List:
         """
         根据动态删除前置条件排除H&R种子后删除种子并获取已删除列表
@@ -2740,7 +5138,7 @@ class BrushFlowLowFreq(_PluginBase):
         delete_hashes = []
 
         for torrent in torrents:
-            torrent_hash = self.__get_hash(torrent)
+            torrent_hash = torrent.hash
             torrent_task = torrent_tasks.get(torrent_hash, None)
             # 如果找不到种子任务，说明不在管理的种子范围内，直接跳过
             if not torrent_task:
@@ -2754,11 +5152,9 @@ class BrushFlowLowFreq(_PluginBase):
             torrent_title = torrent_task.get("title", "")
             torrent_desc = torrent_task.get("description", "")
 
-            torrent_info = self.__get_torrent_info(torrent)
-
             # 删除种子的具体实现可能会根据实际情况略有不同
             should_delete, reason = self.__evaluate_proxy_pre_conditions_for_delete(site_name=site_name,
-                                                                                    torrent_info=torrent_info)
+                                                                                    torrent_info=torrent)
             if should_delete:
                 delete_hashes.append(torrent_hash)
                 self.__send_delete_message(site_name=site_name, torrent_title=torrent_title, torrent_desc=torrent_desc,
@@ -2769,7 +5165,7 @@ class BrushFlowLowFreq(_PluginBase):
 
         return delete_hashes
 
-    def __delete_torrent_for_proxy(self, torrents: List[Any], torrent_tasks: Dict[str, dict]) -> List:
+    def __delete_torrent_for_proxy(self, torrents: List[TorrentSnapshot], torrent_tasks: Dict[str, dict]) -> List:
         """
         动态删除种子，删除规则如下；
         - 不管做种体积是否超过设定的动态删除阈值，默认优先执行排除H&R种子后满足「下载超时时间」的种子
@@ -2782,11 +5178,11 @@ class BrushFlowLowFreq(_PluginBase):
         brush_config = self.__get_brush_config()
 
         # 如果没有启用动态删除或没有设置删除阈值，则不执行删除操作
-        if not (brush_config.proxy_delete and brush_config.delete_size_range):
+        if not (brush_config.proxy_delete and brush_config.delete_size_limits):
             return []
 
         # 获取种子信息Map
-        torrent_info_map = {self.__get_hash(torrent): self.__get_torrent_info(torrent=torrent) for torrent in torrents}
+        torrent_info_map = {torrent.hash: torrent for torrent in torrents}
 
         # 计算当前总做种体积
         total_torrent_size = self.__calculate_seeding_torrents_size(torrent_tasks=torrent_tasks)
@@ -2800,23 +5196,24 @@ class BrushFlowLowFreq(_PluginBase):
 
         # 如果存在前置删除种子，这里进行额外判断，总做种体积排除前置删除种子的体积
         if pre_delete_hashes:
-            pre_delete_total_size = sum(torrent_info_map[self.__get_hash(torrent)].get("total_size", 0)
-                                        for torrent in torrents if self.__get_hash(torrent) in pre_delete_hashes)
+            pre_delete_hash_set = set(pre_delete_hashes)
+            pre_delete_total_size = sum(torrent.total_size or 0
+                                        for torrent in torrents if torrent.hash in pre_delete_hash_set)
             total_torrent_size = total_torrent_size - pre_delete_total_size
-            torrents = [torrent for torrent in torrents if self.__get_hash(torrent) not in pre_delete_hashes]
+            torrents = [torrent for torrent in torrents if torrent.hash not in pre_delete_hash_set]
             logger.info(
                 f"满足动态删除前置条件的种子共 {len(pre_delete_hashes)} 个，体积 {self.__bytes_to_gb(pre_delete_total_size):.1f} GB，"
                 f"删除种子后，当前做种体积 {self.__bytes_to_gb(total_torrent_size):.1f} GB")
         else:
             logger.info(f"没有找到任何满足动态删除前置条件的种子")
 
-        # 解析删除阈值范围
-        sizes = [float(size) * 1024 ** 3 for size in brush_config.delete_size_range.split("-")]
-        min_size = sizes[0]  # 至少需要达到的做种体积
-        max_size = sizes[1] if len(sizes) > 1 else sizes[0]  # 触发删除操作的做种体积上限
+        # 删除阈值范围
+        delete_size_limits = brush_config.delete_size_limits
+        min_size = delete_size_limits.lower  # 至少需要达到的做种体积
+        max_size = delete_size_limits.upper  # 触发删除操作的做种体积上限
 
         # 判断是否为区间删除
-        proxy_size_range = len(sizes) > 1
+        proxy_size_range = delete_size_limits.is_range
 
         # 当总体积未超过最大阈值时，不需要执行删除操作
         if total_torrent_size < max_size:
@@ -2840,9 +5237,10 @@ class BrushFlowLowFreq(_PluginBase):
             not_proxy_delete_hashes = self.__delete_torrent_for_evaluate_conditions(torrents=not_proxy_delete_torrents,
                                                                                     torrent_tasks=torrent_tasks) or []
             need_delete_hashes.extend(not_proxy_delete_hashes)
+            not_proxy_delete_hash_set = set(not_proxy_delete_hashes)
             total_torrent_size -= sum(
-                torrent_info_map[self.__get_hash(torrent)].get("total_size", 0) for torrent in not_proxy_delete_torrents
-                if self.__get_hash(torrent) in not_proxy_delete_hashes)
+                torrent.total_size or 0 for torrent in not_proxy_delete_torrents
+                if torrent.hash in not_proxy_delete_hash_set)
 
         # 如果删除非托管种子后仍未达到最小体积要求，则处理托管种子
         if total_torrent_size > min_size and proxy_delete_torrents:
@@ -2850,23 +5248,25 @@ class BrushFlowLowFreq(_PluginBase):
                                                                                 torrent_tasks=torrent_tasks,
                                                                                 proxy_delete=True) or []
             need_delete_hashes.extend(proxy_delete_hashes)
+            proxy_delete_hash_set = set(proxy_delete_hashes)
             total_torrent_size -= sum(
-                torrent_info_map[self.__get_hash(torrent)].get("total_size", 0) for torrent in proxy_delete_torrents if
-                self.__get_hash(torrent) in proxy_delete_hashes)
+                torrent.total_size or 0 for torrent in proxy_delete_torrents if
+                torrent.hash in proxy_delete_hash_set)
 
         # 在完成初始删除步骤后，如果总体积仍然超过最小阈值，则进一步找到已完成种子并排除HR种子后按做种时间正序进行删除
         if total_torrent_size > min_size:
             # 重新计算当前的种子列表，排除已删除的种子
             remaining_hashes = list(
-                {self.__get_hash(torrent) for torrent in proxy_delete_torrents} - set(need_delete_hashes))
+                {torrent.hash for torrent in proxy_delete_torrents} - set(need_delete_hashes))
             # 这里根据排除后的种子列表，再次从下载器中找到已完成的任务
             downloader = self.downloader
             completed_torrents = downloader.get_completed_torrents(ids=remaining_hashes)
             remaining_hashes = {self.__get_hash(torrent) for torrent in completed_torrents}
-            remaining_torrents = [(_hash, torrent_info_map[_hash]) for _hash in remaining_hashes]
+            remaining_torrents = [(_hash, torrent_info_map[_hash]) for _hash in remaining_hashes
+                                  if _hash in torrent_info_map]
 
             # 准备一个列表，用于存放满足条件的种子，即非HR种子且有明确做种时间
-            filtered_torrents = [(_hash, info['seeding_time']) for _hash, info in remaining_torrents if
+            filtered_torrents = [(_hash, info.seeding_time) for _hash, info in remaining_torrents if
                                  not torrent_tasks[_hash].get("hit_and_run", False)]
             sorted_torrents = sorted(filtered_torrents, key=lambda x: x[1], reverse=True)
 
@@ -2880,7 +5280,7 @@ class BrushFlowLowFreq(_PluginBase):
                     continue
 
                 need_delete_hashes.append(torrent_hash)
-                total_torrent_size -= torrent_info.get("total_size", 0)
+                total_torrent_size -= torrent_info.total_size or 0
 
                 site_name = torrent_task.get("site_name", "")
                 torrent_title = torrent_task.get("title", "")
@@ -2914,7 +5314,7 @@ class BrushFlowLowFreq(_PluginBase):
         处理已经被删除，但是任务记录中还没有被标记删除的种子
         """
         # 先通过获取的全量种子，判断已经被删除，但是任务记录中还没有被标记删除的种子
-        torrent_all_hashes = self.__get_all_hashes(torrents)
+        torrent_all_hashes = {torrent.hash for torrent in torrents}
         missing_hashes = [hash_value for hash_value in torrent_check_hashes if hash_value not in torrent_all_hashes]
         undeleted_hashes = [hash_value for hash_value in missing_hashes if not torrent_tasks[hash_value].get("deleted")]
 
@@ -3047,6 +5447,7 @@ class BrushFlowLowFreq(_PluginBase):
             "disksize": "保种体积",
             "maxupspeed": "总上传带宽",
             "maxdlspeed": "总下载带宽",
+            "bandwidth_window": "带宽统计窗口",
             "maxdlcount": "同时下载任务数",
             "seed_time": "做种时间",
             "hr_seed_time": "H&R做种时间",
@@ -3057,7 +5458,10 @@ class BrushFlowLowFreq(_PluginBase):
             "seed_inactivetime": "未活动时间",
             "up_speed": "单任务上传限速",
             "dl_speed": "单任务下载限速",
-            "auto_archive_days": "自动清理记录天数"
+            "auto_archive_days": "自动清理记录天数",
+            "min_interval": "站点最小刷流间隔",
+            "request_budget": "站点请求预算",
+            "cycle_budget": "刷流周期时间预算"
         }
 
         config_range_number_attr_to_desc = {
@@ -3076,12 +5480,32 @@ class BrushFlowLowFreq(_PluginBase):
 
         for attr, desc in config_range_number_attr_to_desc.items():
             value = config.get(attr)
-            # 检查 value 是否存在且是否符合数字或数字-数字的模式
-            if value and not self.__is_number_or_range(str(value)):
+            # 检查 value 是否存在且是否符合数字或数字-数字的模式，与BrushConfig使用相同的解析逻辑
+            try:
+                BrushConfig.parse_range(attr, value)
+            except ValueError:
+                self.__log_and_notify_error(f"站点刷流任务出错，{desc}设置错误：{value}")
+                config[attr] = None
+                found_error = True  # 更新错误标志
+
+        config_pattern_attr_to_desc = {
+            "include": "包含规则",
+            "exclude": "排除规则"
+        }
+
+        for attr, desc in config_pattern_attr_to_desc.items():
+            value = config.get(attr)
+            if value and not self.__is_valid_pattern(value):
                 self.__log_and_notify_error(f"站点刷流任务出错，{desc}设置错误：{value}")
                 config[attr] = None
                 found_error = True  # 更新错误标志
 
+        cycle_budget_ratios = config.get("cycle_budget_ratios")
+        if cycle_budget_ratios and not self.__parse_cycle_budget_ratios(cycle_budget_ratios):
+            self.__log_and_notify_error(f"站点刷流任务出错，刷流周期阶段预算占比设置错误：{cycle_budget_ratios}")
+            config["cycle_budget_ratios"] = None
+            found_error = True  # 更新错误标志
+
         active_time_range = config.get("active_time_range")
         if active_time_range and not self.__is_valid_time_range(time_range=active_time_range):
             self.__log_and_notify_error(f"站点刷流任务出错，开启时间段设置错误：{active_time_range}")
@@ -3113,6 +5537,7 @@ class BrushFlowLowFreq(_PluginBase):
             "hr": brush_config.hr,
             "maxupspeed": brush_config.maxupspeed,
             "maxdlspeed": brush_config.maxdlspeed,
+            "bandwidth_window": brush_config.bandwidth_window,
             "maxdlcount": brush_config.maxdlcount,
             "include": brush_config.include,
             "exclude": brush_config.exclude,
@@ -3135,6 +5560,12 @@ class BrushFlowLowFreq(_PluginBase):
             "delete_except_tags": brush_config.delete_except_tags,
             "except_subscribe": brush_config.except_subscribe,
             "brush_sequential": brush_config.brush_sequential,
+            "brush_strategy": brush_config.brush_strategy,
+            "adaptive_interval": brush_config.adaptive_interval,
+            "min_interval": brush_config.min_interval,
+            "request_budget": brush_config.request_budget,
+            "cycle_budget": brush_config.cycle_budget,
+            "cycle_budget_ratios": brush_config.cycle_budget_ratios,
             "proxy_delete": brush_config.proxy_delete,
             "active_time_range": brush_config.active_time_range,
             "cron": brush_config.cron,
@@ -3147,8 +5578,69 @@ class BrushFlowLowFreq(_PluginBase):
         # 使用update_config方法或其等效方法更新配置
         self.update_config(config_mapping)
 
+    def __acquire_site_request(self, site_name: str) -> bool:
+        """
+        请求站点前获取站点令牌桶的令牌，令牌不足时等待，预计等待超过上限或插件正在停止时返回False
+        """
+        if self._stop_event.is_set():
+            return False
+        brush_config = self.__get_brush_config(sitename=site_name)
+        rate_limit = brush_config.rate_limit if brush_config.rate_limit is not None else self._rate_limit_default
+        if not rate_limit or rate_limit <= 0:
+            return True
+        rate_burst = brush_config.rate_burst or self._rate_burst_default
+        with self._rate_limiters_lock:
+            if self._rate_limiters is None:
+                self._rate_limiters = {}
+            limiter = self._rate_limiters.get(site_name)
+            if not limiter:
+                limiter = TokenBucket(rate=rate_limit / 60, capacity=rate_burst, max_wait=self._rate_limit_max_wait)
+                self._rate_limiters[site_name] = limiter
+            elif limiter.rate != rate_limit / 60 or limiter.capacity != max(rate_burst, 1):
+                limiter.update(rate=rate_limit / 60, capacity=rate_burst)
+        return limiter.acquire(stop_event=self._stop_event)
+
+    def __get_site_session(self, site_name: str, ua: str = None, proxies: dict = None) -> requests.Session:
+        """
+        获取站点复用的HTTP会话，同一站点的请求复用连接，UA或代理变化时重新创建
+        """
+        session_key = (ua, json.dumps(proxies, sort_keys=True) if proxies else None)
+        with self._site_sessions_lock:
+            if self._site_sessions is None:
+                self._site_sessions = {}
+            cached = self._site_sessions.get(site_name)
+            if cached and cached[0] == session_key:
+                return cached[1]
+            if cached:
+                cached[1].close()
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self._site_session_pool_size, pool_block=True)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            # Cookie由每次请求传入，会话不保存站点返回的Cookie，避免影响不能携带Cookie的请求
+            session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+            if ua:
+                session.headers["User-Agent"] = ua
+            if proxies:
+                session.proxies.update(proxies)
+            self._site_sessions[site_name] = (session_key, session)
+            return session
+
+    def __close_site_sessions(self):
+        """
+        关闭所有站点HTTP会话
+        """
+        with self._site_sessions_lock:
+            for _, session in (self._site_sessions or {}).values():
+                try:
+                    session.close()
+                except Exception as e:
+                    logger.debug(f"关闭站点会话失败：{e}")
+            self._site_sessions = {}
+
     @staticmethod
-    def __get_redict_url(url: str, proxies: str = None, ua: str = None, cookie: str = None) -> Optional[str]:
+    def __get_redict_url(url: str, proxies: str = None, ua: str = None, cookie: str = None,
+                         session: requests.Session = None) -> Optional[str]:
         """
         获取下载链接， url格式：[base64]url
         """
@@ -3178,7 +5670,8 @@ class BrushFlowLowFreq(_PluginBase):
                     ua=ua,
                     proxies=proxies,
                     cookies=cookie,
-                    headers=headers
+                    headers=headers,
+                    session=session
                 ).get_res(url, params=req_params.get('params'))
             else:
                 # POST请求
@@ -3186,7 +5679,8 @@ class BrushFlowLowFreq(_PluginBase):
                     ua=ua,
                     proxies=proxies,
                     cookies=cookie,
-                    headers=headers
+                    headers=headers,
+                    session=session
                 ).post_res(url, params=req_params.get('params'))
             if not res:
                 return None
@@ -3211,13 +5705,13 @@ class BrushFlowLowFreq(_PluginBase):
             if not torrent_url or torrent_url.startswith("magnet"):
                 return torrent_url
 
-            indexers = self.sites_helper.get_indexers()
-            if not indexers:
+            indexer_index = self.__get_indexer_index()
+            site = indexer_index.get(site_id)
+            if not site:
                 return torrent_url
 
             unsupported_sites = {"天空"}
-            site = next((item for item in indexers if item.get("id") == site_id), None)
-            if site.get("name") in unsupported_sites or not site.get("schema", "").startswith("Nexus"):
+            if site.get("name") in unsupported_sites or not indexer_index.is_nexus(site_id):
                 return torrent_url
 
             # 解析 URL
@@ -3243,6 +5737,10 @@ class BrushFlowLowFreq(_PluginBase):
             logger.error(f"获取下载链接失败：{torrent.title}")
             return None
 
+        if not self.__get_site_breaker(site_id=torrent.site, site_name=torrent.site_name).allow():
+            logger.warning(f"站点 {torrent.site_name} 处于熔断状态，种子 {torrent.title} 推迟到下次刷流")
+            return None
+
         brush_config = self.__get_brush_config(torrent.site_name)
 
         # 上传限速
@@ -3257,18 +5755,32 @@ class BrushFlowLowFreq(_PluginBase):
         proxies = settings.PROXY if torrent.site_proxy else None
         # cookie
         cookies = torrent.site_cookie
-        if torrent_content.startswith("["):
-            torrent_content = self.__get_redict_url(url=torrent_content,
-                                                    proxies=proxies,
-                                                    ua=torrent.site_ua,
-                                                    cookie=cookies)
+        # 复用站点HTTP会话
+        session = self.__get_site_session(site_name=torrent.site_name, ua=torrent.site_ua, proxies=proxies)
+        # 优先使用缓存的种子文件，之前添加失败的种子无需再次请求站点
+        cached_content = self.__get_torrent_cache().get(site=torrent.site_name, url=torrent.enclosure)
+        if cached_content:
+            logger.debug(f"站点 {torrent.site_name} 的种子 {torrent.title} 使用缓存的种子文件")
+            torrent_content = cached_content
+        elif torrent_content.startswith("["):
+            if not self.__acquire_site_request(site_name=torrent.site_name):
+                logger.warning(f"站点 {torrent.site_name} 请求过于频繁或插件正在停止，种子 {torrent.title} 推迟到下次刷流")
+                return None
+            with self.__track_cycle_budget(phase="fetch", site_name=torrent.site_name):
+                torrent_content = self.__get_redict_url(url=torrent_content,
+                                                        proxies=proxies,
+                                                        ua=torrent.site_ua,
+                                                        cookie=cookies,
+                                                        session=session)
             # 目前馒头请求实际种子时，不能传入Cookie
             cookies = None
+            if not torrent_content:
+                self.__record_site_failure(site_id=torrent.site, site_name=torrent.site_name, error="获取下载地址失败")
         if not torrent_content:
             logger.error(f"获取下载链接失败：{torrent.title}")
             return None
 
-        if brush_config.site_skip_tips:
+        if brush_config.site_skip_tips and not cached_content:
             torrent_content = self.__reset_download_url(torrent_url=torrent_content, site_id=torrent.site)
             logger.debug(f"站点 {torrent.site_name} 已启用自动跳过提示，种子下载地址更新为 {torrent_content}")
 
@@ -3280,46 +5792,43 @@ class BrushFlowLowFreq(_PluginBase):
             # 限速值转为bytes
             up_speed = up_speed * 1024 if up_speed else None
             down_speed = down_speed * 1024 if down_speed else None
-            # 生成随机Tag
-            tag = StringUtils.generate_random_str(10)
             # 如果开启代理下载以及种子地址不是磁力地址，则请求种子到内存再传入下载器
-            if not torrent_content.startswith("magnet"):
-                response = RequestUtils(cookies=cookies,
-                                        proxies=proxies,
-                                        ua=torrent.site_ua).get_res(url=torrent_content)
-                if response and response.ok:
-                    torrent_content = response.content
-                else:
-                    logger.error("尝试通过MP下载种子失败，继续尝试传递种子地址到下载器进行下载")
+            if not cached_content and not torrent_content.startswith("magnet"):
+                torrent_content = self.__fetch_torrent_content(torrent=torrent, url=torrent_content,
+                                                               cookies=cookies, proxies=proxies, session=session)
+                if not torrent_content:
+                    return None
             if torrent_content:
+                # 优先通过种子内容直接计算种子Hash，无法计算时（如磁力链接）再通过随机Tag从下载器中查询
+                torrent_hash = self.__get_info_hash(torrent_content)
+                tag = None if torrent_hash else StringUtils.generate_random_str(10)
+                tags = ["已整理", brush_config.brush_tag] + ([tag] if tag else [])
                 state = downloader.add_torrent(content=torrent_content,
                                                download_dir=download_dir,
                                                cookie=cookies,
                                                category=brush_config.qb_category,
-                                               tag=["已整理", brush_config.brush_tag, tag],
+                                               tag=tags,
                                                upload_limit=up_speed,
                                                download_limit=down_speed)
                 if not state:
                     return None
-                else:
-                    # 获取种子Hash
-                    torrent_hash = downloader.get_torrent_id_by_tag(tags=tag)
-                    if not torrent_hash:
-                        logger.error(f"{brush_config.downloader} 获取种子Hash失败，详细信息请查看 README")
-                        return None
+                if torrent_hash:
                     return torrent_hash
+                # 获取种子Hash
+                torrent_hash = downloader.get_torrent_id_by_tag(tags=tag)
+                if not torrent_hash:
+                    logger.error(f"{brush_config.downloader} 获取种子Hash失败，详细信息请查看 README")
+                    return None
+                return torrent_hash
             return None
 
         elif self.downloader_helper.is_downloader("transmission", service=self.service_info):
             # 如果开启代理下载以及种子地址不是磁力地址，则请求种子到内存再传入下载器
-            if not torrent_content.startswith("magnet"):
-                response = RequestUtils(cookies=cookies,
-                                        proxies=proxies,
-                                        ua=torrent.site_ua).get_res(url=torrent_content)
-                if response and response.ok:
-                    torrent_content = response.content
-                else:
-                    logger.error("尝试通过MP下载种子失败，继续尝试传递种子地址到下载器进行下载")
+            if not cached_content and not torrent_content.startswith("magnet"):
+                torrent_content = self.__fetch_torrent_content(torrent=torrent, url=torrent_content,
+                                                               cookies=cookies, proxies=proxies, session=session)
+                if not torrent_content:
+                    return None
             if torrent_content:
                 torrent = downloader.add_torrent(content=torrent_content,
                                                  download_dir=download_dir,
@@ -3328,13 +5837,63 @@ class BrushFlowLowFreq(_PluginBase):
                 if not torrent:
                     return None
                 else:
+                    # 下载器未返回种子Hash时，使用通过种子内容计算的种子Hash
+                    torrent_hash = getattr(torrent, "hashString", None) or self.__get_info_hash(torrent_content)
                     if brush_config.up_speed or brush_config.dl_speed:
-                        downloader.change_torrent(hash_string=torrent.hashString,
+                        downloader.change_torrent(hash_string=torrent_hash,
                                                   upload_limit=up_speed,
                                                   download_limit=down_speed)
-                    return torrent.hashString
+                    return torrent_hash
         return None
 
+    def __fetch_torrent_content(self, torrent: TorrentInfo, url: str, cookies: Optional[str], proxies: Optional[dict],
+                                session: requests.Session) -> Optional[Union[str, bytes]]:
+        """
+        通过MP下载种子文件并缓存，下载失败时返回种子地址交由下载器下载，站点请求过于频繁或插件正在停止时返回None推迟到下次刷流
+        """
+        if not self.__acquire_site_request(site_name=torrent.site_name):
+            logger.warning(f"站点 {torrent.site_name} 请求过于频繁或插件正在停止，种子 {torrent.title} 推迟到下次刷流")
+            return None
+        with self.__track_cycle_budget(phase="fetch", site_name=torrent.site_name):
+            response = RequestUtils(cookies=cookies,
+                                    proxies=proxies,
+                                    ua=torrent.site_ua,
+                                    session=session).get_res(url=url)
+        if not response or not response.ok:
+            logger.error("尝试通过MP下载种子失败，继续尝试传递种子地址到下载器进行下载")
+            # 非2xx的响应布尔值为False，需要判断是否为None以记录状态码
+            status = response.status_code if response is not None else "无响应"
+            self.__record_site_failure(site_id=torrent.site, site_name=torrent.site_name,
+                                       error=f"下载种子文件失败：{status}")
+            return url
+        self.__record_site_success(site_id=torrent.site, site_name=torrent.site_name)
+        # 仅缓存可以解析的种子文件，避免缓存站点返回的错误页面
+        if self.__get_info_hash(response.content):
+            self.__get_torrent_cache().put(site=torrent.site_name, url=torrent.enclosure, content=response.content)
+        return response.content
+
+    def __get_torrent_cache(self) -> TorrentCache:
+        """
+        获取种子文件缓存
+        """
+        if not self._torrent_cache:
+            self._torrent_cache = TorrentCache(path=self.get_data_path() / "torrents",
+                                               max_size=self._torrent_cache_size, ttl=self._torrent_cache_ttl)
+        return self._torrent_cache
+
+    @staticmethod
+    def __get_info_hash(torrent_content: Union[str, bytes]) -> Optional[str]:
+        """
+        通过种子内容计算种子Hash，种子内容为链接或无法解析时返回None
+        """
+        if not isinstance(torrent_content, bytes):
+            return None
+        try:
+            return TorrentFileHelper.get_info_hash(torrent_content)
+        except Exception as e:
+            logger.warning(f"解析种子内容计算种子Hash失败，将通过下载器获取种子Hash，错误详情: {e}")
+            return None
+
     def __qb_torrents_reannounce(self, torrent_hashes: List[str]):
         """强制重新汇报"""
         downloader = self.downloader
@@ -3353,213 +5912,59 @@ class BrushFlowLowFreq(_PluginBase):
         except Exception as err:
             logger.error(f"强制重新汇报失败：{str(err)}")
 
-    def __get_hash(self, torrent: Any):
+    def __get_downloader_adapter(self) -> Optional[DownloaderAdapter]:
         """
-        获取种子hash
+        获取下载器适配器，按下载器类型解析一次后缓存，配置变更时重新解析
         """
-        try:
-            return torrent.get("hash") if self.downloader_helper.is_downloader("qbittorrent", service=self.service_info) \
-                else torrent.hashString
-        except Exception as e:
-            print(str(e))
-            return ""
+        if not self._downloader_adapter:
+            brush_config = self.__get_brush_config()
+            service = self.downloader_helper.get_service(name=brush_config.downloader)
+            if not service:
+                return None
+            if self.downloader_helper.is_downloader("qbittorrent", service=service):
+                self._downloader_adapter = QbittorrentAdapter()
+            elif self.downloader_helper.is_downloader("transmission", service=service):
+                self._downloader_adapter = TransmissionAdapter()
+        return self._downloader_adapter
 
-    def __get_all_hashes(self, torrents):
+    def __is_qbittorrent(self) -> bool:
         """
-        获取torrents列表中所有种子的Hash值
+        判断当前下载器是否为qBittorrent
+        """
+        adapter = self.__get_downloader_adapter()
+        return bool(adapter and adapter.type == QbittorrentAdapter.type)
+
+    def __get_torrent_adapter(self) -> DownloaderAdapter:
+        """
+        获取访问种子信息的下载器适配器，下载器未初始化或类型未知时，与判断非qBittorrent时一致，按Transmission种子访问
+        """
+        return self.__get_downloader_adapter() or TransmissionAdapter()
 
-        :param torrents: 包含种子信息的列表
-        :return: 包含所有Hash值的列表
+    def __get_hash(self, torrent: Any):
+        """
+        获取种子hash
         """
         try:
-            all_hashes = []
-            for torrent in torrents:
-                # 根据下载器类型获取Hash值
-                hash_value = torrent.get("hash") if self.downloader_helper.is_downloader("qbittorrent",
-                                                                                         service=self.service_info) \
-                    else torrent.hashString
-                if hash_value:
-                    all_hashes.append(hash_value)
-            return all_hashes
+            return self.__get_torrent_adapter().get_hash(torrent)
         except Exception as e:
             print(str(e))
-            return []
+            return ""
 
     def __get_label(self, torrent: Any):
         """
         获取种子标签
         """
         try:
-            return [str(tag).strip() for tag in torrent.get("tags").split(',')] \
-                if self.downloader_helper.is_downloader("qbittorrent",
-                                                        service=self.service_info) else torrent.labels or []
+            return self.__get_torrent_adapter().get_labels(torrent)
         except Exception as e:
             print(str(e))
             return []
 
-    def __get_torrent_info(self, torrent: Any) -> dict:
+    def __get_torrent_info(self, torrent: Any) -> TorrentSnapshot:
         """
-        获取种子信息
+        获取种子信息快照
         """
-        date_now = int(time.time())
-        # QB
-        if self.downloader_helper.is_downloader("qbittorrent", service=self.service_info):
-            """
-            {
-              "added_on": 1693359031,
-              "amount_left": 0,
-              "auto_tmm": false,
-              "availability": -1,
-              "category": "tJU",
-              "completed": 67759229411,
-              "completion_on": 1693609350,
-              "content_path": "/mnt/sdb/qb/downloads/Steel.Division.2.Men.of.Steel-RUNE",
-              "dl_limit": -1,
-              "dlspeed": 0,
-              "download_path": "",
-              "downloaded": 67767365851,
-              "downloaded_session": 0,
-              "eta": 8640000,
-              "f_l_piece_prio": false,
-              "force_start": false,
-              "hash": "116bc6f3efa6f3b21a06ce8f1cc71875",
-              "infohash_v1": "116bc6f306c40e072bde8f1cc71875",
-              "infohash_v2": "",
-              "last_activity": 1693609350,
-              "magnet_uri": "magnet:?xt=",
-              "max_ratio": -1,
-              "max_seeding_time": -1,
-              "name": "Steel.Division.2.Men.of.Steel-RUNE",
-              "num_complete": 1,
-              "num_incomplete": 0,
-              "num_leechs": 0,
-              "num_seeds": 0,
-              "priority": 0,
-              "progress": 1,
-              "ratio": 0,
-              "ratio_limit": -2,
-              "save_path": "/mnt/sdb/qb/downloads",
-              "seeding_time": 615035,
-              "seeding_time_limit": -2,
-              "seen_complete": 1693609350,
-              "seq_dl": false,
-              "size": 67759229411,
-              "state": "stalledUP",
-              "super_seeding": false,
-              "tags": "",
-              "time_active": 865354,
-              "total_size": 67759229411,
-              "tracker": "https://tracker",
-              "trackers_count": 2,
-              "up_limit": -1,
-              "uploaded": 0,
-              "uploaded_session": 0,
-              "upspeed": 0
-            }
-            """
-            # ID
-            torrent_id = torrent.get("hash")
-            # 标题
-            torrent_title = torrent.get("name")
-            # 下载时间
-            if (not torrent.get("added_on")
-                    or torrent.get("added_on") < 0):
-                dltime = 0
-            else:
-                dltime = date_now - torrent.get("added_on")
-            # 做种时间
-            if (not torrent.get("completion_on")
-                    or torrent.get("completion_on") < 0):
-                seeding_time = 0
-            else:
-                seeding_time = date_now - torrent.get("completion_on")
-            # 分享率
-            ratio = torrent.get("ratio") or 0
-            # 上传量
-            uploaded = torrent.get("uploaded") or 0
-            # 平均上传速度 Byte/s
-            if dltime:
-                avg_upspeed = int(uploaded / dltime)
-            else:
-                avg_upspeed = uploaded
-            # 已未活动 秒
-            if (not torrent.get("last_activity")
-                    or torrent.get("last_activity") < 0):
-                iatime = 0
-            else:
-                iatime = date_now - torrent.get("last_activity")
-            # 下载量
-            downloaded = torrent.get("downloaded")
-            # 种子大小
-            total_size = torrent.get("total_size")
-            # 添加时间
-            add_on = (torrent.get("added_on") or 0)
-            add_time = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(add_on))
-            # 种子标签
-            tags = torrent.get("tags")
-            # tracker
-            tracker = torrent.get("tracker")
-        # TR
-        else:
-            # ID
-            torrent_id = torrent.hashString
-            # 标题
-            torrent_title = torrent.name
-            # 做种时间
-            if (not torrent.date_done
-                    or torrent.date_done.timestamp() < 1):
-                seeding_time = 0
-            else:
-                seeding_time = date_now - int(torrent.date_done.timestamp())
-            # 下载耗时
-            if (not torrent.date_added
-                    or torrent.date_added.timestamp() < 1):
-                dltime = 0
-            else:
-                dltime = date_now - int(torrent.date_added.timestamp())
-            # 下载量
-            downloaded = int(torrent.total_size * torrent.progress / 100)
-            # 分享率
-            ratio = torrent.ratio or 0
-            # 上传量
-            uploaded = int(downloaded * torrent.ratio)
-            # 平均上传速度
-            if dltime:
-                avg_upspeed = int(uploaded / dltime)
-            else:
-                avg_upspeed = uploaded
-            # 未活动时间
-            if (not torrent.date_active
-                    or torrent.date_active.timestamp() < 1):
-                iatime = 0
-            else:
-                iatime = date_now - int(torrent.date_active.timestamp())
-            # 种子大小
-            total_size = torrent.total_size
-            # 添加时间
-            add_on = (torrent.date_added.timestamp() if torrent.date_added else 0)
-            add_time = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(add_on))
-            # 种子标签
-            tags = torrent.get("tags")
-            # tracker
-            tracker = torrent.get("tracker")
-
-        return {
-            "hash": torrent_id,
-            "title": torrent_title,
-            "seeding_time": seeding_time,
-            "ratio": ratio,
-            "uploaded": uploaded,
-            "downloaded": downloaded,
-            "avg_upspeed": avg_upspeed,
-            "iatime": iatime,
-            "dltime": dltime,
-            "total_size": total_size,
-            "add_time": add_time,
-            "add_on": add_on,
-            "tags": tags,
-            "tracker": tracker
-        }
+        return self.__get_torrent_adapter().get_torrent_info(torrent)
 
     def __log_and_notify_error(self, message):
         """
@@ -3668,51 +6073,80 @@ class BrushFlowLowFreq(_PluginBase):
         total_size = sum([task.get("size") or 0 for task in task_info.values()])
         return total_size
 
-    def __get_average_bandwidth(self, sample_count: int = 5, interval: float = 3.0) \
-            -> Tuple[Optional[float], Optional[float]]:
+    def __get_average_bandwidth(self) -> Tuple[Optional[float], Optional[float]]:
         """
-        多次采样上传和下载带宽，取平均值
+        从后台带宽采样器读取平均上传和下载带宽，没有有效采样时立即补充采样若干次，
+        未配置带宽限制（采样器未创建）时返回 (None, None)，跳过带宽检查
         """
-        upload_speeds = []
-        download_speeds = []
-        start_time = time.time()
-        for _ in range(sample_count):
-            downloader_info = self.__get_downloader_info()
-            if downloader_info:
-                upload_speeds.append(downloader_info.upload_speed or 0)
-                download_speeds.append(downloader_info.download_speed or 0)
-            # 采样间隔
-            time.sleep(interval)
-        end_time = time.time()
-        total_duration = end_time - start_time
-        if not upload_speeds or not download_speeds:
+        sampler = self._bandwidth_sampler
+        if not sampler:
             return None, None
-        avg_upload_speed = sum(upload_speeds) / len(upload_speeds) if upload_speeds else 0
-        avg_download_speed = sum(download_speeds) / len(download_speeds) if download_speeds else 0
+        if not sampler.running:
+            sampler.start()
+
+        window = self.__get_bandwidth_sample_window()
+        avg_upload_speed, avg_download_speed = sampler.mean(window=window)
+        if avg_upload_speed is None or avg_download_speed is None:
+            for index in range(self._bandwidth_sample_burst):
+                if index:
+                    time.sleep(1)
+                sampler.sample()
+            avg_upload_speed, avg_download_speed = sampler.mean(window=window)
+        if avg_upload_speed is None or avg_download_speed is None:
+            return None, None
+
         logger.debug(f"平均上传带宽 {StringUtils.str_filesize(avg_upload_speed)}, "
                      f"平均下载带宽 {StringUtils.str_filesize(avg_download_speed)}, "
-                     f"采样次数={sample_count}, 时长={total_duration:.2f} 秒")
+                     f"采样窗口={window}, 采样间隔={self._bandwidth_sample_interval} 秒")
         return avg_upload_speed, avg_download_speed
 
-    def __get_downloader_info(self) -> schemas.DownloaderInfo:
+    def __get_bandwidth_sample_window(self) -> int:
         """
-        获取下载器实时信息（所有下载器）
+        根据配置的带宽统计窗口（秒）计算参与平均的采样次数
         """
-        ret_info = schemas.DownloaderInfo()
+        window_seconds = self.__get_brush_config().bandwidth_window or self._bandwidth_window_default
+        return max(int(round(float(window_seconds) / self._bandwidth_sample_interval)), 1)
 
-        downloader = self.downloader
-        if not downloader:
-            return ret_info
+    def __is_bandwidth_sampling_active(self) -> bool:
+        """
+        仅在刷流服务开启且处于开启时间段内时后台采样带宽
+        """
+        return bool(self._task_brush_enable and self.__is_current_time_in_range())
 
+    def __sample_bandwidth(self) -> Optional[Tuple[float, float]]:
+        """
+        采样下载器实时上传和下载带宽（所有下载器），后台线程中不检查下载器连接状态，避免重复发送错误通知
+        """
         transfer_infos = self.chain.run_module("downloader_info")
-        if transfer_infos:
-            for transfer_info in transfer_infos:
-                ret_info.download_speed += transfer_info.download_speed
-                ret_info.upload_speed += transfer_info.upload_speed
-                ret_info.download_size += transfer_info.download_size
-                ret_info.upload_size += transfer_info.upload_size
+        if not transfer_infos:
+            return None
+        upload_speed = sum(transfer_info.upload_speed or 0 for transfer_info in transfer_infos)
+        download_speed = sum(transfer_info.download_speed or 0 for transfer_info in transfer_infos)
+        return upload_speed, download_speed
+
+    def __sync_downloading_count(self):
+        """
+        从下载器同步下载中任务数
+        """
+        self._downloading_count = self.__get_downloading_count()
+        self._downloading_added_count = 0
+
+    def __get_local_downloading_count(self) -> int:
+        """
+        获取本地记录的下载中任务数，未同步时从下载器获取
+        """
+        if self._downloading_count is None:
+            self.__sync_downloading_count()
+        return self._downloading_count
 
-        return ret_info
+    def __increase_downloading_count(self):
+        """
+        新增下载任务后本地累加下载中任务数，累计达到阈值后与下载器重新同步
+        """
+        self._downloading_count = self.__get_local_downloading_count() + 1
+        self._downloading_added_count += 1
+        if self._downloading_added_count >= self._downloading_sync_threshold:
+            self.__sync_downloading_count()
 
     def __get_downloading_count(self) -> int:
         """
@@ -3739,16 +6173,41 @@ class BrushFlowLowFreq(_PluginBase):
         """
         将字符串转换为时间，并计算与当前时间差）（分钟）
         """
+        if not pubdate:
+            return 0
+        pubdate_timestamp = BrushFlowLowFreq.__get_pubdate_timestamp(pubdate)
+        if pubdate_timestamp is None:
+            return 0
+        return (time.time() - pubdate_timestamp) // 60
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def __get_pubdate_timestamp(pubdate: str) -> Optional[float]:
+        """
+        将发布时间字符串解析为时间戳，解析结果会被缓存，同一发布时间只解析一次
+        """
         try:
-            if not pubdate:
-                return 0
-            pubdate = pubdate.replace("T", " ").replace("Z", "")
-            pubdate = datetime.strptime(pubdate, "%Y-%m-%d %H:%M:%S")
-            now = datetime.now()
-            return (now - pubdate).total_seconds() // 60
+            return datetime.strptime(pubdate.replace("T", " ").replace("Z", ""), "%Y-%m-%d %H:%M:%S").timestamp()
         except Exception as e:
             logger.error(f"发布时间 {pubdate} 获取分钟失败，错误详情: {e}")
-            return 0
+            return None
+
+    def __iterate_torrents_within_pubtime(self, torrents: List[TorrentInfo],
+                                          brush_config: BrushConfig) -> Iterator[TorrentInfo]:
+        """
+        按发布时间降序遍历种子，当配置了发布时间上限且遇到超出上限的种子时，后续有发布时间的种子必然更早，直接提前结束，
+        没有发布时间的种子（排在最后）不受发布时间条件限制，仍然继续遍历
+        """
+        pubtime_upper = brush_config.pubtime_range.upper if brush_config.pubtime_range else None
+        for index, torrent in enumerate(torrents):
+            if pubtime_upper is not None and torrent.pubdate \
+                    and self.__get_pubminutes(torrent.pubdate) > pubtime_upper:
+                remaining_torrents = [t for t in torrents[index + 1:] if not t.pubdate]
+                logger.info(f"种子发布时间已超过 {pubtime_upper:.0f} 分钟，"
+                            f"提前结束剩余 {len(torrents) - index - len(remaining_torrents)} 个种子的评估")
+                yield from remaining_torrents
+                return
+            yield torrent
 
     @staticmethod
     def __adjust_site_pubminutes(pub_minutes: float, torrent: TorrentInfo) -> float:
@@ -3776,7 +6235,8 @@ class BrushFlowLowFreq(_PluginBase):
             logger.error(str(e))
             return 0
 
-    def __filter_torrents_by_tag(self, torrents: List[Any], exclude_tag: str) -> List[Any]:
+    @staticmethod
+    def __filter_torrents_by_tag(torrents: List[TorrentSnapshot], exclude_tag: str) -> List[TorrentSnapshot]:
         """
         根据标签过滤torrents，排除标签格式为逗号分隔的字符串，例如 "MOVIEPILOT, H&R"
         """
@@ -3789,16 +6249,17 @@ class BrushFlowLowFreq(_PluginBase):
 
         filter_torrents = []
         for torrent in torrents:
-            # 使用 __get_label 方法获取每个 torrent 的标签列表
-            labels = self.__get_label(torrent)
+            # 使用快照中的标签列表
+            labels = torrent.labels
             # 检查是否有任何一个排除标签存在于标签列表中
-            if not any(exclude in labels for exclude in exclude_tags):
+            if exclude_tags.isdisjoint(labels):
                 filter_torrents.append(torrent)
         return filter_torrents
 
     def __get_subscribe_titles(self) -> Set[str]:
         """
         获取当前订阅的所有标题，返回一个不包含None和空白字符的集合
+        识别结果持久化缓存，识别失败的订阅按退避时间重试，新增订阅并发识别
         """
         brush_config = self.__get_brush_config()
         if not brush_config.except_subscribe:
@@ -3807,53 +6268,134 @@ class BrushFlowLowFreq(_PluginBase):
 
         logger.info("已开启排除订阅，正在准备订阅标题匹配 ...")
 
-        if not self._subscribe_infos:
-            self._subscribe_infos = {}
+        if self._subscribe_infos is None:
+            self._subscribe_infos = self.get_data("subscribes") or {}
 
-        subscribes = self.subscribe_oper.list()
-        if subscribes:
-            # 遍历订阅
-            for subscribe in subscribes:
-                # 判断当前订阅是否已经在缓存中，如果已经处理过，那么这里直接跳过
-                subscribe_key = f"{subscribe.id}_{subscribe.name}"
-                if subscribe_key in self._subscribe_infos:
-                    continue
+        subscribes = self.subscribe_oper.list() or []
+        subscribe_map = {f"{subscribe.id}_{subscribe.name}": subscribe for subscribe in subscribes}
 
-                subscribe_titles = [subscribe.name]
-                try:
-                    # 生成元数据
-                    meta = MetaInfo(subscribe.name)
-                    meta.year = subscribe.year
-                    meta.begin_season = subscribe.season or None
-                    meta.type = MediaType(subscribe.type)
-                    # 识别媒体信息
-                    mediainfo: MediaInfo = self.chain.recognize_media(meta=meta, mtype=meta.type,
-                                                                      tmdbid=subscribe.tmdbid,
-                                                                      doubanid=subscribe.doubanid,
-                                                                      cache=True)
-                    if mediainfo:
-                        logger.info(f"订阅 {subscribe.name} 已识别到媒体信息")
-                        logger.debug(f"subscribe {subscribe.name} {mediainfo.to_dict()}")
-                        subscribe_titles.extend(mediainfo.names)
-                        subscribe_titles = [title.strip() for title in subscribe_titles if title and title.strip()]
-                        self._subscribe_infos[subscribe_key] = subscribe_titles
-                    else:
-                        logger.info(f"订阅 {subscribe.name} 没有识别到媒体信息，跳过订阅标题匹配")
-                except Exception as e:
-                    logger.error(f"识别订阅 {subscribe.name} 媒体信息失败，错误详情: {e}")
+        # 收集之前周期识别超时但已完成的识别结果
+        self.__collect_subscribe_recognitions()
+
+        # 移除不再存在的订阅
+        for key in set(self._subscribe_infos) - set(subscribe_map):
+            del self._subscribe_infos[key]
 
-            # 移除不再存在的订阅
-            current_keys = {f"{subscribe.id}_{subscribe.name}" for subscribe in subscribes}
-            for key in set(self._subscribe_infos) - current_keys:
-                del self._subscribe_infos[key]
+        # 仅识别新增、缓存过期以及到达重试时间的订阅，仍在识别中的订阅不重复提交
+        now = time.time()
+        pending_subscribes = {key: subscribe for key, subscribe in subscribe_map.items()
+                              if key not in self._subscribe_recognizing
+                              and self.__is_subscribe_info_expired(self._subscribe_infos.get(key), now)}
+        if pending_subscribes:
+            self.__recognize_subscribes(pending_subscribes=pending_subscribes)
+
+        self.save_data("subscribes", self._subscribe_infos)
 
         logger.info("订阅标题匹配完成")
         logger.debug(f"当前订阅的标题集合为：{self._subscribe_infos}")
-        unique_titles = {title for titles in self._subscribe_infos.values() for title in titles}
+        unique_titles = {title for info in self._subscribe_infos.values() for title in info.get("titles") or []}
         return unique_titles
 
+    def __is_subscribe_info_expired(self, subscribe_info: Optional[dict], now: float) -> bool:
+        """
+        判断订阅识别缓存是否需要重新识别
+        """
+        if not subscribe_info:
+            return True
+        if subscribe_info.get("failures"):
+            return now >= (subscribe_info.get("retry_time") or 0)
+        return now - (subscribe_info.get("time") or 0) > self._subscribe_cache_ttl
+
+    def __recognize_subscribes(self, pending_subscribes: Dict[str, Any]):
+        """
+        并发识别订阅媒体信息并更新缓存，识别失败时按指数退避设置下次重试时间
+        """
+        logger.info(f"正在识别订阅媒体信息，订阅数 {len(pending_subscribes)}")
+        executor = ThreadPoolExecutor(max_workers=min(self._subscribe_recognize_workers, len(pending_subscribes)),
+                                      thread_name_prefix="BrushFlowLowFreqSubscribe")
+        try:
+            futures = {executor.submit(self.__recognize_subscribe, subscribe): key
+                       for key, subscribe in pending_subscribes.items()}
+            done, not_done = wait(futures, timeout=self._subscribe_recognize_timeout)
+            for future in done:
+                self.__update_subscribe_info(key=futures[future], subscribe_titles=future.result())
+            for future in not_done:
+                key = futures[future]
+                # 尚未开始的识别直接取消，已开始的识别无法中断，记录后等待完成，避免下个周期重复提交
+                if future.cancel():
+                    logger.warning(f"订阅 {pending_subscribes[key].name} 识别媒体信息超时，将在下个周期重试")
+                else:
+                    self._subscribe_recognizing[key] = future
+                    logger.warning(f"订阅 {pending_subscribes[key].name} 识别媒体信息超时，将在识别完成后更新")
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def __collect_subscribe_recognitions(self):
+        """
+        收集识别超时后在后台完成的订阅识别结果，仍未完成的继续等待
+        """
+        if self._subscribe_recognizing is None:
+            self._subscribe_recognizing = {}
+        for key, future in list(self._subscribe_recognizing.items()):
+            if not future.done():
+                continue
+            del self._subscribe_recognizing[key]
+            if not future.cancelled():
+                self.__update_subscribe_info(key=key, subscribe_titles=future.result())
+
+    def __update_subscribe_info(self, key: str, subscribe_titles: Optional[List[str]]):
+        """
+        更新订阅识别缓存，识别失败时按指数退避设置下次重试时间
+        """
+        now = time.time()
+        if subscribe_titles:
+            self._subscribe_infos[key] = {"titles": subscribe_titles, "time": now}
+            return
+        failures = (self._subscribe_infos.get(key) or {}).get("failures", 0) + 1
+        backoff = min(self._subscribe_retry_interval * 2 ** (failures - 1), self._subscribe_cache_ttl)
+        self._subscribe_infos[key] = {"titles": [], "time": now, "failures": failures,
+                                      "retry_time": now + backoff}
+
+    def __recognize_subscribe(self, subscribe: Any) -> Optional[List[str]]:
+        """
+        识别订阅媒体信息，返回订阅的所有标题，识别失败时返回None
+        """
+        subscribe_titles = [subscribe.name]
+        try:
+            # 生成元数据
+            meta = MetaInfo(subscribe.name)
+            meta.year = subscribe.year
+            meta.begin_season = subscribe.season or None
+            meta.type = MediaType(subscribe.type)
+            # 识别媒体信息
+            mediainfo: MediaInfo = self.chain.recognize_media(meta=meta, mtype=meta.type,
+                                                              tmdbid=subscribe.tmdbid,
+                                                              doubanid=subscribe.doubanid,
+                                                              cache=True)
+            if mediainfo:
+                logger.info(f"订阅 {subscribe.name} 已识别到媒体信息")
+                logger.debug(f"subscribe {subscribe.name} {mediainfo.to_dict()}")
+                subscribe_titles.extend(mediainfo.names)
+                return [title.strip() for title in subscribe_titles if title and title.strip()]
+            else:
+                logger.info(f"订阅 {subscribe.name} 没有识别到媒体信息，跳过订阅标题匹配")
+        except Exception as e:
+            logger.error(f"识别订阅 {subscribe.name} 媒体信息失败，错误详情: {e}")
+        return None
+
+    def __get_subscribe_matcher(self, subscribe_titles: Set[str]) -> KeywordMatcher:
+        """
+        获取订阅标题匹配器，仅在订阅标题集合变化时重新构建
+        """
+        # 与匹配器使用同样过滤后的标题集合比较，避免存在空标题时每个周期都重新构建
+        keywords = KeywordMatcher.normalize(subscribe_titles)
+        if self._subscribe_matcher is None or self._subscribe_matcher.keywords != keywords:
+            self._subscribe_matcher = KeywordMatcher(keywords=keywords)
+            logger.debug(f"订阅标题匹配器已重新构建，标题数 {len(self._subscribe_matcher.keywords)}")
+        return self._subscribe_matcher
+
     @staticmethod
-    def __filter_torrents_contains_subscribe(torrents: Any, subscribe_titles: Set[str]):
+    def __filter_torrents_contains_subscribe(torrents: Any, subscribe_matcher: KeywordMatcher):
         # 初始化两个列表，一个用于收集未被排除的种子，一个用于记录被排除的种子
         included_torrents = []
         excluded_torrents = []
@@ -3864,7 +6406,7 @@ class BrushFlowLowFreq(_PluginBase):
             title = torrent.title or ''
             description = torrent.description or ''
 
-            if any(subscribe_title in title or subscribe_title in description for subscribe_title in subscribe_titles):
+            if subscribe_matcher.search(title) or subscribe_matcher.search(description):
                 # 如果种子的标题或描述包含订阅标题中的任一项，则记录为被排除
                 excluded_torrents.append(torrent)
                 logger.info(f"命中订阅内容，排除种子：{title}|{description}")
@@ -3891,11 +6433,15 @@ class BrushFlowLowFreq(_PluginBase):
         return size_in_bytes / (1024 ** 3)
 
     @staticmethod
-    def __is_number_or_range(value):
+    def __is_valid_pattern(value) -> bool:
         """
-        检查字符串是否表示单个数字或数字范围（如'5', '5.5', '5-10' 或 '5.5-10.2'）
+        检查给定的值是否为有效的正则表达式
         """
-        return bool(re.match(r"^\d+(\.\d+)?(-\d+(\.\d+)?)?$", value))
+        try:
+            BrushConfig.compile_pattern(value)
+            return True
+        except (re.error, TypeError):
+            return False
 
     @staticmethod
     def __is_number(value):
@@ -3908,6 +6454,14 @@ class BrushFlowLowFreq(_PluginBase):
         except ValueError:
             return False
 
+    def __get_torrent_task_index(self, torrent_tasks: Dict[str, dict]) -> TorrentTaskIndex:
+        """
+        获取刷流任务去重索引，当索引与任务数据不一致时（如重启、清除数据、同步官方插件数据），重新构建
+        """
+        if not self._torrent_task_index or not self._torrent_task_index.is_synced(torrent_tasks=torrent_tasks):
+            self._torrent_task_index = TorrentTaskIndex(torrent_tasks=torrent_tasks)
+        return self._torrent_task_index
+
     @staticmethod
     def __calculate_seeding_torrents_size(torrent_tasks: Dict[str, dict]) -> float:
         """
@@ -3949,8 +6503,9 @@ class BrushFlowLowFreq(_PluginBase):
                 continue
 
         # 从原始字典中移除已删除的条目
+        task_index = self.__get_torrent_task_index(torrent_tasks=torrent_tasks)
         for key in keys_to_delete:
-            del torrent_tasks[key]
+            task_index.remove(torrent_hash=key, torrent_task=torrent_tasks.pop(key))
 
         self.save_data("archived", archived_tasks)
 
@@ -3963,6 +6518,8 @@ class BrushFlowLowFreq(_PluginBase):
         self.save_data("archived", {})
         self.save_data("unmanaged", {})
         self.save_data("statistic", {})
+        self.save_data("seen", {})
+        self._torrent_task_index = None
 
     def __get_statistic_info(self) -> Dict[str, int]:
         """
@@ -4047,6 +6604,8 @@ class BrushFlowLowFreq(_PluginBase):
         if not trackers:
             return 0, domain
 
+        indexer_index = self.__get_indexer_index()
+
         # 特定tracker到域名的映射
         tracker_mappings = {
             "chdbits.xyz": "ptchdbits.co",
@@ -4066,13 +6625,33 @@ class BrushFlowLowFreq(_PluginBase):
                 # 使用StringUtils工具类获取tracker的域名
                 domain = StringUtils.get_url_domain(tracker)
 
-            site_info = self.sites_helper.get_indexer(domain)
+            found, site_info = indexer_index.get_by_domain(domain)
+            if not found:
+                site_info = self.sites_helper.get_indexer(domain) or None
+                indexer_index.set_domain(domain, site_info)
             if site_info:
                 return site_info.get("id"), site_info.get("name")
 
         # 当找不到对应的站点信息时，返回一个默认值
         return 0, domain
 
+    def __get_indexer_index(self, refresh: bool = False) -> IndexerIndex:
+        """
+        获取站点索引器索引，周期内复用，新增或修改的站点在下个周期生效
+
+        :param refresh: 是否重新构建，周期外的调用（如配置页面）需要获取最新的站点
+        """
+        if refresh or not self._indexer_index:
+            self._indexer_index = IndexerIndex(indexers=self.sites_helper.get_indexers())
+        return self._indexer_index
+
+    @eventmanager.register(EventType.SiteDeleted)
+    def site_deleted(self, event: Event):
+        """
+        删除站点后使站点索引器索引失效
+        """
+        self._indexer_index = None
+
     def __sync_official(self, config: dict):
         """
         双向同步官方插件数据
@@ -4104,6 +6683,7 @@ class BrushFlowLowFreq(_PluginBase):
             self.save_data("torrents", merged_torrents, "BrushFlow")
             self.save_data("archived", merged_archived, "BrushFlow")
             self.save_data("unmanaged", merged_unmanaged, "BrushFlow")
+            self._torrent_task_index = None
 
     def __check_and_resolve_plugin_conflict(self) -> bool:
         """